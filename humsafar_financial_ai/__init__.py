@@ -10,7 +10,30 @@ __author__ = "Akshay Kumar Bedre"
 __email__ = "your.email@example.com"
 
 from .finance_calculators import *
+from .finance_amortization import ScheduleRow, amortization_schedule, amortization_table, loan_tenure_months
+from .finance_debt import (
+    PAYOFF_STRATEGIES,
+    Debt,
+    compare_payoff_strategies,
+    credit_report_payoff_plan,
+    debt_payoff_plan,
+    debts_from_credit_report
+)
+from .finance_xirr import xirr
+from .finance_batch import BATCH_BACKENDS, EMI_CALCULATOR_TERMS, batch_emi_calculator
 from .fi_mcp_data_access import *
+from .fi_mcp_snapshot import SnapshotDataAccess, compile_snapshot
+from .fi_mcp_async import AsyncFIMCPDataAccess
+from .fi_mcp_transactions import BankTransactionTable
+from .fi_mcp_decoders import JSON_DECODERS, benchmark_decoders, get_json_decoder
+from .fi_mcp_sqlite import SQLiteDataAccess, ingest_sqlite
+from .fi_mcp_money import Money, paise_array, total_paise
+from .fi_mcp_summary import filter_summaries, summarize_profile
+from .fi_mcp_layout import DataLayout, migrate_layout
+from .fi_mcp_remote import RemoteDataAccess, benchmark_remote, start_stand_in_server
+from .fi_mcp_cohort import CohortTable, build_cohort_table, cohort_metrics
+from .fi_mcp_schema import SchemaError, validate_payload
+from .fi_mcp_xirr import mutual_fund_xirr, mutual_fund_xirr_for_users, user_mutual_fund_xirr
 
 __all__ = [
     # Finance Calculators
@@ -19,6 +42,7 @@ __all__ = [
     "mutual_fund_goal_calculator",
     "rent_vs_buy_calculator",
     "mutual_fund_sip_calculator",
+    "step_up_contributions",
     "ppf_calculator",
     "nps_calculator",
     "hra_calculator",
@@ -46,15 +70,101 @@ __all__ = [
     "asset_allocation_rebalancer",
     "capital_gains_tax_calculator",
     
+    # Loan Amortization
+    "amortization_schedule",
+    "amortization_table",
+    "loan_tenure_months",
+    "ScheduleRow",
+    
+    # Debt Payoff Planning
+    "debt_payoff_plan",
+    "compare_payoff_strategies",
+    "credit_report_payoff_plan",
+    "debts_from_credit_report",
+    "Debt",
+    "PAYOFF_STRATEGIES",
+    
+    # XIRR
+    "xirr",
+    
+    # Batch Loan Pricing
+    "batch_emi_calculator",
+    "BATCH_BACKENDS",
+    "EMI_CALCULATOR_TERMS",
+    
     # FI-MCP Data Access
     "FIMCPDataAccess",
     "get_net_worth",
     "get_bank_transactions",
+    "iter_bank_transactions",
     "get_mutual_fund_transactions",
+    "iter_mf_transactions",
     "get_stock_transactions",
     "get_epf_details",
     "get_credit_report",
+    "get_view",
+    "get_raw",
+    "query_bank_transactions",
+    "query_mf_transactions",
+    "query_stock_transactions",
     "get_complete_profile",
+    "get_profiles",
     "analyze_user_financial_health",
-    "get_available_users"
+    "get_available_users",
+    "iter_available_users",
+    "get_data_access",
+    "reset_data_access",
+    
+    # FI-MCP Snapshot Backend
+    "SnapshotDataAccess",
+    "compile_snapshot",
+    
+    # FI-MCP Async Access
+    "AsyncFIMCPDataAccess",
+    
+    # FI-MCP Transaction Analytics
+    "BankTransactionTable",
+    
+    # FI-MCP JSON Decoders
+    "JSON_DECODERS",
+    "get_json_decoder",
+    "benchmark_decoders",
+    
+    # FI-MCP SQLite Backend
+    "SQLiteDataAccess",
+    "ingest_sqlite",
+    
+    # FI-MCP Money Values
+    "Money",
+    "paise_array",
+    "total_paise",
+    
+    # FI-MCP User Summaries
+    "get_user_summary",
+    "get_user_summaries",
+    "filter_summaries",
+    "summarize_profile",
+    
+    # FI-MCP Data Directory Layouts
+    "DataLayout",
+    "migrate_layout",
+    
+    # FI-MCP Remote Backend
+    "RemoteDataAccess",
+    "start_stand_in_server",
+    "benchmark_remote",
+    
+    # FI-MCP Cohort Analytics
+    "CohortTable",
+    "build_cohort_table",
+    "cohort_metrics",
+    
+    # FI-MCP Payload Schemas
+    "SchemaError",
+    "validate_payload",
+    
+    # FI-MCP Mutual Fund XIRR
+    "mutual_fund_xirr",
+    "user_mutual_fund_xirr",
+    "mutual_fund_xirr_for_users"
 ]
\ No newline at end of file
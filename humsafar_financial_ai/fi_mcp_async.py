@@ -0,0 +1,117 @@
+"""
+Asyncio FI-MCP Data Access for Humsafar Financial AI Assistant
+
+Async counterpart of FIMCPDataAccess for asyncio-based MCP servers. Every
+getter is a coroutine that runs the blocking file read and JSON decoding in
+an executor, so a slow disk never stalls the event loop. Complete
+profiles gather their six data types concurrently, unless the backend
+batches them itself (the remote backend sends one request per profile).
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .fi_mcp_data_access import PROFILE_DATA_TYPES, FIMCPDataAccess, _profile_fields, get_data_access
+
+
+class AsyncFIMCPDataAccess:
+    """
+    Asyncio wrapper around a FIMCPDataAccess backend.
+    
+    Blocking work is delegated to an executor (the loop's default thread
+    pool unless one is given). By default the process-wide shared accessor
+    for data_dir is used, so async and sync callers share one warm cache.
+    """
+    
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        accessor: Optional[FIMCPDataAccess] = None,
+        executor: Optional[Executor] = None
+    ):
+        """
+        Initialize the async FI-MCP data access layer.
+        
+        Args:
+            data_dir: Path to the test data directory. If None, uses default path.
+            accessor: Backend to wrap (e.g. a SnapshotDataAccess). Overrides data_dir.
+            executor: Executor for blocking work. If None, uses the loop default.
+        """
+        self.accessor = accessor if accessor is not None else get_data_access(data_dir)
+        self.executor = executor
+    
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking accessor call in the executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+    
+    async def get_available_users(self) -> List[str]:
+        """Get list of all available user personas (phone numbers)."""
+        return await self._run(self.accessor.get_available_users)
+    
+    async def get_net_worth(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """📊 Fetch net worth and asset breakdown for a user."""
+        return await self._run(self.accessor.get_net_worth, phone_number)
+    
+    async def get_bank_transactions(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """🏦 Fetch bank transactions for a user."""
+        return await self._run(self.accessor.get_bank_transactions, phone_number)
+    
+    async def get_mutual_fund_transactions(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """📈 Fetch mutual fund transactions for a user."""
+        return await self._run(self.accessor.get_mutual_fund_transactions, phone_number)
+    
+    async def get_stock_transactions(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """📊 Fetch stock transactions for a user."""
+        return await self._run(self.accessor.get_stock_transactions, phone_number)
+    
+    async def get_epf_details(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """🏛️ Fetch EPF (Employee Provident Fund) details for a user."""
+        return await self._run(self.accessor.get_epf_details, phone_number)
+    
+    async def get_credit_report(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """💳 Fetch credit report and score for a user."""
+        return await self._run(self.accessor.get_credit_report, phone_number)
+    
+    async def get_raw(self, phone_number: str, data_type: str) -> Optional[Union[bytes, memoryview]]:
+        """📄 Fetch a user's payload as raw JSON bytes."""
+        return await self._run(self.accessor.get_raw, phone_number, data_type)
+    
+    async def get_complete_profile(
+        self,
+        phone_number: str,
+        data_types: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        📋 Fetch complete financial profile for a user.
+        
+        The requested data types are loaded concurrently. Backends that
+        batch profile loads (override _load_profile, like the remote
+        backend) get a single call instead.
+        
+        Args:
+            phone_number: User identifier
+            data_types: Profile fields to load. If None, loads all six.
+        
+        Returns:
+            Dict containing all available financial data for the user
+        """
+        fields = _profile_fields(data_types)
+        if type(self.accessor)._load_profile is not FIMCPDataAccess._load_profile:
+            return await self._run(self.accessor._load_profile, phone_number, fields)
+        results = await asyncio.gather(*(
+            self._run(self.accessor._load_data, phone_number, PROFILE_DATA_TYPES[field])
+            for field in fields
+        ))
+        profile: Dict[str, Any] = {"user_id": phone_number}
+        profile.update(zip(fields, results))
+        return profile
+    
+    async def get_user_persona_description(self, phone_number: str) -> str:
+        """📝 Get description of user persona based on phone number."""
+        return self.accessor.get_user_persona_description(phone_number)
+    
+    async def analyze_user_financial_health(self, phone_number: str) -> Dict[str, Any]:
+        """🔍 Analyze user's financial health based on all available data."""
+        return await self._run(self.accessor.analyze_user_financial_health, phone_number)
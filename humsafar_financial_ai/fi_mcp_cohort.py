@@ -0,0 +1,271 @@
+"""
+Cohort Analytics for FI-MCP Data
+
+Benchmarks users against their peers. build_cohort_table scans every user
+once (optionally on a worker pool), extracts a handful of comparable
+metrics per user and keeps a sorted column per metric, so distributions
+are precomputed and "how does this user compare" is a binary search.
+
+Metrics:
+    net_worth      total net worth in rupees
+    credit_score   bureau score
+    savings_rate   (inflows - outflows) / inflows of the bank accounts, in percent
+    mf_xirr        current-value weighted XIRR of the mutual fund schemes, in percent
+    epf_balance    current EPF balance in rupees
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from .fi_mcp_data_access import FIMCPDataAccess, get_data_access
+from .fi_mcp_schema import (
+    BankTransactionsView,
+    CreditReportView,
+    EPFView,
+    NetWorthView,
+    SchemaError,
+    validate_payload
+)
+from .fi_mcp_transactions import INFLOW_TYPES, OUTFLOW_TYPES
+
+
+COHORT_METRICS = ("net_worth", "credit_score", "savings_rate", "mf_xirr", "epf_balance")
+
+# Profile fields the metrics are computed from
+COHORT_DATA_TYPES = ("net_worth", "bank_transactions", "epf_details", "credit_report")
+
+DEFAULT_PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _net_worth(net_worth: NetWorthView) -> Optional[float]:
+    """Total net worth in rupees; zero, not missing, without a total (as in the health analysis)."""
+    return (net_worth.total_paise or 0) / 100
+
+
+def _mf_xirr(net_worth: NetWorthView) -> Optional[float]:
+    """Current-value weighted XIRR of the mutual fund schemes."""
+    weighted = 0.0
+    total_value = 0
+    for scheme in net_worth.schemes:
+        if scheme.xirr is None or scheme.current_paise is None:
+            continue
+        weighted += scheme.xirr * scheme.current_paise
+        total_value += scheme.current_paise
+    return weighted / total_value if total_value > 0 else None
+
+
+def _credit_score(credit_report: CreditReportView) -> Optional[float]:
+    """Bureau score of the first credit report."""
+    return credit_report.score
+
+
+def _savings_rate(bank_transactions: BankTransactionsView) -> Optional[float]:
+    """Share of bank inflows not spent, in percent."""
+    inflow = 0
+    outflow = 0
+    for account in bank_transactions.accounts:
+        for txn in account.txns:
+            if txn.type in INFLOW_TYPES:
+                inflow += txn.amount_paise
+            elif txn.type in OUTFLOW_TYPES:
+                outflow += txn.amount_paise
+    return (inflow - outflow) / inflow * 100 if inflow > 0 else None
+
+
+def _epf_balance(epf_details: EPFView) -> Optional[float]:
+    """Current EPF balance over all UAN accounts in rupees."""
+    balance = epf_details.balance_paise
+    return balance / 100 if balance is not None else None
+
+
+_EXTRACTORS = (
+    ("net_worth", "net_worth", _net_worth),
+    ("credit_score", "credit_report", _credit_score),
+    ("savings_rate", "bank_transactions", _savings_rate),
+    ("mf_xirr", "net_worth", _mf_xirr),
+    ("epf_balance", "epf_details", _epf_balance)
+)
+
+
+def cohort_metrics(profile: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """
+    📏 Extract the cohort metrics from a (partial) complete profile.
+    
+    Each payload is validated once into its typed view; malformed payloads
+    leave their metrics empty.
+    
+    Args:
+        profile: Profile with at least the COHORT_DATA_TYPES fields
+    
+    Returns:
+        Dict mapping each of COHORT_METRICS to its value, or None when the
+        user has no (valid) data for it
+    """
+    views: Dict[str, Any] = {}
+    for field in COHORT_DATA_TYPES:
+        payload = profile.get(field)
+        try:
+            views[field] = validate_payload(field, payload) if payload else None
+        except SchemaError:
+            views[field] = None
+    
+    return {
+        metric: extract(views[field]) if views[field] is not None else None
+        for metric, field, extract in _EXTRACTORS
+    }
+
+
+class CohortTable:
+    """
+    📊 Precomputed cohort distributions.
+    
+    Holds every user's metrics plus one sorted column per metric, so
+    percentiles, distributions and per-user comparisons are lookups.
+    """
+    
+    def __init__(self, rows: Dict[str, Dict[str, Optional[float]]]):
+        """
+        Build the table from per-user metrics.
+        
+        Args:
+            rows: Dict mapping phone number to its cohort_metrics
+        """
+        self.rows = rows
+        self._columns: Dict[str, array] = {
+            metric: array("d", sorted(
+                row[metric] for row in rows.values() if row.get(metric) is not None
+            ))
+            for metric in COHORT_METRICS
+        }
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def _column(self, metric: str) -> array:
+        if metric not in self._columns:
+            raise ValueError(f"Unknown cohort metric: {metric}")
+        return self._columns[metric]
+    
+    def percentile(self, metric: str, q: float) -> Optional[float]:
+        """
+        Get a percentile of a metric (linear interpolation between ranks).
+        
+        Args:
+            metric: One of COHORT_METRICS
+            q: Percentile between 0 and 100
+        
+        Returns:
+            The percentile value, or None if no user has the metric
+        """
+        column = self._column(metric)
+        if not column:
+            return None
+        position = (len(column) - 1) * min(max(q, 0), 100) / 100
+        lower = int(position)
+        upper = min(lower + 1, len(column) - 1)
+        return column[lower] + (column[upper] - column[lower]) * (position - lower)
+    
+    def percentile_rank(self, metric: str, value: float) -> Optional[float]:
+        """
+        Get the share of the cohort at or below a value, in percent (ties count half).
+        
+        Returns:
+            Percentile rank between 0 and 100, or None if no user has the metric
+        """
+        column = self._column(metric)
+        if not column:
+            return None
+        below = bisect_left(column, value)
+        at_or_below = bisect_right(column, value)
+        return (below + at_or_below) / 2 / len(column) * 100
+    
+    def distribution(self, metric: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """
+        Summarize the distribution of one metric.
+        
+        Returns:
+            Dict containing count, min, max, mean and p<q> for each percentile
+            (values are None when no user has the metric)
+        """
+        column = self._column(metric)
+        summary: Dict[str, Any] = {
+            "count": len(column),
+            "min": column[0] if column else None,
+            "max": column[-1] if column else None,
+            "mean": sum(column) / len(column) if column else None
+        }
+        for q in percentiles:
+            summary[f"p{q:g}"] = self.percentile(metric, q)
+        return summary
+    
+    def distributions(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Dict[str, Any]]:
+        """Summarize the distributions of all metrics."""
+        return {metric: self.distribution(metric, percentiles) for metric in COHORT_METRICS}
+    
+    def compare(self, phone_number: str) -> Optional[Dict[str, Dict[str, Optional[float]]]]:
+        """
+        🔍 Compare a user with the cohort.
+        
+        Args:
+            phone_number: User identifier
+        
+        Returns:
+            Dict mapping each metric to its value, percentile rank and the
+            cohort median, or None if the user is not in the cohort
+        """
+        row = self.rows.get(phone_number)
+        if row is None:
+            return None
+        comparison: Dict[str, Dict[str, Optional[float]]] = {}
+        for metric in COHORT_METRICS:
+            value = row.get(metric)
+            comparison[metric] = {
+                "value": value,
+                "percentile_rank": self.percentile_rank(metric, value) if value is not None else None,
+                "median": self.percentile(metric, 50)
+            }
+        return comparison
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the table (per-user metrics) to a JSON-compatible dict."""
+        return {"metrics": list(COHORT_METRICS), "rows": self.rows}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CohortTable":
+        """Rebuild a table saved with to_dict."""
+        return cls(data["rows"])
+
+
+def build_cohort_table(
+    data_dir: Optional[str] = None,
+    accessor: Optional[FIMCPDataAccess] = None,
+    phone_numbers: Optional[Iterable[str]] = None,
+    workers: int = 1,
+    use_processes: bool = False
+) -> CohortTable:
+    """
+    📊 Scan users once and build their cohort table.
+    
+    Only the data types the metrics need are loaded, streamed through
+    get_profiles so memory stays flat for large user bases.
+    
+    Args:
+        data_dir: Data directory to scan. If None, uses the bundled dummy data.
+        accessor: Backend to scan (e.g. a SnapshotDataAccess). Overrides data_dir.
+        phone_numbers: Users forming the cohort. If None, uses every available user.
+        workers: Number of pool workers loading profiles
+        use_processes: Decode on a process pool instead of threads
+    
+    Returns:
+        CohortTable over the scanned users
+    """
+    if accessor is None:
+        accessor = get_data_access(data_dir)
+    rows: Dict[str, Dict[str, Optional[float]]] = {}
+    profiles = accessor.get_profiles(
+        phone_numbers, data_types=COHORT_DATA_TYPES, workers=workers, use_processes=use_processes
+    )
+    for phone_number, profile in profiles:
+        rows[phone_number] = cohort_metrics(profile)
+    return CohortTable(dict(sorted(rows.items())))
@@ -9,11 +9,188 @@ The dummy data represents 25 different user personas with varying financial
 profiles, from debt-heavy users to high-net-worth individuals.
 """
 
-import json
+import io
 import os
-from typing import Dict, List, Optional, Union, Any
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, Any
 from pathlib import Path
 
+from .fi_mcp_decoders import JSONDecoder, get_json_decoder
+from .fi_mcp_layout import DataLayout
+from .fi_mcp_money import Money
+from .fi_mcp_schema import SchemaError, validate_payload
+from .fi_mcp_summary import summarize_profile
+from .fi_mcp_transactions import (
+    BankTransactionTable,
+    DateIndex,
+    DateLike,
+    bank_date_index,
+    iter_transaction_rows,
+    mf_date_index,
+    stock_date_index
+)
+
+
+class _LRUCache:
+    """
+    Size-bounded LRU cache for decoded FI-MCP payloads.
+    
+    Entries are keyed by (phone_number, data_type) and stored together with
+    the (mtime_ns, size) of the file they were decoded from, so a changed
+    file is detected and re-read instead of served stale.
+    """
+    
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple[str, str], signature: Tuple[int, int]) -> Tuple[bool, Any]:
+        """Return (found, value) for key if the cached signature still matches."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+    
+    def peek(self, key: Tuple[str, str]) -> Optional[Tuple[Any, Any]]:
+        """Return the stored (signature, value) for key without counting a lookup."""
+        with self._lock:
+            return self._entries.get(key)
+    
+    def put(self, key: Tuple[str, str], signature: Tuple[int, int], value: Any) -> None:
+        """Store value for key, evicting the least recently used entries."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (signature, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def discard(self, key: Tuple[str, str]) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+    
+    def info(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and current occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+
+class _SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result (or exception).
+    """
+    
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: Dict[Any, "_InFlightCall"] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Any, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) once per key at a time and share its outcome."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _InFlightCall()
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class _InFlightCall:
+    """Outcome of one in-flight single-flight call."""
+    
+    __slots__ = ("done", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# Data files available per user, keyed by their get_complete_profile field
+PROFILE_DATA_TYPES: Dict[str, str] = {
+    "net_worth": "fetch_net_worth.json",
+    "bank_transactions": "fetch_bank_transactions.json",
+    "mutual_fund_transactions": "fetch_mf_transactions.json",
+    "stock_transactions": "fetch_stock_transactions.json",
+    "epf_details": "fetch_epf_details.json",
+    "credit_report": "fetch_credit_report.json"
+}
+
+DATA_TYPES: Tuple[str, ...] = tuple(PROFILE_DATA_TYPES.values())
+
+# Transaction fields -> (collection key, account label key), counted by streaming
+_TRANSACTION_COLLECTIONS: Dict[str, Tuple[str, str]] = {
+    "bank_transactions": ("bankTransactions", "bank"),
+    "mutual_fund_transactions": ("mfTransactions", "isin"),
+    "stock_transactions": ("stockTransactions", "isin")
+}
+
+
+def _resolve_data_dir(data_dir: Optional[str] = None) -> Path:
+    """Resolve a data directory argument, falling back to the bundled dummy data."""
+    if data_dir is None:
+        # Default path relative to this file
+        current_dir = Path(__file__).parent.parent
+        return current_dir / "FI money dummy data" / "test_data_dir"
+    return Path(data_dir)
+
+
+def _profile_fields(data_types: Optional[Sequence[str]]) -> List[str]:
+    """Validate requested profile fields, defaulting to all six data types."""
+    if data_types is None:
+        return list(PROFILE_DATA_TYPES)
+    fields = list(data_types)
+    unknown = [field for field in fields if field not in PROFILE_DATA_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown data types: {', '.join(unknown)}")
+    return fields
+
 
 class FIMCPDataAccess:
     """
@@ -21,26 +198,207 @@ class FIMCPDataAccess:
     
     Provides modular access to dummy financial data for AI agent integration.
     Data is organized by phone number (user persona) and data type.
+    
+    Decoded payloads are kept in an LRU cache validated against file
+    mtime/size, so repeated reads of the same user skip the disk and the
+    JSON decoder. Returned dicts are shared with the cache and should be
+    treated as read-only.
     """
     
-    def __init__(self, data_dir: Optional[str] = None):
+    def __init__(
+        self,
+        data_dir: Optional[str] = None,
+        cache_size: int = 128,
+        manifest_ttl: float = 1.0,
+        decoder: Union[str, JSONDecoder, None] = "stdlib",
+        layout: Optional[DataLayout] = None
+    ):
         """
         Initialize the FI-MCP data access layer.
         
         Args:
             data_dir: Path to the test data directory. If None, uses default path.
+            cache_size: Maximum number of decoded files kept in memory (0 disables caching)
+            manifest_ttl: Seconds between checks of the data directory mtime
+                for new or removed users (0 checks on every lookup)
+            decoder: JSON decoder name ("stdlib", "orjson", "ujson", "auto")
+                or a callable taking the raw file bytes
+            layout: Directory layout of data_dir. If None, uses the layout
+                recorded in data_dir (flat unless it was migrated).
         """
-        if data_dir is None:
-            # Default path relative to this file
-            current_dir = Path(__file__).parent.parent
-            self.data_dir = current_dir / "FI money dummy data" / "test_data_dir"
-        else:
-            self.data_dir = Path(data_dir)
+        self.data_dir = _resolve_data_dir(data_dir)
+        self.layout = layout if layout is not None else DataLayout.load(self.data_dir)
+        self._decoder = decoder
+        self._decode = get_json_decoder(decoder)
+        self._cache = _LRUCache(cache_size)
+        self._derived = _LRUCache(cache_size)
+        self._raw_cache = _LRUCache(cache_size)
+        self._user_files_cache = _LRUCache(cache_size)
+        self._summaries: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        self._summaries_lock = threading.Lock()
+        self._inflight = _SingleFlight()
+        self.manifest_ttl = manifest_ttl
+        self._manifest: Optional[Dict[str, FrozenSet[str]]] = None
+        self._manifest_mtime: Optional[int] = None
+        self._manifest_checked = 0.0
+        self._manifest_lock = threading.Lock()
+    
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Get statistics for the decoded-data cache.
+        
+        Returns:
+            Dict containing hits, misses, evictions, size and maxsize, plus
+            coalesced: loads that shared another caller's in-flight load
+        """
+        info = self._cache.info()
+        info["coalesced"] = self._inflight.coalesced
+        return info
+    
+    def clear_cache(self) -> None:
+        """Drop all cached payloads and summaries and reset the cache counters."""
+        self._cache.clear()
+        self._derived.clear()
+        self._raw_cache.clear()
+        with self._summaries_lock:
+            self._summaries.clear()
+    
+    def _derived_view(
+        self,
+        phone_number: str,
+        data_type: str,
+        name: str,
+        builder: Callable[[Dict[str, Any]], Any]
+    ) -> Any:
+        """
+        Build (once) a structure derived from a user's payload.
+        
+        The result is cached alongside the payload it was built from and
+        rebuilt whenever _load_data returns a different payload object.
+        
+        Returns:
+            builder(payload), or None if the payload is not available
+        """
+        payload = self._load_data(phone_number, data_type)
+        if payload is None:
+            return None
+        key = (phone_number, name)
+        found, entry = self._derived.get(key, id(payload))
+        if found and entry[0] is payload:
+            return entry[1]
+        view = builder(payload)
+        self._derived.put(key, id(payload), (payload, view))
+        return view
+    
+    def _scan_manifest(self) -> Dict[str, FrozenSet[str]]:
+        """Scan data_dir for user directories and the files present in each."""
+        manifest: Dict[str, FrozenSet[str]] = {}
+        with os.scandir(self.data_dir) as users:
+            for user in users:
+                if not (user.name.isdigit() and user.is_dir()):
+                    continue
+                with os.scandir(user.path) as files:
+                    manifest[user.name] = frozenset(f.name for f in files if f.is_file())
+        return manifest
+    
+    def _get_manifest(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Get the in-memory manifest of users and their data files.
+        
+        The manifest is built once and rebuilt when the data directory mtime
+        changes; the mtime itself is checked at most every manifest_ttl seconds.
+        """
+        now = time.monotonic()
+        manifest = self._manifest
+        if manifest is not None and now - self._manifest_checked < self.manifest_ttl:
+            return manifest
+        with self._manifest_lock:
+            try:
+                mtime = os.stat(self.data_dir).st_mtime_ns
+            except OSError:
+                self._manifest, self._manifest_mtime = {}, None
+                self._manifest_checked = now
+                return self._manifest
+            if self._manifest is None or mtime != self._manifest_mtime:
+                self._manifest = self._scan_manifest()
+                self._manifest_mtime = mtime
+            self._manifest_checked = now
+            return self._manifest
+    
+    def refresh_manifest(self) -> None:
+        """
+        Force the user manifest and per-user file lists to be rebuilt on next use.
+        
+        Only needed where directory mtimes are unreliable (e.g. some network
+        file systems); changes are otherwise picked up automatically.
+        """
+        with self._manifest_lock:
+            self._manifest = None
+        self._user_files_cache.clear()
+    
+    def _user_dir(self, phone_number: str) -> Path:
+        """Directory holding a user's data files."""
+        return self.layout.user_dir(self.data_dir, phone_number)
+    
+    def _user_files(self, phone_number: str) -> Optional[FrozenSet[str]]:
+        """
+        Get the names of a user's data files without reading them.
+        
+        Flat layouts look users up in the manifest; sharded layouts never
+        scan the whole tree. Either way each user's own directory is listed
+        on demand and cached until its mtime changes, so files added to an
+        existing user (which leave the data_dir mtime alone) are seen at once.
+        
+        Returns:
+            Frozen set of file names, or None if the user does not exist
+        """
+        if not self.layout.sharded:
+            if phone_number not in self._get_manifest():
+                return None
+        elif not phone_number.isdigit():
+            return None
+        user_dir = self._user_dir(phone_number)
+        try:
+            signature = (os.stat(user_dir).st_mtime_ns,)
+        except OSError:
+            return None
+        key = (phone_number, "")
+        found, files = self._user_files_cache.get(key, signature)
+        if found:
+            return files
+        try:
+            with os.scandir(user_dir) as entries:
+                files = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            return None
+        self._user_files_cache.put(key, signature, files)
+        return files
+    
+    def _has_data(self, phone_number: str, data_type: str) -> bool:
+        """Check whether a user has a data file without reading it."""
+        return data_type in (self._user_files(phone_number) or ())
     
     def _load_data(self, phone_number: str, data_type: str) -> Optional[Dict[str, Any]]:
         """
         Load data for a specific user and data type.
         
+        Concurrent loads of the same (user, data type) are coalesced: one
+        caller reads and decodes the data, the others wait and share its
+        result, so a burst of requests for a hot user costs a single read.
+        
+        Args:
+            phone_number: User identifier (phone number)
+            data_type: Type of data to fetch (e.g., 'fetch_net_worth.json')
+            
+        Returns:
+            Dictionary containing the data or None if not found
+        """
+        return self._inflight.do((phone_number, data_type), self._read_data, phone_number, data_type)
+    
+    def _read_data(self, phone_number: str, data_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Read and decode one data file, through the payload cache.
+        
         Args:
             phone_number: User identifier (phone number)
             data_type: Type of data to fetch (e.g., 'fetch_net_worth.json')
@@ -48,14 +406,120 @@ class FIMCPDataAccess:
         Returns:
             Dictionary containing the data or None if not found
         """
+        if not self._has_data(phone_number, data_type):
+            return None
+        key = (phone_number, data_type)
+        try:
+            file_path = self._user_dir(phone_number) / data_type
+            stat = os.stat(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            found, data = self._cache.get(key, signature)
+            if found:
+                return data
+            with open(file_path, 'rb') as f:
+                data = self._decode(f.read())
+            self._cache.put(key, signature, data)
+            return data
+        except FileNotFoundError:
+            # Removed since the manifest was built
+            self._cache.discard(key)
+            self.refresh_manifest()
+            return None
+        except (ValueError, OSError):
+            # Invalid JSON or UTF-8 (every decoder raises a ValueError subclass)
+            self._cache.discard(key)
+            return None
+    
+    def _read_raw(self, phone_number: str, data_type: str) -> Optional[Union[bytes, memoryview]]:
+        """
+        Read one data file's bytes without decoding them, through the raw cache.
+        
+        Returns:
+            The file contents or None if not found
+        """
+        if not self._has_data(phone_number, data_type):
+            return None
+        key = (phone_number, data_type)
+        try:
+            file_path = self._user_dir(phone_number) / data_type
+            stat = os.stat(file_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            found, raw = self._raw_cache.get(key, signature)
+            if found:
+                return raw
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            self._raw_cache.put(key, signature, raw)
+            return raw
+        except FileNotFoundError:
+            self._raw_cache.discard(key)
+            self.refresh_manifest()
+            return None
+        except OSError:
+            self._raw_cache.discard(key)
+            return None
+    
+    def _open_stream(self, phone_number: str, data_type: str) -> Optional[BinaryIO]:
+        """
+        Open a user's data file as a binary stream without decoding it.
+        
+        Returns:
+            Binary file object (caller closes it) or None if not found
+        """
+        if not self._has_data(phone_number, data_type):
+            return None
         try:
-            file_path = self.data_dir / phone_number / data_type
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            return open(self._user_dir(phone_number) / data_type, 'rb')
+        except OSError:
             return None
-        except (json.JSONDecodeError, FileNotFoundError, OSError):
+    
+    def _worker_spec(self) -> Optional[Tuple[Callable[..., "FIMCPDataAccess"], Tuple[Any, ...], Dict[str, Any]]]:
+        """
+        Picklable recipe (factory, args, kwargs) that reopens this backend in a worker process.
+        
+        Backends override this to describe their own source; None means the
+        backend cannot be reopened and get_profiles refuses use_processes.
+        """
+        if type(self).__init__ is not FIMCPDataAccess.__init__:
             return None
+        return type(self), (str(self.data_dir),), {
+            "cache_size": self._cache.maxsize,
+            "manifest_ttl": self.manifest_ttl,
+            "decoder": self._decoder,
+            "layout": self.layout
+        }
+    
+    def _iter_rows(
+        self,
+        phone_number: str,
+        data_type: str,
+        collection_key: str,
+        label_key: str,
+        label: Optional[str]
+    ) -> Iterator[Tuple[Any, List[Any]]]:
+        """Stream (label, txn) pairs from a user's transactions file."""
+        raw = self._open_stream(phone_number, data_type)
+        if raw is None:
+            return
+        with io.TextIOWrapper(raw, encoding='utf-8') as text:
+            yield from iter_transaction_rows(text, collection_key, label_key, label)
+    
+    def iter_available_users(self) -> Iterator[str]:
+        """
+        Stream the phone numbers of all available user personas.
+        
+        Sharded layouts are walked one shard directory at a time, so
+        enumerating a very large user base never lists one huge directory
+        or holds every phone number in memory.
+        
+        Yields:
+            Phone numbers representing different user personas
+        """
+        if not self.layout.sharded:
+            yield from self._get_manifest()
+            return
+        for phone_number, _ in self.layout.iter_users(self.data_dir):
+            yield phone_number
     
     def get_available_users(self) -> List[str]:
         """
@@ -64,11 +528,7 @@ class FIMCPDataAccess:
         Returns:
             List of phone numbers representing different user personas
         """
-        if not self.data_dir.exists():
-            return []
-        
-        return [d.name for d in self.data_dir.iterdir() 
-                if d.is_dir() and d.name.isdigit()]
+        return list(self.iter_available_users())
     
     def get_net_worth(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """
@@ -116,6 +576,46 @@ class FIMCPDataAccess:
         """
         return self._load_data(phone_number, "fetch_bank_transactions.json")
     
+    def get_bank_transaction_table(self, phone_number: str) -> Optional[BankTransactionTable]:
+        """
+        🏦 Fetch bank transactions for a user as a columnar table.
+        
+        The table is built once per payload and reused until the underlying
+        file changes.
+        
+        Args:
+            phone_number: User identifier
+            
+        Returns:
+            BankTransactionTable with typed amount, date, type and mode columns,
+            or None if the user has no bank transaction file
+        """
+        return self._derived_view(phone_number, "fetch_bank_transactions.json",
+                                  "bank_transaction_table", BankTransactionTable.from_payload)
+    
+    def iter_bank_transactions(
+        self,
+        phone_number: str,
+        bank: Optional[str] = None
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        🏦 Stream bank transactions for a user without loading the whole file.
+        
+        Rows are parsed incrementally, so memory stays constant regardless of
+        the length of the history.
+        
+        Args:
+            phone_number: User identifier
+            bank: Only yield transactions of this bank (e.g. "HDFC Bank")
+            
+        Yields:
+            (bank, txn) tuples where txn is
+            [transactionAmount, transactionNarration, transactionDate,
+             transactionType, transactionMode, currentBalance]
+        """
+        return self._iter_rows(phone_number, "fetch_bank_transactions.json",
+                               "bankTransactions", "bank", bank)
+    
     def get_mutual_fund_transactions(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """
         📈 Fetch mutual fund transactions for a user.
@@ -140,6 +640,25 @@ class FIMCPDataAccess:
         """
         return self._load_data(phone_number, "fetch_mf_transactions.json")
     
+    def iter_mf_transactions(
+        self,
+        phone_number: str,
+        isin: Optional[str] = None
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """
+        📈 Stream mutual fund transactions for a user without loading the whole file.
+        
+        Args:
+            phone_number: User identifier
+            isin: Only yield transactions of this scheme ISIN
+            
+        Yields:
+            (isin, txn) tuples where txn is
+            [orderType, transactionDate, purchasePrice, purchaseUnits, transactionAmount]
+        """
+        return self._iter_rows(phone_number, "fetch_mf_transactions.json",
+                               "mfTransactions", "isin", isin)
+    
     def get_stock_transactions(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """
         📊 Fetch stock transactions for a user.
@@ -222,27 +741,284 @@ class FIMCPDataAccess:
         """
         return self._load_data(phone_number, "fetch_credit_report.json")
     
-    def get_complete_profile(self, phone_number: str) -> Dict[str, Any]:
+    def get_raw(self, phone_number: str, data_type: str) -> Optional[Union[bytes, memoryview]]:
+        """
+        📄 Fetch one of a user's payloads as raw JSON bytes, without decoding it.
+        
+        Meant for responses that pass a payload through unchanged: the bytes
+        can be written out directly instead of being decoded and re-encoded.
+        Files are cached as bytes until they change; snapshot backends
+        return a zero-copy memoryview of the mapped snapshot (release it
+        before closing the snapshot). The bytes are served as stored and
+        are not validated.
+        
+        Args:
+            phone_number: User identifier
+            data_type: Profile field (e.g. "net_worth", "credit_report")
+            
+        Returns:
+            The payload's JSON bytes (or a memoryview of them), or None if
+            the user has no such file
+            
+        Raises:
+            ValueError: If the data type is unknown
+        """
+        if data_type not in PROFILE_DATA_TYPES:
+            raise ValueError(f"Unknown data types: {data_type}")
+        return self._read_raw(phone_number, PROFILE_DATA_TYPES[data_type])
+    
+    def get_view(self, phone_number: str, data_type: str) -> Any:
+        """
+        ✅ Fetch a validated, typed view of one of a user's payloads.
+        
+        The payload is validated once per load and the view (or the schema
+        error) is cached alongside it, so a malformed file fails fast on
+        every read until it changes, without being re-checked.
+        
+        Args:
+            phone_number: User identifier
+            data_type: Profile field (e.g. "net_worth", "credit_report")
+            
+        Returns:
+            The payload's view (see fi_mcp_schema), or None if the user has
+            no such file
+            
+        Raises:
+            ValueError: If the data type is unknown
+            SchemaError: If the payload does not match its schema
+        """
+        if data_type not in PROFILE_DATA_TYPES:
+            raise ValueError(f"Unknown data types: {data_type}")
+        view = self._derived_view(phone_number, PROFILE_DATA_TYPES[data_type],
+                                  f"view:{data_type}", partial(_checked_view, data_type))
+        if isinstance(view, SchemaError):
+            raise view.with_traceback(None)
+        return view
+    
+    def query_bank_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        types: Optional[Iterable[int]] = None,
+        bank: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        🏦 Query a user's bank transactions by date range, type and amount.
+        
+        Uses a per-user date-sorted index built once, so a date range costs
+        O(log n + k) instead of a scan of the whole payload.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive (ISO string, date or ordinal)
+            end: Latest transaction date, inclusive
+            types: Transaction type codes to keep (1: CREDIT, 2: DEBIT, ... 6: INSTALLMENT)
+            bank: Only transactions of this bank
+            min_amount: Minimum amount in rupees, inclusive
+            max_amount: Maximum amount in rupees, inclusive
+            
+        Returns:
+            List of dicts (bank, date, amount, narration, type, mode, balance) in date order
+        """
+        indexed = self._derived_view(
+            phone_number, "fetch_bank_transactions.json", "bank_date_index",
+            lambda payload: self._build_bank_index(phone_number, payload)
+        )
+        if indexed is None:
+            return []
+        table, index = indexed
+        type_set = set(types) if types is not None else None
+        low = Money.from_rupees(min_amount).paise if min_amount is not None else None
+        high = Money.from_rupees(max_amount).paise if max_amount is not None else None
+        
+        results = []
+        for position in index.between(start, end):
+            if type_set is not None and table.types[position] not in type_set:
+                continue
+            if low is not None and table.amounts[position] < low:
+                continue
+            if high is not None and table.amounts[position] > high:
+                continue
+            if bank is not None and table.banks[table.bank_ids[position]] != bank:
+                continue
+            amount, narration, txn_date, txn_type, mode, balance, bank_name = table.row(position)
+            results.append({
+                "bank": bank_name,
+                "date": txn_date,
+                "amount": amount,
+                "narration": narration,
+                "type": txn_type,
+                "mode": mode,
+                "balance": balance
+            })
+        return results
+    
+    def _build_bank_index(self, phone_number: str, payload: Dict[str, Any]) -> Tuple[BankTransactionTable, DateIndex]:
+        """Build the bank date index on top of the user's cached columnar table."""
+        table = self.get_bank_transaction_table(phone_number)
+        if table is None:
+            table = BankTransactionTable.from_payload(payload)
+        return table, bank_date_index(table)
+    
+    def query_mf_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        order_types: Optional[Iterable[int]] = None,
+        isin: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        📈 Query a user's mutual fund transactions by date range, order type and ISIN.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive
+            end: Latest transaction date, inclusive
+            order_types: Order types to keep (1: BUY, 2: SELL)
+            isin: Only transactions of this scheme
+            
+        Returns:
+            List of dicts (isin, scheme_name, folio_id, date, order_type, price, units, amount)
+        """
+        index = self._derived_view(phone_number, "fetch_mf_transactions.json",
+                                   "mf_date_index", mf_date_index)
+        if index is None:
+            return []
+        type_set = set(order_types) if order_types is not None else None
+        return [
+            dict(row) for row in index.between(start, end)
+            if (type_set is None or row["order_type"] in type_set)
+            and (isin is None or row["isin"] == isin)
+        ]
+    
+    def query_stock_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        types: Optional[Iterable[int]] = None,
+        isin: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        📊 Query a user's stock transactions by date range, type and ISIN.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive
+            end: Latest transaction date, inclusive
+            types: Transaction types to keep (1: BUY, 2: SELL, 3: BONUS, 4: SPLIT)
+            isin: Only transactions of this stock
+            
+        Returns:
+            List of dicts (isin, date, type, quantity, nav)
+        """
+        index = self._derived_view(phone_number, "fetch_stock_transactions.json",
+                                   "stock_date_index", stock_date_index)
+        if index is None:
+            return []
+        type_set = set(types) if types is not None else None
+        return [
+            dict(row) for row in index.between(start, end)
+            if (type_set is None or row["type"] in type_set)
+            and (isin is None or row["isin"] == isin)
+        ]
+    
+    def get_complete_profile(
+        self,
+        phone_number: str,
+        data_types: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
         """
         📋 Fetch complete financial profile for a user.
         
         Args:
             phone_number: User identifier
+            data_types: Profile fields to load (e.g. ["net_worth", "credit_report"]).
+                If None, loads all six; other fields are left out of the result.
             
         Returns:
             Dict containing all available financial data for the user
         """
-        profile = {
-            "user_id": phone_number,
-            "net_worth": self.get_net_worth(phone_number),
-            "bank_transactions": self.get_bank_transactions(phone_number),
-            "mutual_fund_transactions": self.get_mutual_fund_transactions(phone_number),
-            "stock_transactions": self.get_stock_transactions(phone_number),
-            "epf_details": self.get_epf_details(phone_number),
-            "credit_report": self.get_credit_report(phone_number)
-        }
+        fields = _profile_fields(data_types)
+        return self._load_profile(phone_number, fields)
+    
+    def _load_profile(self, phone_number: str, fields: Sequence[str]) -> Dict[str, Any]:
+        """Load the given get_complete_profile fields for a user."""
+        profile: Dict[str, Any] = {"user_id": phone_number}
+        for field in fields:
+            profile[field] = self._load_data(phone_number, PROFILE_DATA_TYPES[field])
         return profile
     
+    def get_profiles(
+        self,
+        phone_numbers: Optional[Iterable[str]] = None,
+        data_types: Optional[Sequence[str]] = None,
+        workers: int = 4,
+        use_processes: bool = False,
+        max_in_flight: Optional[int] = None
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        📚 Stream financial profiles for many users from a worker pool.
+        
+        Results are yielded in completion order. At most max_in_flight
+        profiles are loading or waiting to be consumed at any time, so memory
+        stays flat however many phone numbers are supplied.
+        
+        Args:
+            phone_numbers: Users to load. If None, loads every available user.
+            data_types: get_complete_profile fields to load (e.g. ["net_worth",
+                "credit_report"]). If None, loads all six.
+            workers: Number of pool workers
+            use_processes: Use a process pool so JSON decoding scales across
+                cores. Each worker opens its own accessor from _worker_spec.
+            max_in_flight: Bound on queued work (default: 2 x workers)
+            
+        Yields:
+            (phone_number, profile) tuples
+        
+        Raises:
+            ValueError: If use_processes is set and the backend cannot be
+                reopened in worker processes
+        """
+        fields = _profile_fields(data_types)
+        pool_options: Dict[str, Any] = {}
+        if use_processes:
+            spec = self._worker_spec()
+            if spec is None:
+                raise ValueError(f"{type(self).__name__} cannot be opened in worker processes; "
+                                 "use threads (use_processes=False)")
+            pool_options = {"initializer": _open_worker_accessor, "initargs": spec}
+        if phone_numbers is None:
+            phone_numbers = self.iter_available_users()
+        workers = max(1, workers)
+        limit = max(1, max_in_flight if max_in_flight is not None else workers * 2)
+        
+        pool_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with pool_class(max_workers=workers, **pool_options) as pool:
+            pending = {}
+            phones = iter(phone_numbers)
+            exhausted = False
+            while True:
+                while not exhausted and len(pending) < limit:
+                    phone = next(phones, None)
+                    if phone is None:
+                        exhausted = True
+                        break
+                    if use_processes:
+                        future = pool.submit(_load_profile_in_worker, phone, fields)
+                    else:
+                        future = pool.submit(self._load_profile, phone, fields)
+                    pending[future] = phone
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.result()
+    
     def get_user_persona_description(self, phone_number: str) -> str:
         """
         📝 Get description of user persona based on phone number.
@@ -281,103 +1057,370 @@ class FIMCPDataAccess:
         }
         return persona_descriptions.get(phone_number, "Unknown persona")
     
+    def _user_signature(self, phone_number: str) -> Optional[Tuple[Any, ...]]:
+        """
+        Fingerprint a user's data files for summary invalidation.
+        
+        Returns:
+            Tuple of (mtime_ns, size) per data type (None where missing),
+            or None if the user does not exist
+        """
+        files = self._user_files(phone_number)
+        if files is None:
+            return None
+        user_dir = self._user_dir(phone_number)
+        signature: List[Optional[Tuple[int, int]]] = []
+        for data_type in DATA_TYPES:
+            stat = None
+            if data_type in files:
+                try:
+                    stat = os.stat(user_dir / data_type)
+                except OSError:
+                    pass
+            signature.append((stat.st_mtime_ns, stat.st_size) if stat is not None else None)
+        return tuple(signature)
+    
+    def _stored_summary(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Summary materialized by the backend at build time, if any."""
+        return None
+    
+    def _count_transactions(self, phone_number: str, field: str) -> int:
+        """Count a user's transaction rows by streaming, without decoding the file."""
+        collection_key, label_key = _TRANSACTION_COLLECTIONS[field]
+        try:
+            return sum(1 for _ in self._iter_rows(phone_number, PROFILE_DATA_TYPES[field],
+                                                  collection_key, label_key, None))
+        except ValueError:
+            return 0
+    
+    def _summarize(self, phone_number: str) -> Dict[str, Any]:
+        """
+        Build a user's summary from the raw data files.
+        
+        Only the net worth and credit report are decoded; transactions are
+        counted by streaming their files.
+        """
+        available = {
+            field: self._has_data(phone_number, data_type)
+            for field, data_type in PROFILE_DATA_TYPES.items()
+        }
+        fields = [field for field in ("net_worth", "credit_report") if available[field]]
+        counts = {
+            field: self._count_transactions(phone_number, field) if available[field] else 0
+            for field in _TRANSACTION_COLLECTIONS
+        }
+        return summarize_profile(self._load_profile(phone_number, fields), available, counts)
+    
+    def get_user_summary(self, phone_number: str) -> Dict[str, Any]:
+        """
+        📋 Get the materialized summary of a user's data.
+        
+        Summaries are built once per user and kept in memory; a user's
+        entry is rebuilt only after one of their files changes. Snapshot and
+        SQLite backends serve summaries computed when they were built.
+        
+        Args:
+            phone_number: User identifier
+            
+        Returns:
+            Dict containing data availability (flags and bits), profile
+            completeness, total net worth, credit score, asset/liability
+            totals and transaction counts
+        """
+        stored = self._stored_summary(phone_number)
+        if stored is not None:
+            return stored
+        signature = self._user_signature(phone_number)
+        if signature is None:
+            # Unknown users are summarized but not indexed
+            return self._summarize(phone_number)
+        entry = self._summaries.get(phone_number)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        summary = self._summarize(phone_number)
+        with self._summaries_lock:
+            self._summaries[phone_number] = (signature, summary)
+        return summary
+    
+    def get_user_summaries(self, phone_numbers: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        📋 Get summaries for many users at once.
+        
+        Args:
+            phone_numbers: Users to summarize. If None, summarizes all available users.
+            
+        Returns:
+            Dict mapping phone number to its summary
+        """
+        if phone_numbers is None:
+            phone_numbers = self.iter_available_users()
+        return {phone: self.get_user_summary(phone) for phone in phone_numbers}
+    
+    def build_summary_index(self) -> int:
+        """
+        Eagerly build the summaries of all available users.
+        
+        Returns:
+            Number of users in the index
+        """
+        return len(self.get_user_summaries())
+    
     def analyze_user_financial_health(self, phone_number: str) -> Dict[str, Any]:
         """
         🔍 Analyze user's financial health based on all available data.
         
+        Answered from the user's materialized summary, so repeated calls
+        do not touch the data files. Building the summary decodes only the
+        net worth and credit report.
+        
         Args:
             phone_number: User identifier
             
         Returns:
             Dict containing financial health analysis
         """
-        profile = self.get_complete_profile(phone_number)
-        persona = self.get_user_persona_description(phone_number)
-        
+        summary = self.get_user_summary(phone_number)
         analysis = {
             "user_id": phone_number,
-            "persona_description": persona,
-            "data_availability": {
-                "net_worth": profile["net_worth"] is not None,
-                "bank_transactions": profile["bank_transactions"] is not None,
-                "mutual_funds": profile["mutual_fund_transactions"] is not None,
-                "stocks": profile["stock_transactions"] is not None,
-                "epf": profile["epf_details"] is not None,
-                "credit_report": profile["credit_report"] is not None
-            },
-            "profile_completeness": sum(1 for v in profile.values() if v is not None and v != phone_number) / 6 * 100
+            "persona_description": self.get_user_persona_description(phone_number),
+            "data_availability": dict(summary["data_availability"]),
+            "profile_completeness": summary["profile_completeness"]
         }
         
         # Add specific insights based on available data
-        if profile["net_worth"]:
-            try:
-                net_worth_data = profile["net_worth"].get("netWorthResponse", {})
-                total_net_worth = net_worth_data.get("totalNetWorthValue", {}).get("units", "0")
-                analysis["total_net_worth"] = float(total_net_worth)
-            except (ValueError, TypeError):
-                analysis["total_net_worth"] = 0
-        
-        if profile["credit_report"]:
-            try:
-                credit_data = profile["credit_report"]["creditReports"][0]["creditReportData"]
-                credit_score = credit_data.get("score", {}).get("bureauScore", "0")
-                analysis["credit_score"] = int(credit_score)
-            except (IndexError, KeyError, ValueError, TypeError):
-                analysis["credit_score"] = None
+        for key in ("total_net_worth", "credit_score"):
+            if key in summary:
+                analysis[key] = summary[key]
         
         return analysis
 
 
+# Process-wide accessor registry shared by the convenience functions
+_accessors: Dict[Path, FIMCPDataAccess] = {}
+_accessors_lock = threading.Lock()
+
+
+def get_data_access(data_dir: Optional[str] = None) -> FIMCPDataAccess:
+    """
+    Get the shared FIMCPDataAccess instance for a data directory.
+    
+    One long-lived accessor is kept per resolved data_dir, so the
+    module-level helpers reuse the same warm cache across calls.
+    
+    Args:
+        data_dir: Path to the test data directory. If None, uses default path.
+        
+    Returns:
+        The process-wide FIMCPDataAccess for that directory
+    """
+    key = _resolve_data_dir(data_dir).resolve()
+    accessor = _accessors.get(key)
+    if accessor is None:
+        with _accessors_lock:
+            accessor = _accessors.get(key)
+            if accessor is None:
+                accessor = FIMCPDataAccess(str(key))
+                _accessors[key] = accessor
+    return accessor
+
+
+def reset_data_access(data_dir: Optional[str] = None) -> None:
+    """
+    Drop shared accessors so the next call builds a fresh one.
+    
+    Args:
+        data_dir: Directory whose accessor should be dropped. If None, all
+            registered accessors are dropped.
+    """
+    with _accessors_lock:
+        if data_dir is None:
+            _accessors.clear()
+        else:
+            _accessors.pop(_resolve_data_dir(data_dir).resolve(), None)
+
+
+def _checked_view(data_type: str, payload: Any) -> Any:
+    """Validate a payload, returning the SchemaError instead of raising it (so it is cached)."""
+    try:
+        return validate_payload(data_type, payload)
+    except SchemaError as e:
+        return e
+
+
+# Accessor of a process-pool worker, opened by _open_worker_accessor
+_worker_accessor: Optional[FIMCPDataAccess] = None
+
+
+def _open_worker_accessor(factory: Callable[..., FIMCPDataAccess], args: Tuple[Any, ...],
+                          kwargs: Dict[str, Any]) -> None:
+    """Process-pool initializer: reopen the parent's backend from its _worker_spec."""
+    global _worker_accessor
+    _worker_accessor = factory(*args, **kwargs)
+
+
+def _load_profile_in_worker(phone_number: str, fields: Sequence[str]) -> Dict[str, Any]:
+    """Process-pool entry point: load a profile through the worker's accessor."""
+    return _worker_accessor._load_profile(phone_number, fields)
+
+
 # Convenience functions for direct access
 def get_net_worth(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get net worth data for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_net_worth(phone_number)
 
 
 def get_bank_transactions(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get bank transactions for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_bank_transactions(phone_number)
 
 
 def get_mutual_fund_transactions(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get mutual fund transactions for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_mutual_fund_transactions(phone_number)
 
 
 def get_stock_transactions(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get stock transactions for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_stock_transactions(phone_number)
 
 
 def get_epf_details(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get EPF details for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_epf_details(phone_number)
 
 
 def get_credit_report(phone_number: str, data_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get credit report for a user"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_credit_report(phone_number)
 
 
-def get_complete_profile(phone_number: str, data_dir: Optional[str] = None) -> Dict[str, Any]:
-    """Get complete financial profile for a user"""
-    accessor = FIMCPDataAccess(data_dir)
-    return accessor.get_complete_profile(phone_number)
+def iter_bank_transactions(
+    phone_number: str,
+    bank: Optional[str] = None,
+    data_dir: Optional[str] = None
+) -> Iterator[Tuple[str, List[Any]]]:
+    """Stream (bank, txn) rows for a user without loading the whole file"""
+    accessor = get_data_access(data_dir)
+    return accessor.iter_bank_transactions(phone_number, bank)
+
+
+def iter_mf_transactions(
+    phone_number: str,
+    isin: Optional[str] = None,
+    data_dir: Optional[str] = None
+) -> Iterator[Tuple[str, List[Any]]]:
+    """Stream (isin, txn) rows for a user without loading the whole file"""
+    accessor = get_data_access(data_dir)
+    return accessor.iter_mf_transactions(phone_number, isin)
+
+
+def query_bank_transactions(
+    phone_number: str,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    types: Optional[Iterable[int]] = None,
+    data_dir: Optional[str] = None,
+    **filters: Any
+) -> List[Dict[str, Any]]:
+    """Query bank transactions for a user by date range and type"""
+    accessor = get_data_access(data_dir)
+    return accessor.query_bank_transactions(phone_number, start, end, types, **filters)
+
+
+def query_mf_transactions(
+    phone_number: str,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    order_types: Optional[Iterable[int]] = None,
+    data_dir: Optional[str] = None,
+    **filters: Any
+) -> List[Dict[str, Any]]:
+    """Query mutual fund transactions for a user by date range and order type"""
+    accessor = get_data_access(data_dir)
+    return accessor.query_mf_transactions(phone_number, start, end, order_types, **filters)
+
+
+def query_stock_transactions(
+    phone_number: str,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+    types: Optional[Iterable[int]] = None,
+    data_dir: Optional[str] = None,
+    **filters: Any
+) -> List[Dict[str, Any]]:
+    """Query stock transactions for a user by date range and type"""
+    accessor = get_data_access(data_dir)
+    return accessor.query_stock_transactions(phone_number, start, end, types, **filters)
+
+
+def get_complete_profile(
+    phone_number: str,
+    data_dir: Optional[str] = None,
+    data_types: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """Get complete financial profile for a user, optionally limited to some data types"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_complete_profile(phone_number, data_types)
+
+
+def get_profiles(
+    phone_numbers: Optional[Iterable[str]] = None,
+    data_types: Optional[Sequence[str]] = None,
+    workers: int = 4,
+    use_processes: bool = False,
+    data_dir: Optional[str] = None
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream (phone_number, profile) results for many users from a worker pool"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_profiles(phone_numbers, data_types, workers, use_processes)
+
+
+def get_raw(phone_number: str, data_type: str, data_dir: Optional[str] = None) -> Optional[Union[bytes, memoryview]]:
+    """Fetch a user's payload as raw JSON bytes"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_raw(phone_number, data_type)
+
+
+def get_view(phone_number: str, data_type: str, data_dir: Optional[str] = None) -> Any:
+    """Fetch a validated, typed view of a user's payload"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_view(phone_number, data_type)
 
 
 def analyze_user_financial_health(phone_number: str, data_dir: Optional[str] = None) -> Dict[str, Any]:
     """Analyze user's financial health"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.analyze_user_financial_health(phone_number)
 
 
+def get_user_summary(phone_number: str, data_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Get the materialized summary of a user's data"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_user_summary(phone_number)
+
+
+def get_user_summaries(
+    phone_numbers: Optional[Iterable[str]] = None,
+    data_dir: Optional[str] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Get summaries for many users at once"""
+    accessor = get_data_access(data_dir)
+    return accessor.get_user_summaries(phone_numbers)
+
+
+def iter_available_users(data_dir: Optional[str] = None) -> Iterator[str]:
+    """Stream available user personas"""
+    accessor = get_data_access(data_dir)
+    return accessor.iter_available_users()
+
+
 def get_available_users(data_dir: Optional[str] = None) -> List[str]:
     """Get list of available user personas"""
-    accessor = FIMCPDataAccess(data_dir)
+    accessor = get_data_access(data_dir)
     return accessor.get_available_users()
\ No newline at end of file
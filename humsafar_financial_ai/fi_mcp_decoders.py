@@ -0,0 +1,137 @@
+"""
+JSON Decoder Backends for FI-MCP Data Access
+
+The data access layer reads every file in bytes mode and hands the raw bytes
+to a decoder strategy. The standard library decoder is always available;
+faster third-party decoders (orjson, ujson) are used when installed. A small
+benchmark reports decode time per data type so each deployment can pick
+its fastest backend.
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+JSONDecoder = Callable[[bytes], Any]
+
+# Installed decoders, fastest first
+JSON_DECODERS: Dict[str, JSONDecoder] = {}
+if orjson is not None:
+    JSON_DECODERS["orjson"] = orjson.loads
+if ujson is not None:
+    JSON_DECODERS["ujson"] = ujson.loads
+JSON_DECODERS["stdlib"] = json.loads
+
+
+def get_json_decoder(decoder: Union[str, JSONDecoder, None] = "stdlib") -> JSONDecoder:
+    """
+    Resolve a decoder strategy.
+    
+    Args:
+        decoder: Name of an installed decoder ("stdlib", "orjson", "ujson"),
+            "auto" for the fastest installed one, None for stdlib, or any
+            callable taking bytes and returning the decoded document
+    
+    Returns:
+        Callable decoding UTF-8 JSON bytes. Decode errors surface as ValueError.
+    """
+    if decoder is None:
+        return json.loads
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        return next(iter(JSON_DECODERS.values()))
+    if decoder not in JSON_DECODERS:
+        available = ", ".join(JSON_DECODERS)
+        raise ValueError(f"JSON decoder '{decoder}' is not installed (available: {available})")
+    return JSON_DECODERS[decoder]
+
+
+def benchmark_decoders(
+    data_dir: Optional[str] = None,
+    decoders: Optional[Sequence[str]] = None,
+    repeat: int = 20
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    ⏱️ Measure decode time per data type for each installed decoder.
+    
+    Every file of the data directory is read once into memory; only the
+    decode step is timed.
+    
+    Args:
+        data_dir: Data directory to benchmark. If None, uses the bundled dummy data.
+        decoders: Decoder names to compare. If None, compares all installed.
+        repeat: Number of decode passes over each file
+    
+    Returns:
+        Dict mapping data type to decoder name to:
+            - files: Number of files decoded
+            - bytes: Average file size
+            - avg_us: Average decode time per file in microseconds
+            - mb_per_s: Decode throughput
+    """
+    from .fi_mcp_data_access import DATA_TYPES, FIMCPDataAccess
+    
+    reader = FIMCPDataAccess(data_dir, cache_size=0)
+    names = list(decoders) if decoders is not None else list(JSON_DECODERS)
+    payloads: Dict[str, List[bytes]] = {data_type: [] for data_type in DATA_TYPES}
+    for phone_number in reader.iter_available_users():
+        user_dir = reader._user_dir(phone_number)
+        for data_type in DATA_TYPES:
+            file_path = user_dir / data_type
+            if file_path.is_file():
+                payloads[data_type].append(file_path.read_bytes())
+    
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for data_type, blobs in payloads.items():
+        if not blobs:
+            continue
+        total_bytes = sum(len(blob) for blob in blobs)
+        results[data_type] = {}
+        for name in names:
+            decode = get_json_decoder(name)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for blob in blobs:
+                    decode(blob)
+            elapsed = time.perf_counter() - started
+            decoded = len(blobs) * repeat
+            results[data_type][name] = {
+                "files": len(blobs),
+                "bytes": round(total_bytes / len(blobs), 1),
+                "avg_us": round(elapsed / decoded * 1e6, 2),
+                "mb_per_s": round(total_bytes * repeat / elapsed / 1e6, 2) if elapsed > 0 else 0.0
+            }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: print the decoder benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on FI-MCP data files")
+    parser.add_argument("--data-dir", default=None, help="Data directory (defaults to bundled dummy data)")
+    parser.add_argument("--repeat", type=int, default=20, help="Decode passes per file")
+    args = parser.parse_args(argv)
+    
+    results = benchmark_decoders(args.data_dir, repeat=args.repeat)
+    print(f"⏱️ JSON decode benchmark ({', '.join(JSON_DECODERS)})")
+    for data_type, by_decoder in results.items():
+        print(f"\n{data_type}")
+        for name, stats in sorted(by_decoder.items(), key=lambda item: item[1]["avg_us"]):
+            print(f"  {name:<8} {stats['avg_us']:>10.2f} µs/file  {stats['mb_per_s']:>8.2f} MB/s  "
+                  f"({stats['files']} files, {stats['bytes']:.0f} B avg)")
+
+
+if __name__ == "__main__":
+    main()
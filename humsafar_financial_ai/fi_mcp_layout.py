@@ -0,0 +1,209 @@
+"""
+Data Directory Layouts for FI-MCP Data
+
+The bundled dummy data keeps one folder per phone number directly under
+the data directory. That flat layout stops scaling long before millions of
+users: a single directory with millions of entries makes every listing and
+lookup slow. A sharded layout nests user folders under hash-derived shard
+directories instead:
+    
+    data_dir/<phone>/                 flat (shard_depth=0)
+    data_dir/ab/cd/<phone>/           sharded (shard_depth=2, shard_width=2)
+
+where "ab" and "cd" are the leading hex digits of sha1(phone). The layout
+of a data directory is recorded in a small marker file at its root, so
+every reader picks it up automatically; migrate_layout moves an existing
+tree between layouts.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+LAYOUT_FILE = "fi_mcp_layout.json"
+
+_HEX_DIGITS = 40  # length of a sha1 hex digest
+
+
+class DataLayout:
+    """
+    Mapping of phone numbers to user directories inside a data directory.
+    
+    A shard_depth of 0 is the flat layout; otherwise every user directory
+    sits shard_depth levels deep, each level named by the next shard_width
+    hex digits of the phone number's sha1.
+    """
+    
+    __slots__ = ("shard_depth", "shard_width")
+    
+    def __init__(self, shard_depth: int = 0, shard_width: int = 2):
+        if shard_depth < 0 or shard_width < 1 or shard_depth * shard_width > _HEX_DIGITS:
+            raise ValueError(f"Invalid layout: shard_depth={shard_depth}, shard_width={shard_width}")
+        self.shard_depth = shard_depth
+        self.shard_width = shard_width
+    
+    @classmethod
+    def load(cls, data_dir: Path) -> "DataLayout":
+        """
+        Read the layout recorded in a data directory (flat if none is).
+        
+        Raises:
+            ValueError: If the layout marker is unreadable
+        """
+        try:
+            with open(Path(data_dir) / LAYOUT_FILE, "rb") as f:
+                config = json.loads(f.read())
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Unreadable layout marker in {data_dir}: {e}") from None
+        return cls(int(config.get("shard_depth", 0)), int(config.get("shard_width", 2)))
+    
+    def save(self, data_dir: Path) -> None:
+        """Record this layout in a data directory."""
+        marker = Path(data_dir) / LAYOUT_FILE
+        if not self.sharded:
+            if marker.exists():
+                marker.unlink()
+            return
+        tmp_path = f"{marker}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"shard_depth": self.shard_depth, "shard_width": self.shard_width}, f)
+        os.replace(tmp_path, marker)
+    
+    @property
+    def sharded(self) -> bool:
+        """Whether user directories are nested under shard directories."""
+        return self.shard_depth > 0
+    
+    def shard_parts(self, phone_number: str) -> List[str]:
+        """Shard directory names leading to a user's directory."""
+        if not self.sharded:
+            return []
+        digest = hashlib.sha1(phone_number.encode("utf-8")).hexdigest()
+        width = self.shard_width
+        return [digest[level * width:(level + 1) * width] for level in range(self.shard_depth)]
+    
+    def user_dir(self, data_dir: Path, phone_number: str) -> Path:
+        """Path of a user's directory."""
+        return Path(data_dir).joinpath(*self.shard_parts(phone_number), phone_number)
+    
+    def iter_users(self, data_dir: Path) -> Iterator[Tuple[str, str]]:
+        """
+        Stream (phone_number, directory path) for every user directory.
+        
+        Only one directory listing is held at a time; in sharded layouts
+        each shard is listed in sorted order.
+        """
+        yield from self._walk(str(data_dir), 0)
+    
+    def _walk(self, path: str, level: int) -> Iterator[Tuple[str, str]]:
+        """Recursively stream user directories below one shard directory."""
+        try:
+            with os.scandir(path) as entries:
+                if level == self.shard_depth:
+                    if not self.sharded:
+                        # Flat layouts stream in directory order without buffering
+                        for entry in entries:
+                            if entry.name.isdigit() and entry.is_dir():
+                                yield entry.name, entry.path
+                        return
+                    names = sorted(entry.name for entry in entries if entry.name.isdigit() and entry.is_dir())
+                else:
+                    names = sorted(
+                        entry.name for entry in entries
+                        if len(entry.name) == self.shard_width and entry.is_dir() and _is_hex(entry.name)
+                    )
+        except OSError:
+            return
+        for name in names:
+            child = os.path.join(path, name)
+            if level == self.shard_depth:
+                yield name, child
+            else:
+                yield from self._walk(child, level + 1)
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, DataLayout):
+            return NotImplemented
+        if not (self.sharded or other.sharded):
+            return True
+        return (self.shard_depth, self.shard_width) == (other.shard_depth, other.shard_width)
+    
+    def __repr__(self) -> str:
+        return f"DataLayout(shard_depth={self.shard_depth}, shard_width={self.shard_width})"
+
+
+def _is_hex(name: str) -> bool:
+    """Check whether a directory name is lowercase hex (a shard directory)."""
+    return all(char in "0123456789abcdef" for char in name)
+
+
+def migrate_layout(data_dir: str, shard_depth: int = 2, shard_width: int = 2) -> Dict[str, Any]:
+    """
+    🗂️ Move a data directory's user folders into another layout.
+    
+    User directories are renamed in place (no file is copied) and the new
+    layout is recorded once every user has moved, so an interrupted
+    migration can simply be run again.
+    
+    Args:
+        data_dir: Data directory to migrate
+        shard_depth: Target number of shard levels (0 migrates back to flat)
+        shard_width: Hex digits per shard directory name
+    
+    Returns:
+        Dict containing:
+            - users: Number of user directories moved
+            - shard_depth / shard_width: The layout now in effect
+    """
+    root = Path(data_dir)
+    source = DataLayout.load(root)
+    target = DataLayout(shard_depth, shard_width)
+    
+    moved = 0
+    if source != target:
+        # List up front: moving users changes the directories being scanned
+        users = list(source.iter_users(root))
+        for phone_number, path in users:
+            if not source.sharded and len(phone_number) <= target.shard_width:
+                # Shard directory left behind by an interrupted migration
+                continue
+            destination = target.user_dir(root, phone_number)
+            if destination.exists():
+                raise FileExistsError(f"Cannot migrate {phone_number}: {destination} already exists")
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            os.rename(path, destination)
+            moved += 1
+            # Drop shard directories emptied by the move
+            parent = Path(path).parent
+            for _ in range(source.shard_depth):
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+    target.save(root)
+    
+    return {"users": moved, "shard_depth": target.shard_depth, "shard_width": target.shard_width}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: migrate a data directory to another layout."""
+    parser = argparse.ArgumentParser(description="Move an FI-MCP data directory into a sharded (or flat) layout")
+    parser.add_argument("data_dir", help="Data directory to migrate")
+    parser.add_argument("--shard-depth", type=int, default=2, help="Shard levels (0 for the flat layout)")
+    parser.add_argument("--shard-width", type=int, default=2, help="Hex digits per shard directory name")
+    args = parser.parse_args(argv)
+    
+    stats = migrate_layout(args.data_dir, args.shard_depth, args.shard_width)
+    print(f"🗂️ Moved {stats['users']} users into layout "
+          f"shard_depth={stats['shard_depth']}, shard_width={stats['shard_width']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Money Values for FI-MCP Data
+
+FI payloads encode money as {"currencyCode", "units", "nanos"} with units
+as a string and nanos carrying the fractional part (same sign as units).
+Money stores such an amount as exact integer paise, and the bulk helpers
+convert whole lists of these dicts without building a Money or float per
+field, so aggregation over thousands of holdings stays exact.
+"""
+
+from array import array
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from functools import total_ordering
+from typing import Any, Dict, Iterable, Optional, Union
+
+
+_NANOS_PER_PAISA = 10_000_000
+
+
+def to_paise(value: Any) -> int:
+    """
+    Convert a rupee amount (string or number) to integer paise.
+    
+    Raises:
+        ValueError: If the value is not a finite number
+    """
+    text = str(value).strip()
+    if text.lstrip("-").isdigit():
+        return int(text) * 100
+    try:
+        return int((Decimal(text) * 100).to_integral_value(ROUND_HALF_UP))
+    except (InvalidOperation, OverflowError):
+        raise ValueError(f"Invalid money amount: {value!r}") from None
+
+
+def _nanos_to_paise(nanos: int) -> int:
+    """Round a nanos fraction to paise, half away from zero."""
+    paise, remainder = divmod(abs(nanos), _NANOS_PER_PAISA)
+    if remainder * 2 >= _NANOS_PER_PAISA:
+        paise += 1
+    return -paise if nanos < 0 else paise
+
+
+def money_dict_to_paise(money: Dict[str, Any]) -> int:
+    """
+    Convert one {currencyCode, units, nanos} dict to integer paise.
+    
+    Raises:
+        ValueError: If units or nanos are not numeric
+    """
+    units = money.get("units", "0")
+    if isinstance(units, str) and units.lstrip("-").isdigit():
+        paise = int(units) * 100
+    else:
+        paise = to_paise(units)
+    nanos = money.get("nanos")
+    if nanos:
+        paise += _nanos_to_paise(int(nanos))
+    return paise
+
+
+@total_ordering
+class Money:
+    """
+    💰 Exact money amount stored as integer paise.
+    
+    Supports addition, subtraction, negation, comparison and multiplication
+    by integers. Amounts in different currencies cannot be combined.
+    """
+    
+    __slots__ = ("paise", "currency")
+    
+    def __init__(self, paise: int = 0, currency: str = "INR"):
+        self.paise = paise
+        self.currency = currency
+    
+    @classmethod
+    def from_dict(cls, money: Optional[Dict[str, Any]]) -> "Money":
+        """
+        Build from a {currencyCode, units, nanos} dict (None gives zero).
+        
+        Raises:
+            ValueError: If units or nanos are not numeric
+        """
+        if not money:
+            return cls()
+        return cls(money_dict_to_paise(money), money.get("currencyCode", "INR"))
+    
+    @classmethod
+    def from_rupees(cls, amount: Union[int, float, str], currency: str = "INR") -> "Money":
+        """Build from a rupee amount, rounding to the nearest paisa."""
+        return cls(to_paise(amount), currency)
+    
+    @classmethod
+    def sum(cls, values: Iterable[Optional[Dict[str, Any]]], currency: str = "INR") -> "Money":
+        """
+        Exactly sum a list of {currencyCode, units, nanos} dicts.
+        
+        Raises:
+            ValueError: If a value is in a different currency
+        """
+        total = 0
+        for money in values:
+            if not money:
+                continue
+            if money.get("currencyCode", currency) != currency:
+                raise ValueError(f"Cannot add {money.get('currencyCode')} to {currency}")
+            total += money_dict_to_paise(money)
+        return cls(total, currency)
+    
+    @property
+    def rupees(self) -> float:
+        """Amount in rupees as a float."""
+        return self.paise / 100
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the FI {currencyCode, units, nanos} format."""
+        # Integer divmod keeps amounts beyond 2**53 paise exact; units and
+        # nanos share the amount's sign
+        sign = -1 if self.paise < 0 else 1
+        units, paise = divmod(abs(self.paise), 100)
+        units *= sign
+        nanos = sign * paise * _NANOS_PER_PAISA
+        result: Dict[str, Any] = {"currencyCode": self.currency, "units": str(units)}
+        if nanos:
+            result["nanos"] = nanos
+        return result
+    
+    def _check(self, other: "Money") -> None:
+        if self.currency != other.currency:
+            raise ValueError(f"Cannot combine {self.currency} and {other.currency}")
+    
+    def __add__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.paise + other.paise, self.currency)
+    
+    def __radd__(self, other: Any) -> "Money":
+        # Allows sum() over Money values, which starts from 0
+        if other == 0:
+            return self
+        return NotImplemented
+    
+    def __sub__(self, other: "Money") -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return Money(self.paise - other.paise, self.currency)
+    
+    def __neg__(self) -> "Money":
+        return Money(-self.paise, self.currency)
+    
+    def __mul__(self, factor: int) -> "Money":
+        if not isinstance(factor, int):
+            return NotImplemented
+        return Money(self.paise * factor, self.currency)
+    
+    __rmul__ = __mul__
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.paise == other.paise and self.currency == other.currency
+    
+    def __lt__(self, other: "Money") -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check(other)
+        return self.paise < other.paise
+    
+    def __hash__(self) -> int:
+        return hash((self.paise, self.currency))
+    
+    def __bool__(self) -> bool:
+        return self.paise != 0
+    
+    def __repr__(self) -> str:
+        return f"Money({self.paise / 100:.2f} {self.currency})"
+
+
+def paise_array(values: Iterable[Optional[Dict[str, Any]]]) -> array:
+    """
+    Convert many {currencyCode, units, nanos} dicts to an array('q') of paise.
+    
+    Missing values (None or {}) become 0.
+    """
+    return array("q", (money_dict_to_paise(money) if money else 0 for money in values))
+
+
+def total_paise(values: Iterable[Optional[Dict[str, Any]]]) -> int:
+    """Exactly sum many {currencyCode, units, nanos} dicts, in paise."""
+    return sum(money_dict_to_paise(money) for money in values if money)
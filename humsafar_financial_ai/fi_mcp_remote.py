@@ -0,0 +1,574 @@
+"""
+Remote FI-MCP Data Access over HTTP
+
+In production the six fetch_* payloads come from an FI MCP HTTP service
+rather than local files. RemoteDataAccess is a FIMCPDataAccess backend for
+such a service: requests go through a small pool of persistent keep-alive
+connections, every endpoint has its own timeout, cached payloads are
+revalidated with ETags instead of re-downloaded, and get_complete_profile
+fetches all requested data types in a single batched request.
+
+The service protocol (all GET, JSON unless noted):
+    
+    /users                          one phone number per line (text)
+    /users/<phone>                  {data_type: etag} of the user's files
+    /users/<phone>/<data_type>      raw payload; honours If-None-Match
+    /users/<phone>/batch?types=a,b&etags=x,y
+                                    {data_type: {"etag", "data"} or
+                                     {"etag", "not_modified": true}}
+
+A local stand-in server implementing the protocol over a test_data_dir is
+included, so the backend can be exercised and benchmarked offline.
+"""
+
+import argparse
+import http.client
+import io
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, BinaryIO, Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import parse_qs, quote, urlsplit
+
+from .fi_mcp_data_access import DATA_TYPES, PROFILE_DATA_TYPES, FIMCPDataAccess
+from .fi_mcp_decoders import JSONDecoder
+
+
+# Default per-endpoint timeouts in seconds
+DEFAULT_TIMEOUTS: Dict[str, float] = {
+    "users": 30.0,
+    "index": 5.0,
+    "data": 10.0,
+    "batch": 20.0
+}
+
+# Errors meaning a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class _ConnectionPool:
+    """
+    Thread-safe pool of persistent HTTP connections to one host.
+    
+    At most size requests are in flight at once; idle connections are
+    reused, and a reused connection the server has meanwhile closed is
+    transparently replaced once.
+    """
+    
+    def __init__(self, base_url: str, size: int = 4):
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported FI-MCP service URL: {base_url}")
+        self._connection_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.size = max(1, size)
+        self.requests = 0
+        self.connections = 0
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+    
+    def request(
+        self,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send a GET request and read the whole response.
+        
+        Returns:
+            (status, headers, body)
+        
+        Raises:
+            OSError: On connection failures and timeouts
+        """
+        with self._slots:
+            while True:
+                with self._lock:
+                    conn = self._idle.pop() if self._idle else None
+                    reused = conn is not None
+                    if conn is None:
+                        conn = self._connection_class(self.host, self.port, timeout=timeout)
+                        self.connections += 1
+                    self.requests += 1
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                try:
+                    conn.request("GET", self.prefix + path, headers=headers or {})
+                    response = conn.getresponse()
+                    body = response.read()
+                except _STALE_CONNECTION_ERRORS:
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                if response.will_close:
+                    conn.close()
+                else:
+                    with self._lock:
+                        self._idle.append(conn)
+                return response.status, response.headers, body
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class RemoteDataAccess(FIMCPDataAccess):
+    """
+    FI-MCP data access served by a remote FI MCP HTTP service.
+    
+    All getters and analysis helpers of FIMCPDataAccess work unchanged.
+    Unlike the local backends, network failures, timeouts and error
+    responses other than 404 are raised (as OSError) rather than reported
+    as missing data.
+    """
+    
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 4,
+        timeouts: Optional[Dict[str, float]] = None,
+        cache_size: int = 128,
+        manifest_ttl: float = 1.0,
+        decoder: Union[str, JSONDecoder, None] = "stdlib"
+    ):
+        """
+        Connect to an FI MCP HTTP service.
+        
+        Args:
+            base_url: Service root, e.g. "http://127.0.0.1:8765"
+            pool_size: Maximum number of persistent connections
+            timeouts: Per-endpoint timeouts in seconds, overriding
+                DEFAULT_TIMEOUTS ("users", "index", "data", "batch")
+            cache_size: Maximum number of decoded payloads kept in memory (0 disables caching)
+            manifest_ttl: Seconds a user's file index is trusted before it is re-fetched
+            decoder: JSON decoder name or callable, as for FIMCPDataAccess
+        """
+        super().__init__(cache_size=cache_size, manifest_ttl=manifest_ttl, decoder=decoder)
+        self.base_url = base_url.rstrip("/")
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            unknown = set(timeouts) - set(DEFAULT_TIMEOUTS)
+            if unknown:
+                raise ValueError(f"Unknown endpoints: {', '.join(sorted(unknown))}")
+            self.timeouts.update(timeouts)
+        self._pool = _ConnectionPool(self.base_url, pool_size)
+    
+    def _worker_spec(self):
+        return RemoteDataAccess, (self.base_url,), {
+            "pool_size": self._pool.size,
+            "timeouts": dict(self.timeouts),
+            "cache_size": self._cache.maxsize,
+            "manifest_ttl": self.manifest_ttl,
+            "decoder": self._decoder
+        }
+    
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._pool.close()
+    
+    def __enter__(self) -> "RemoteDataAccess":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def connection_info(self) -> Dict[str, int]:
+        """
+        Get connection pool statistics.
+        
+        Returns:
+            Dict containing requests sent, connections opened and pool size
+        """
+        return {"requests": self._pool.requests, "connections": self._pool.connections, "pool_size": self._pool.size}
+    
+    def _get(self, endpoint: str, path: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Any, bytes]:
+        """GET a service path with the endpoint's timeout."""
+        return self._pool.request(path, headers, self.timeouts[endpoint])
+    
+    @staticmethod
+    def _found(status: int, path: str) -> bool:
+        """
+        Whether a response carries data: True for 200, False for 404.
+        
+        Raises:
+            OSError: For any other status, so service failures are never
+                mistaken for missing data
+        """
+        if status == 200:
+            return True
+        if status == 404:
+            return False
+        raise OSError(f"FI MCP service returned HTTP {status} for {path}")
+    
+    @staticmethod
+    def _user_path(phone_number: str) -> str:
+        return f"/users/{quote(phone_number, safe='')}"
+    
+    def _user_index(self, phone_number: str) -> Optional[Dict[str, str]]:
+        """Fetch (or reuse, within manifest_ttl) the {data_type: etag} index of a user."""
+        if not phone_number.isdigit():
+            return None
+        key = (phone_number, "")
+        entry = self._user_files_cache.peek(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.manifest_ttl:
+            return entry[1]
+        path = self._user_path(phone_number)
+        status, _, body = self._get("index", path)
+        index = self._decode(body) if self._found(status, path) else None
+        self._user_files_cache.put(key, now, index)
+        return index
+    
+    def _user_files(self, phone_number: str) -> Optional[FrozenSet[str]]:
+        """Data types the service holds for a user."""
+        index = self._user_index(phone_number)
+        return frozenset(index) if index is not None else None
+    
+    def _user_signature(self, phone_number: str) -> Optional[Tuple[Any, ...]]:
+        """ETags of a user's data types (None where missing)."""
+        index = self._user_index(phone_number)
+        if index is None:
+            return None
+        return tuple(index.get(data_type) for data_type in DATA_TYPES)
+    
+    def _read_data(self, phone_number: str, data_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Load data for a specific user and data type from the service.
+        
+        A cached payload is revalidated with its ETag, so unchanged data is
+        neither downloaded nor decoded again.
+        
+        Args:
+            phone_number: User identifier (phone number)
+            data_type: Type of data to fetch (e.g., 'fetch_net_worth.json')
+        
+        Returns:
+            Dictionary containing the data or None if not found
+        """
+        if not phone_number.isdigit():
+            return None
+        key = (phone_number, data_type)
+        entry = self._cache.peek(key)
+        headers = {"If-None-Match": entry[0]} if entry is not None else None
+        path = f"{self._user_path(phone_number)}/{quote(data_type, safe='')}"
+        status, response_headers, body = self._get("data", path, headers)
+        if status == 304 and entry is not None:
+            found, data = self._cache.get(key, entry[0])
+            if found:
+                return data
+            # Evicted meanwhile: fetch unconditionally
+            return self._read_data(phone_number, data_type)
+        if not self._found(status, path):
+            self._cache.discard(key)
+            return None
+        try:
+            data = self._decode(body)
+        except ValueError:
+            self._cache.discard(key)
+            return None
+        self._cache.put(key, response_headers.get("ETag"), data)
+        return data
+    
+    def _load_profile(self, phone_number: str, fields: Sequence[str]) -> Dict[str, Any]:
+        """Load profile fields in one batched request, coalescing identical concurrent batches."""
+        key = (phone_number, "batch:" + ",".join(fields))
+        return self._inflight.do(key, self._read_profile, phone_number, fields)
+    
+    def _read_profile(self, phone_number: str, fields: Sequence[str]) -> Dict[str, Any]:
+        """
+        Load the given get_complete_profile fields in one batched request.
+        
+        ETags of cached payloads are sent along, so only changed data types
+        come back with a body.
+        """
+        profile: Dict[str, Any] = {"user_id": phone_number}
+        if not phone_number.isdigit():
+            profile.update((field, None) for field in fields)
+            return profile
+        data_types = [PROFILE_DATA_TYPES[field] for field in fields]
+        cached = [self._cache.peek((phone_number, data_type)) for data_type in data_types]
+        etags = [quote(entry[0] or "", safe="") if entry is not None else "" for entry in cached]
+        path = f"{self._user_path(phone_number)}/batch?types={','.join(data_types)}&etags={','.join(etags)}"
+        status, _, body = self._get("batch", path)
+        try:
+            batch = self._decode(body) if self._found(status, path) else {}
+        except ValueError:
+            # A malformed payload spoils the whole batch; fetch one by one
+            return super()._load_profile(phone_number, fields)
+        
+        for field, data_type in zip(fields, data_types):
+            entry = batch.get(data_type)
+            key = (phone_number, data_type)
+            if entry is None:
+                self._cache.discard(key)
+                profile[field] = None
+            elif entry.get("not_modified"):
+                found, data = self._cache.get(key, entry.get("etag"))
+                profile[field] = data if found else self._load_data(phone_number, data_type)
+            else:
+                self._cache.put(key, entry.get("etag"), entry.get("data"))
+                profile[field] = entry.get("data")
+        return profile
+    
+    def _read_raw(self, phone_number: str, data_type: str) -> Optional[bytes]:
+        """Download a payload's bytes without decoding them, revalidating cached bytes by ETag."""
+        if not phone_number.isdigit():
+            return None
+        key = (phone_number, data_type)
+        entry = self._raw_cache.peek(key)
+        headers = {"If-None-Match": entry[0]} if entry is not None else None
+        path = f"{self._user_path(phone_number)}/{quote(data_type, safe='')}"
+        status, response_headers, body = self._get("data", path, headers)
+        if status == 304 and entry is not None:
+            found, raw = self._raw_cache.get(key, entry[0])
+            if found:
+                return raw
+            # Evicted meanwhile: fetch unconditionally
+            return self._read_raw(phone_number, data_type)
+        if not self._found(status, path):
+            self._raw_cache.discard(key)
+            return None
+        self._raw_cache.put(key, response_headers.get("ETag"), body)
+        return body
+    
+    def _open_stream(self, phone_number: str, data_type: str) -> Optional[BinaryIO]:
+        """Download a payload and expose it as a binary stream."""
+        if not phone_number.isdigit():
+            return None
+        path = f"{self._user_path(phone_number)}/{quote(data_type, safe='')}"
+        status, _, body = self._get("data", path)
+        return io.BytesIO(body) if self._found(status, path) else None
+    
+    def iter_available_users(self) -> Iterator[str]:
+        """
+        Stream the phone numbers of all user personas held by the service.
+        
+        Yields:
+            Phone numbers
+        """
+        status, _, body = self._get("users", "/users")
+        if not self._found(status, "/users"):
+            return
+        for line in body.splitlines():
+            if line:
+                yield line.decode("ascii")
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Request handler of the local stand-in FI MCP service."""
+    
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; avoid delayed-ACK stalls
+    disable_nagle_algorithm = True
+    reader: FIMCPDataAccess
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json",
+              etag: Optional[str] = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _etags(self, phone_number: str) -> Optional[Dict[str, str]]:
+        """ETags (from mtime and size) of a user's data files."""
+        files = self.reader._user_files(phone_number) if phone_number.isdigit() else None
+        if files is None:
+            return None
+        user_dir = self.reader._user_dir(phone_number)
+        etags: Dict[str, str] = {}
+        for data_type in DATA_TYPES:
+            if data_type in files:
+                try:
+                    stat = os.stat(user_dir / data_type)
+                except OSError:
+                    continue
+                etags[data_type] = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        return etags
+    
+    def _read(self, phone_number: str, data_type: str) -> Optional[bytes]:
+        try:
+            with open(self.reader._user_dir(phone_number) / data_type, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        if segments == ["users"]:
+            body = "".join(f"{phone}\n" for phone in self.reader.iter_available_users()).encode("ascii")
+            self._send(200, body, "text/plain")
+            return
+        if len(segments) < 2 or segments[0] != "users":
+            self._send(404)
+            return
+        etags = self._etags(segments[1])
+        if etags is None:
+            self._send(404)
+            return
+        
+        if len(segments) == 2:
+            body = "{" + ",".join(f'"{data_type}":{_json_string(etag)}' for data_type, etag in etags.items()) + "}"
+            self._send(200, body.encode("utf-8"))
+        elif segments[2:] == ["batch"]:
+            query = parse_qs(parts.query, keep_blank_values=True)
+            data_types = [t for t in (query.get("types") or [""])[0].split(",") if t]
+            known = (query.get("etags") or [""])[0].split(",")
+            # Splice the raw payloads into the response without re-encoding them
+            chunks: List[bytes] = []
+            for position, data_type in enumerate(data_types):
+                etag = etags.get(data_type)
+                if etag is None:
+                    continue
+                if position < len(known) and known[position] == etag:
+                    chunks.append(f'"{data_type}":{{"etag":{_json_string(etag)},"not_modified":true}}'.encode("utf-8"))
+                    continue
+                payload = self._read(segments[1], data_type)
+                if payload is not None:
+                    chunks.append(f'"{data_type}":{{"etag":{_json_string(etag)},"data":'.encode("utf-8") + payload + b"}")
+            self._send(200, b"{" + b",".join(chunks) + b"}")
+        elif len(segments) == 3 and segments[2] in etags:
+            etag = etags[segments[2]]
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, etag=etag)
+                return
+            payload = self._read(segments[1], segments[2])
+            if payload is None:
+                self._send(404)
+            else:
+                self._send(200, payload, etag=etag)
+        else:
+            self._send(404)
+
+
+def _json_string(text: str) -> str:
+    """Encode a plain ASCII string (an ETag) as a JSON string literal."""
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def start_stand_in_server(
+    data_dir: Optional[str] = None,
+    host: str = "127.0.0.1",
+    port: int = 0
+) -> ThreadingHTTPServer:
+    """
+    🛰️ Serve a test_data_dir over the FI MCP HTTP protocol in a background thread.
+    
+    Args:
+        data_dir: Data directory to serve (flat or sharded). If None, uses the bundled dummy data.
+        host: Interface to bind
+        port: Port to bind (0 picks a free port)
+    
+    Returns:
+        The running server; its URL is http://<host>:<server.server_address[1]>.
+        Call shutdown() and server_close() to stop it.
+    """
+    handler = type("StandInHandler", (_StandInHandler,), {"reader": FIMCPDataAccess(data_dir, cache_size=0)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fi-mcp-stand-in", daemon=True).start()
+    return server
+
+
+def benchmark_remote(
+    data_dir: Optional[str] = None,
+    repeat: int = 3,
+    pool_size: int = 4
+) -> Dict[str, Dict[str, float]]:
+    """
+    ⏱️ Compare complete-profile loads from files and from the stand-in service.
+    
+    Caching is disabled for every backend, so each pass measures a full
+    load of every user's profile.
+    
+    Args:
+        data_dir: Data directory to benchmark. If None, uses the bundled dummy data.
+        repeat: Number of passes over all users
+        pool_size: Connection pool size of the remote backends
+    
+    Returns:
+        Dict mapping "file", "remote_batched" and "remote_per_type" to:
+            - profiles: Number of profiles loaded
+            - avg_ms: Average time per profile in milliseconds
+            - requests: HTTP requests sent (remote backends)
+            - connections: Connections opened (remote backends)
+    """
+    server = start_stand_in_server(data_dir)
+    url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    try:
+        file_data = FIMCPDataAccess(data_dir, cache_size=0)
+        users = file_data.get_available_users()
+        results: Dict[str, Dict[str, float]] = {}
+        for name in ("file", "remote_batched", "remote_per_type"):
+            accessor = file_data if name == "file" else RemoteDataAccess(url, pool_size=pool_size, cache_size=0)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                for phone_number in users:
+                    if name == "remote_per_type":
+                        FIMCPDataAccess._load_profile(accessor, phone_number, list(PROFILE_DATA_TYPES))
+                    else:
+                        accessor.get_complete_profile(phone_number)
+            elapsed = time.perf_counter() - started
+            loaded = len(users) * repeat
+            results[name] = {"profiles": loaded, "avg_ms": round(elapsed / max(loaded, 1) * 1e3, 3)}
+            if isinstance(accessor, RemoteDataAccess):
+                info = accessor.connection_info()
+                results[name].update(requests=info["requests"], connections=info["connections"])
+                accessor.close()
+        return results
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: run the stand-in service or the benchmark."""
+    parser = argparse.ArgumentParser(description="Local FI MCP HTTP stand-in service and remote backend benchmark")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve = commands.add_parser("serve", help="Serve a data directory over HTTP")
+    serve.add_argument("--data-dir", default=None, help="Data directory (defaults to bundled dummy data)")
+    serve.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve.add_argument("--port", type=int, default=8765, help="Port to bind")
+    bench = commands.add_parser("benchmark", help="Compare the file and remote backends")
+    bench.add_argument("--data-dir", default=None, help="Data directory (defaults to bundled dummy data)")
+    bench.add_argument("--repeat", type=int, default=3, help="Passes over all users")
+    args = parser.parse_args(argv)
+    
+    if args.command == "serve":
+        server = start_stand_in_server(args.data_dir, args.host, args.port)
+        print(f"🛰️ Serving FI-MCP data on http://{args.host}:{server.server_address[1]} (Ctrl+C to stop)")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            server.shutdown()
+            server.server_close()
+        return
+    
+    results = benchmark_remote(args.data_dir, repeat=args.repeat)
+    print("⏱️ Complete profile load time")
+    for name, stats in results.items():
+        extra = f"  ({stats['requests']} requests, {stats['connections']} connections)" if "requests" in stats else ""
+        print(f"  {name:<16} {stats['avg_ms']:>8.3f} ms/profile{extra}")
+
+
+if __name__ == "__main__":
+    main()
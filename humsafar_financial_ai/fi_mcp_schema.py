@@ -0,0 +1,499 @@
+"""
+Payload Schemas for FI-MCP Data
+
+The fetch_* files are nested JSON whose shape every consumer used to
+re-check with try/except around deep indexing. This module compiles one
+validator per payload type, once at import time, from small combinators
+(records, lists, positional txns rows, money and date fields). A validator
+walks a payload a single time and returns a typed, normalized view:
+amounts become integer paise, dates become datetime.date, type codes
+become ints and absent optional sections become empty lists or None.
+
+Malformed payloads raise SchemaError naming the offending path, e.g.
+"fetch_credit_report.json: creditReports[0].creditReportData.score.bureauScore:
+expected an integer". Views are immutable named tuples, so hot paths can
+index them directly without defensive checks.
+
+Descriptive columns that no headline figure depends on (interest rates,
+reported XIRRs, credit limits) are lenient: a value that does not parse
+becomes None instead of failing the whole payload, so one bad cell does
+not cost a user their net worth or credit score.
+"""
+
+from datetime import date
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from .fi_mcp_money import money_dict_to_paise, to_paise
+
+
+class SchemaError(ValueError):
+    """
+    A payload does not match the schema of its data type.
+    
+    Attributes:
+        path: Keys and list indices leading to the offending value
+        data_type: Profile field of the payload (set by validate_payload)
+    """
+    
+    def __init__(self, message: str, path: Optional[List[Union[str, int]]] = None):
+        super().__init__(message)
+        self.message = message
+        self.path: List[Union[str, int]] = path if path is not None else []
+        self.data_type: Optional[str] = None
+    
+    def __str__(self) -> str:
+        location = ""
+        for part in self.path:
+            location += f"[{part}]" if isinstance(part, int) else (f".{part}" if location else part)
+        prefix = f"{PAYLOAD_DATA_TYPES.get(self.data_type, self.data_type)}: " if self.data_type else ""
+        return f"{prefix}{location}: {self.message}" if location else f"{prefix}{self.message}"
+
+
+# Typed views
+
+class AssetValue(NamedTuple):
+    attribute: str
+    paise: int
+
+
+class SchemeView(NamedTuple):
+    isin: Optional[str]
+    name: Optional[str]
+    current_paise: Optional[int]
+    invested_paise: Optional[int]
+    xirr: Optional[float]
+
+
+class NetWorthView(NamedTuple):
+    """Net worth: totals in paise plus the mutual fund scheme analytics."""
+    total_paise: Optional[int]
+    assets: List[AssetValue]
+    liabilities: List[AssetValue]
+    schemes: List[SchemeView]
+    
+    @property
+    def total_assets_paise(self) -> int:
+        return sum(asset.paise for asset in self.assets)
+    
+    @property
+    def total_liabilities_paise(self) -> int:
+        return sum(liability.paise for liability in self.liabilities)
+
+
+class BankTxn(NamedTuple):
+    amount_paise: int
+    narration: str
+    date: date
+    type: int
+    mode: Optional[str]
+    balance_paise: Optional[int]
+
+
+class BankAccountView(NamedTuple):
+    bank: Optional[str]
+    txns: List[BankTxn]
+
+
+class BankTransactionsView(NamedTuple):
+    accounts: List[BankAccountView]
+    
+    @property
+    def txn_count(self) -> int:
+        return sum(len(account.txns) for account in self.accounts)
+
+
+class MFTxn(NamedTuple):
+    order_type: int
+    date: date
+    nav: float
+    units: float
+    amount: float
+
+
+class MFFundView(NamedTuple):
+    isin: Optional[str]
+    scheme_name: Optional[str]
+    folio_id: Optional[str]
+    txns: List[MFTxn]
+
+
+class MFTransactionsView(NamedTuple):
+    funds: List[MFFundView]
+    
+    @property
+    def txn_count(self) -> int:
+        return sum(len(fund.txns) for fund in self.funds)
+
+
+class StockTxn(NamedTuple):
+    type: int
+    date: date
+    quantity: float
+    nav: Optional[float]
+
+
+class StockView(NamedTuple):
+    isin: Optional[str]
+    txns: List[StockTxn]
+
+
+class StockTransactionsView(NamedTuple):
+    stocks: List[StockView]
+    
+    @property
+    def txn_count(self) -> int:
+        return sum(len(stock.txns) for stock in self.stocks)
+
+
+class EPFEstablishmentView(NamedTuple):
+    name: Optional[str]
+    member_id: Optional[str]
+    net_balance_paise: Optional[int]
+
+
+class EPFAccountView(NamedTuple):
+    current_balance_paise: Optional[int]
+    establishments: List[EPFEstablishmentView]
+
+
+class EPFView(NamedTuple):
+    """EPF accounts (one per UAN) with their establishment balances."""
+    accounts: List[EPFAccountView]
+    
+    @property
+    def balance_paise(self) -> Optional[int]:
+        """
+        Current balance over all accounts: the overall PF balance where
+        reported, else the sum of establishment net balances (None if no
+        balance is reported at all).
+        """
+        total = 0
+        found = False
+        for account in self.accounts:
+            if account.current_balance_paise is not None:
+                total += account.current_balance_paise
+                found = True
+                continue
+            for establishment in account.establishments:
+                if establishment.net_balance_paise is not None:
+                    total += establishment.net_balance_paise
+                    found = True
+        return total if found else None
+
+
+class CreditAccountView(NamedTuple):
+    subscriber: Optional[str]
+    account_type: Optional[str]
+    status: Optional[str]
+    current_balance_paise: Optional[int]
+    amount_past_due_paise: Optional[int]
+    rate_of_interest: Optional[float]
+    open_date: Optional[str]
+    credit_limit_paise: Optional[int]
+    original_amount_paise: Optional[int]
+    repayment_tenure: Optional[int]
+
+
+class CreditReportDataView(NamedTuple):
+    score: Optional[int]
+    accounts: List[CreditAccountView]
+
+
+class CreditReportView(NamedTuple):
+    """Credit reports; score and accounts are those of the first report."""
+    reports: List[CreditReportDataView]
+    
+    @property
+    def score(self) -> Optional[int]:
+        return self.reports[0].score if self.reports else None
+    
+    @property
+    def accounts(self) -> List[CreditAccountView]:
+        return self.reports[0].accounts if self.reports else []
+
+
+# Combinators. Each builds a check(value) -> normalized value closure once;
+# paths are only assembled while an error propagates.
+
+Check = Callable[[Any], Any]
+
+_REQUIRED = object()
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise SchemaError(f"expected a string, got {_type_name(value)}")
+    return value
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    raise SchemaError(f"expected a number, got {value!r}")
+
+
+def _integer(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    raise SchemaError(f"expected an integer, got {value!r}")
+
+
+def _amount(value: Any) -> int:
+    """Rupee amount (string or number) -> paise."""
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise SchemaError(f"expected an amount, got {_type_name(value)}")
+    try:
+        return to_paise(value)
+    except ValueError:
+        raise SchemaError(f"expected an amount, got {value!r}") from None
+
+
+def _money(value: Any) -> int:
+    """{currencyCode, units, nanos} dict -> paise."""
+    if not isinstance(value, dict):
+        raise SchemaError(f"expected a money object, got {_type_name(value)}")
+    try:
+        return money_dict_to_paise(value)
+    except (ValueError, TypeError):
+        raise SchemaError(f"invalid money value {value!r}") from None
+
+
+def _iso_date() -> Check:
+    """ISO date string -> date, memoized per distinct string."""
+    parsed: Dict[str, date] = {}
+    
+    def check(value: Any) -> date:
+        result = parsed.get(value) if isinstance(value, str) else None
+        if result is None:
+            try:
+                result = date.fromisoformat(_text(value))
+            except ValueError:
+                raise SchemaError(f"expected an ISO date, got {value!r}") from None
+            if len(parsed) < 4096:
+                parsed[value] = result
+        return result
+    return check
+
+
+def _lenient(check: Check) -> Check:
+    """Descriptive column: a value that fails check becomes None."""
+    def lenient(value: Any) -> Any:
+        try:
+            return check(value)
+        except SchemaError:
+            return None
+    return lenient
+
+
+def _list_of(item: Check) -> Check:
+    def check(value: Any) -> List[Any]:
+        if not isinstance(value, list):
+            raise SchemaError(f"expected a list, got {_type_name(value)}")
+        result = []
+        for index, element in enumerate(value):
+            try:
+                result.append(item(element))
+            except SchemaError as e:
+                e.path.insert(0, index)
+                raise
+        return result
+    return check
+
+
+Field = Tuple[Union[str, Tuple[str, ...]], Check, Any]
+
+
+def _record(build: Callable[..., Any], fields: Sequence[Field]) -> Check:
+    """
+    Object -> build(*values), one value per field.
+    
+    Each field is (key or key path, check, default); the default is used
+    when the value is absent or null (a callable default is called, and
+    _REQUIRED makes the field mandatory). Intermediate objects of a key
+    path that are absent count as an absent value.
+    """
+    compiled = tuple(
+        (key if isinstance(key, tuple) else (key,), check, default)
+        for key, check, default in fields
+    )
+    
+    def check_record(value: Any) -> Any:
+        if not isinstance(value, dict):
+            raise SchemaError(f"expected an object, got {_type_name(value)}")
+        values = []
+        for keys, check, default in compiled:
+            item = value
+            depth = 0
+            for key in keys:
+                if not isinstance(item, dict):
+                    raise SchemaError(f"expected an object, got {_type_name(item)}", list(keys[:depth]))
+                item = item.get(key)
+                depth += 1
+                if item is None:
+                    break
+            if item is None:
+                if default is _REQUIRED:
+                    raise SchemaError("missing required field", list(keys))
+                values.append(default() if callable(default) else default)
+                continue
+            try:
+                values.append(check(item))
+            except SchemaError as e:
+                e.path[:0] = keys
+                raise
+        return build(*values)
+    return check_record
+
+
+def _row(build: Callable[..., Any], columns: Sequence[Check], required: int) -> Check:
+    """Positional txns array -> build(*columns); trailing optional columns default to None."""
+    width = len(columns)
+    
+    def check(value: Any) -> Any:
+        if not isinstance(value, list) or not required <= len(value):
+            raise SchemaError(f"expected a row of at least {required} values, got {value!r}")
+        values = []
+        for index in range(width):
+            cell = value[index] if index < len(value) else None
+            if cell is None and index >= required:
+                values.append(None)
+                continue
+            try:
+                values.append(columns[index](cell))
+            except SchemaError as e:
+                e.path.insert(0, index)
+                raise
+        return build(*values)
+    return check
+
+
+# Compiled validators
+
+_asset = _record(AssetValue, [
+    ("netWorthAttribute", _text, _REQUIRED),
+    ("value", _money, 0)
+])
+
+_scheme = _record(SchemeView, [
+    (("schemeDetail", "isinNumber"), _text, None),
+    (("schemeDetail", "nameData", "longName"), _text, None),
+    (("enrichedAnalytics", "analytics", "schemeDetails", "currentValue"), _money, None),
+    (("enrichedAnalytics", "analytics", "schemeDetails", "investedValue"), _lenient(_money), None),
+    (("enrichedAnalytics", "analytics", "schemeDetails", "XIRR"), _lenient(_number), None)
+])
+
+_net_worth = _record(NetWorthView, [
+    (("netWorthResponse", "totalNetWorthValue"), _money, None),
+    (("netWorthResponse", "assetValues"), _list_of(_asset), list),
+    (("netWorthResponse", "liabilityValues"), _list_of(_asset), list),
+    (("mfSchemeAnalytics", "schemeAnalytics"), _list_of(_scheme), list)
+])
+
+_bank_transactions = _record(BankTransactionsView, [
+    ("bankTransactions", _list_of(_record(BankAccountView, [
+        ("bank", _text, None),
+        ("txns", _list_of(_row(BankTxn, [_amount, _text, _iso_date(), _integer, _text, _amount], 4)), list)
+    ])), list)
+])
+
+_mf_transactions = _record(MFTransactionsView, [
+    ("mfTransactions", _list_of(_record(MFFundView, [
+        ("isin", _text, None),
+        ("schemeName", _text, None),
+        ("folioId", _text, None),
+        ("txns", _list_of(_row(MFTxn, [_integer, _iso_date(), _number, _number, _number], 5)), list)
+    ])), list)
+])
+
+_stock_transactions = _record(StockTransactionsView, [
+    ("stockTransactions", _list_of(_record(StockView, [
+        ("isin", _text, None),
+        ("txns", _list_of(_row(StockTxn, [_integer, _iso_date(), _number, _number], 3)), list)
+    ])), list)
+])
+
+_epf_details = _record(EPFView, [
+    ("uanAccounts", _list_of(_record(EPFAccountView, [
+        (("rawDetails", "overall_pf_balance", "current_pf_balance"), _amount, None),
+        (("rawDetails", "est_details"), _list_of(_record(EPFEstablishmentView, [
+            ("est_name", _text, None),
+            ("member_id", _text, None),
+            (("pf_balance", "net_balance"), _amount, None)
+        ])), list)
+    ])), list)
+])
+
+_credit_report = _record(CreditReportView, [
+    ("creditReports", _list_of(_record(CreditReportDataView, [
+        (("creditReportData", "score", "bureauScore"), _integer, None),
+        (("creditReportData", "creditAccount", "creditAccountDetails"), _list_of(_record(CreditAccountView, [
+            ("subscriberName", _text, None),
+            ("accountType", _text, None),
+            ("accountStatus", _text, None),
+            ("currentBalance", _amount, None),
+            ("amountPastDue", _amount, None),
+            ("rateOfInterest", _lenient(_number), None),
+            ("openDate", _lenient(_text), None),
+            ("creditLimitAmount", _lenient(_amount), None),
+            ("highestCreditOrOriginalLoanAmount", _lenient(_amount), None),
+            ("repaymentTenure", _lenient(_integer), None)
+        ])), list)
+    ])), list)
+])
+
+# Profile field -> compiled validator
+PAYLOAD_VALIDATORS: Dict[str, Check] = {
+    "net_worth": _net_worth,
+    "bank_transactions": _bank_transactions,
+    "mutual_fund_transactions": _mf_transactions,
+    "stock_transactions": _stock_transactions,
+    "epf_details": _epf_details,
+    "credit_report": _credit_report
+}
+
+# Profile field -> file name, for error messages
+PAYLOAD_DATA_TYPES: Dict[str, str] = {
+    "net_worth": "fetch_net_worth.json",
+    "bank_transactions": "fetch_bank_transactions.json",
+    "mutual_fund_transactions": "fetch_mf_transactions.json",
+    "stock_transactions": "fetch_stock_transactions.json",
+    "epf_details": "fetch_epf_details.json",
+    "credit_report": "fetch_credit_report.json"
+}
+
+
+def validate_payload(data_type: str, payload: Any) -> Any:
+    """
+    ✅ Validate a payload and build its typed view.
+    
+    Args:
+        data_type: Profile field of the payload (e.g. "credit_report")
+        payload: Decoded JSON payload
+    
+    Returns:
+        The normalized view (NetWorthView, BankTransactionsView,
+        MFTransactionsView, StockTransactionsView, EPFView or CreditReportView)
+    
+    Raises:
+        ValueError: If the data type is unknown
+        SchemaError: If the payload does not match the schema
+    """
+    validator = PAYLOAD_VALIDATORS.get(data_type)
+    if validator is None:
+        raise ValueError(f"Unknown data types: {data_type}")
+    try:
+        return validator(payload)
+    except SchemaError as e:
+        e.data_type = data_type
+        raise
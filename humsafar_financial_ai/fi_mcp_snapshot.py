@@ -0,0 +1,299 @@
+"""
+Packed Snapshot Format for FI-MCP Data
+
+A data directory with one folder per phone number and six small JSON files
+per user is convenient for the dummy personas, but opening and stat-ing
+millions of tiny files dominates lookups on a production-sized mirror. This
+module packs a whole data directory into a single snapshot file and serves
+it through a memory-mapped FIMCPDataAccess backend.
+
+Snapshot layout (all integers little-endian):
+    
+    header   magic "FIMCPSNP", version u16, entry count u32,
+             data type table length u32, data type table (JSON list)
+    index    entry count fixed-width records sorted by (phone, data type):
+             phone (16 bytes, NUL padded), data type id u8,
+             payload offset u64, payload length u32
+    payload  raw JSON bytes of every file, back to back
+
+Each user also gets a precomputed summary entry (JSON, stored under the
+reserved "user_summary.json" data type), so health lookups and user
+listings never decode the large payloads.
+
+Lookups binary-search the index inside the mapping and decode only the
+requested payload slice, so opening a snapshot and reading one user costs
+a constant number of syscalls regardless of how many users it holds.
+"""
+
+import argparse
+import io
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from .fi_mcp_data_access import DATA_TYPES, FIMCPDataAccess
+from .fi_mcp_decoders import JSONDecoder
+from .fi_mcp_summary import SUMMARY_DATA_TYPE
+
+
+SNAPSHOT_MAGIC = b"FIMCPSNP"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<8sHII")
+_INDEX_RECORD = struct.Struct("<16sBQI")
+_PHONE_WIDTH = 16
+
+
+def compile_snapshot(data_dir: Optional[str], output_path: str) -> Dict[str, Any]:
+    """
+    📦 Pack a test_data_dir-style directory into a single snapshot file.
+    
+    Args:
+        data_dir: Directory with one sub-directory per phone number (flat or
+            sharded layout). If None, uses the bundled dummy data.
+        output_path: Path of the snapshot file to write
+    
+    Returns:
+        Dict containing:
+            - users: Number of users packed
+            - entries: Number of (user, data type) payloads packed
+            - summaries: Number of user summaries packed
+            - payload_bytes: Total size of the packed payloads
+            - snapshot_bytes: Size of the written snapshot file
+    """
+    data_types = list(DATA_TYPES) + [SUMMARY_DATA_TYPE]
+    summary_type_id = len(DATA_TYPES)
+    reader = FIMCPDataAccess(data_dir, cache_size=len(DATA_TYPES))
+    
+    records: List[Tuple[bytes, int, Union[Path, bytes]]] = []
+    users = 0
+    for phone_number in reader.iter_available_users():
+        user_dir = reader._user_dir(phone_number)
+        phone = phone_number.encode("ascii")
+        if len(phone) > _PHONE_WIDTH:
+            raise ValueError(f"Phone number {phone_number} exceeds {_PHONE_WIDTH} characters")
+        users += 1
+        phone_key = phone.ljust(_PHONE_WIDTH, b"\0")
+        for type_id, data_type in enumerate(DATA_TYPES):
+            file_path = user_dir / data_type
+            if file_path.is_file():
+                records.append((phone_key, type_id, file_path))
+        summary = json.dumps(reader.get_user_summary(phone_number)).encode("utf-8")
+        records.append((phone_key, summary_type_id, summary))
+    records.sort(key=lambda record: (record[0], record[1]))
+    
+    type_table = json.dumps(data_types).encode("utf-8")
+    index_size = len(records) * _INDEX_RECORD.size
+    
+    tmp_path = f"{output_path}.tmp"
+    payload_bytes = 0
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(records), len(type_table)))
+        out.write(type_table)
+        # Reserve the index, then fill it in once payload offsets are known
+        index_start = out.tell()
+        out.write(b"\0" * index_size)
+        index = bytearray()
+        for phone, type_id, source_file in records:
+            if isinstance(source_file, bytes):
+                payload = source_file
+            else:
+                with open(source_file, "rb") as f:
+                    payload = f.read()
+            index += _INDEX_RECORD.pack(phone, type_id, out.tell(), len(payload))
+            out.write(payload)
+            payload_bytes += len(payload)
+        out.seek(index_start)
+        out.write(index)
+    os.replace(tmp_path, output_path)
+    
+    return {
+        "users": users,
+        "entries": len(records) - users,
+        "summaries": users,
+        "payload_bytes": payload_bytes,
+        "snapshot_bytes": os.path.getsize(output_path)
+    }
+
+
+class SnapshotDataAccess(FIMCPDataAccess):
+    """
+    FI-MCP data access served from a memory-mapped snapshot file.
+    
+    The snapshot is mapped once on construction; each getter binary-searches
+    the on-disk index and decodes only the payload slice it needs. All
+    getters and analysis helpers of FIMCPDataAccess work unchanged.
+    """
+    
+    def __init__(
+        self,
+        snapshot_path: str,
+        cache_size: int = 128,
+        decoder: Union[str, JSONDecoder, None] = "stdlib"
+    ):
+        """
+        Open a snapshot produced by compile_snapshot.
+        
+        Args:
+            snapshot_path: Path to the snapshot file
+            cache_size: Maximum number of decoded payloads kept in memory (0 disables caching)
+            decoder: JSON decoder name or callable, as for FIMCPDataAccess
+        """
+        super().__init__(cache_size=cache_size, decoder=decoder)
+        self.snapshot_path = Path(snapshot_path)
+        self.data_dir = self.snapshot_path
+        
+        with open(self.snapshot_path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            magic, version, entry_count, table_length = _HEADER.unpack_from(self._map, 0)
+        except struct.error:
+            magic, version = b"", 0
+        if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+            self._map.close()
+            raise ValueError(f"{snapshot_path} is not a version {SNAPSHOT_VERSION} FI-MCP snapshot")
+        table_start = _HEADER.size
+        data_types = json.loads(self._map[table_start:table_start + table_length])
+        
+        self._view = memoryview(self._map)
+        self._type_ids = {name: type_id for type_id, name in enumerate(data_types)}
+        self._entry_count = entry_count
+        self._index_start = table_start + table_length
+    
+    def _worker_spec(self):
+        return SnapshotDataAccess, (str(self.snapshot_path),), {
+            "cache_size": self._cache.maxsize,
+            "decoder": self._decoder
+        }
+    
+    def close(self) -> None:
+        """
+        Release the memory mapping.
+        
+        Raises:
+            BufferError: If views returned by get_raw are still alive
+        """
+        self._view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            raise BufferError("Release the views returned by get_raw before closing the snapshot") from None
+    
+    def __enter__(self) -> "SnapshotDataAccess":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _record(self, position: int) -> Tuple[bytes, int, int, int]:
+        """Unpack the index record at a position."""
+        return _INDEX_RECORD.unpack_from(self._map, self._index_start + position * _INDEX_RECORD.size)
+    
+    def _locate(self, phone_number: str, data_type: str) -> Optional[Tuple[int, int]]:
+        """Binary-search the index for a payload's (offset, length)."""
+        type_id = self._type_ids.get(data_type)
+        phone = phone_number.encode("ascii", "ignore")
+        if type_id is None or len(phone) > _PHONE_WIDTH:
+            return None
+        target = (phone.ljust(_PHONE_WIDTH, b"\0"), type_id)
+        
+        low, high = 0, self._entry_count
+        while low < high:
+            mid = (low + high) // 2
+            phone_key, mid_type, offset, length = self._record(mid)
+            if (phone_key, mid_type) < target:
+                low = mid + 1
+            elif (phone_key, mid_type) > target:
+                high = mid
+            else:
+                return offset, length
+        return None
+    
+    def _has_data(self, phone_number: str, data_type: str) -> bool:
+        """Check whether a user has a payload in the snapshot index."""
+        return self._locate(phone_number, data_type) is not None
+    
+    def _read_data(self, phone_number: str, data_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Load data for a specific user and data type from the snapshot.
+        
+        Args:
+            phone_number: User identifier (phone number)
+            data_type: Type of data to fetch (e.g., 'fetch_net_worth.json')
+        
+        Returns:
+            Dictionary containing the data or None if not found
+        """
+        location = self._locate(phone_number, data_type)
+        if location is None:
+            return None
+        key = (phone_number, data_type)
+        found, data = self._cache.get(key, location)
+        if found:
+            return data
+        offset, length = location
+        try:
+            data = self._decode(self._map[offset:offset + length])
+        except ValueError:
+            return None
+        self._cache.put(key, location, data)
+        return data
+    
+    def _read_raw(self, phone_number: str, data_type: str) -> Optional[memoryview]:
+        """Zero-copy view of a payload slice of the mapped snapshot."""
+        location = self._locate(phone_number, data_type)
+        if location is None:
+            return None
+        offset, length = location
+        return self._view[offset:offset + length]
+    
+    def _stored_summary(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Summary packed by compile_snapshot (None for older snapshots)."""
+        return self._load_data(phone_number, SUMMARY_DATA_TYPE)
+    
+    def _user_signature(self, phone_number: str) -> Optional[Tuple[Any, ...]]:
+        """Payload locations of a user (the snapshot itself never changes)."""
+        locations = tuple(self._locate(phone_number, data_type) for data_type in DATA_TYPES)
+        return locations if any(locations) else None
+    
+    def _open_stream(self, phone_number: str, data_type: str) -> Optional[BinaryIO]:
+        """Open a payload slice of the snapshot as a binary stream."""
+        location = self._locate(phone_number, data_type)
+        if location is None:
+            return None
+        offset, length = location
+        return io.BytesIO(self._map[offset:offset + length])
+    
+    def iter_available_users(self) -> Iterator[str]:
+        """
+        Stream the phone numbers of all user personas in the snapshot.
+        
+        Yields:
+            Phone numbers in sorted order
+        """
+        previous = None
+        for position in range(self._entry_count):
+            phone = self._record(position)[0]
+            if phone != previous:
+                previous = phone
+                yield phone.rstrip(b"\0").decode("ascii")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: pack a data directory into a snapshot."""
+    parser = argparse.ArgumentParser(description="Pack an FI-MCP data directory into a snapshot file")
+    parser.add_argument("output", help="Path of the snapshot file to write")
+    parser.add_argument("--data-dir", default=None, help="Source data directory (defaults to bundled dummy data)")
+    args = parser.parse_args(argv)
+    
+    stats = compile_snapshot(args.data_dir, args.output)
+    print(f"📦 Packed {stats['entries']} files for {stats['users']} users "
+          f"into {args.output} ({stats['snapshot_bytes']:,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
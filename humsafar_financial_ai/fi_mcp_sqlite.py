@@ -0,0 +1,575 @@
+"""
+SQLite-Backed Store for FI-MCP Data
+
+Loads a test_data_dir-style tree into a local SQLite database with
+normalized, indexed tables (bank, mutual fund and stock transactions,
+credit accounts, EPF establishments and net worth assets) next to the raw
+documents. SQLiteDataAccess serves the usual FIMCPDataAccess getters from
+the stored documents and answers range queries such as "all debits over
+₹10k last month" with index lookups instead of full JSON parses. Each
+user's summary is computed during ingestion and stored as a document.
+"""
+
+import argparse
+import io
+import json
+import os
+import sqlite3
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .fi_mcp_data_access import DATA_TYPES, FIMCPDataAccess
+from .fi_mcp_decoders import JSONDecoder
+from .fi_mcp_money import money_dict_to_paise, to_paise
+from .fi_mcp_summary import SUMMARY_DATA_TYPE
+from .fi_mcp_transactions import DateLike
+
+
+SCHEMA = """
+CREATE TABLE users (
+    phone TEXT PRIMARY KEY
+);
+CREATE TABLE documents (
+    phone TEXT NOT NULL,
+    data_type TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (phone, data_type)
+);
+CREATE TABLE bank_txns (
+    phone TEXT NOT NULL,
+    bank TEXT,
+    amount_paise INTEGER,
+    narration TEXT,
+    txn_date TEXT,
+    txn_type INTEGER,
+    mode TEXT,
+    balance_paise INTEGER
+);
+CREATE INDEX idx_bank_txns_phone_date ON bank_txns (phone, txn_date);
+CREATE INDEX idx_bank_txns_phone_type ON bank_txns (phone, txn_type);
+CREATE TABLE mf_txns (
+    phone TEXT NOT NULL,
+    isin TEXT,
+    scheme_name TEXT,
+    folio_id TEXT,
+    order_type INTEGER,
+    txn_date TEXT,
+    price REAL,
+    units REAL,
+    amount REAL
+);
+CREATE INDEX idx_mf_txns_phone_date ON mf_txns (phone, txn_date);
+CREATE INDEX idx_mf_txns_phone_type ON mf_txns (phone, order_type);
+CREATE INDEX idx_mf_txns_isin ON mf_txns (isin);
+CREATE TABLE stock_txns (
+    phone TEXT NOT NULL,
+    isin TEXT,
+    txn_type INTEGER,
+    txn_date TEXT,
+    quantity REAL,
+    nav REAL
+);
+CREATE INDEX idx_stock_txns_phone_date ON stock_txns (phone, txn_date);
+CREATE INDEX idx_stock_txns_phone_type ON stock_txns (phone, txn_type);
+CREATE INDEX idx_stock_txns_isin ON stock_txns (isin);
+CREATE TABLE credit_accounts (
+    phone TEXT NOT NULL,
+    subscriber_name TEXT,
+    portfolio_type TEXT,
+    account_type TEXT,
+    account_status TEXT,
+    open_date TEXT,
+    credit_limit_paise INTEGER,
+    original_amount_paise INTEGER,
+    current_balance_paise INTEGER,
+    amount_past_due_paise INTEGER,
+    rate_of_interest REAL,
+    repayment_tenure INTEGER,
+    payment_rating TEXT
+);
+CREATE INDEX idx_credit_accounts_phone_type ON credit_accounts (phone, account_type);
+CREATE TABLE epf_establishments (
+    phone TEXT NOT NULL,
+    est_name TEXT,
+    member_id TEXT,
+    office TEXT,
+    doj_epf TEXT,
+    doe_epf TEXT,
+    net_balance_paise INTEGER,
+    employee_credit_paise INTEGER,
+    employer_credit_paise INTEGER
+);
+CREATE INDEX idx_epf_establishments_phone ON epf_establishments (phone);
+CREATE TABLE net_worth_assets (
+    phone TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    attribute TEXT,
+    value_paise INTEGER
+);
+CREATE INDEX idx_net_worth_assets_phone_type ON net_worth_assets (phone, attribute);
+"""
+
+
+def _iso_date(text: Any) -> Optional[str]:
+    """Normalize YYYY-MM-DD, YYYYMMDD and DD-MM-YYYY dates to ISO format."""
+    if not isinstance(text, str):
+        return None
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        return text
+    if len(text) == 8 and text.isdigit():
+        return f"{text[:4]}-{text[4:6]}-{text[6:]}"
+    if len(text) == 10 and text[2] == "-" and text[5] == "-":
+        return f"{text[6:]}-{text[3:5]}-{text[:2]}"
+    return None
+
+
+def _paise(value: Any) -> Optional[int]:
+    """Convert an optional rupee amount to paise, ignoring malformed values."""
+    if value is None or value == "":
+        return None
+    try:
+        return to_paise(value)
+    except ValueError:
+        return None
+
+
+def _number(value: Any, kind: type = float) -> Optional[Union[int, float]]:
+    """Convert an optional numeric string, ignoring malformed values."""
+    try:
+        return kind(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _money_paise(money: Dict[str, Any]) -> Optional[int]:
+    """Convert a {currencyCode, units, nanos} amount to paise, ignoring malformed values."""
+    try:
+        return money_dict_to_paise(money)
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalized_rows(phone: str, data_type: str, document: Dict[str, Any]) -> Dict[str, List[Tuple]]:
+    """
+    Flatten one decoded document into rows for the normalized tables.
+    
+    As in BankTransactionTable, bank rows need only their first four
+    columns; a missing mode or balance is stored as "" and 0.
+    """
+    rows: Dict[str, List[Tuple]] = {}
+    if data_type == "fetch_bank_transactions.json":
+        rows["bank_txns"] = [
+            (phone, account.get("bank"), _paise(txn[0]), txn[1], _iso_date(txn[2]), _number(txn[3], int),
+             txn[4] if len(txn) > 4 and txn[4] is not None else "",
+             _paise(txn[5]) if len(txn) > 5 and txn[5] is not None else 0)
+            for account in document.get("bankTransactions", [])
+            for txn in account.get("txns", [])
+            if len(txn) >= 4
+        ]
+    elif data_type == "fetch_mf_transactions.json":
+        rows["mf_txns"] = [
+            (phone, fund.get("isin"), fund.get("schemeName"), fund.get("folioId"),
+             _number(txn[0], int), _iso_date(txn[1]), _number(txn[2]), _number(txn[3]), _number(txn[4]))
+            for fund in document.get("mfTransactions", [])
+            for txn in fund.get("txns", [])
+            if len(txn) >= 5
+        ]
+    elif data_type == "fetch_stock_transactions.json":
+        rows["stock_txns"] = [
+            (phone, stock.get("isin"), _number(txn[0], int), _iso_date(txn[1]),
+             _number(txn[2]), _number(txn[3]) if len(txn) > 3 else None)
+            for stock in document.get("stockTransactions", [])
+            for txn in stock.get("txns", [])
+            if len(txn) >= 3
+        ]
+    elif data_type == "fetch_credit_report.json":
+        rows["credit_accounts"] = [
+            (phone, account.get("subscriberName"), account.get("portfolioType"),
+             account.get("accountType"), account.get("accountStatus"), _iso_date(account.get("openDate")),
+             _paise(account.get("creditLimitAmount")), _paise(account.get("highestCreditOrOriginalLoanAmount")),
+             _paise(account.get("currentBalance")), _paise(account.get("amountPastDue")),
+             _number(account.get("rateOfInterest")), _number(account.get("repaymentTenure"), int),
+             account.get("paymentRating"))
+            for report in document.get("creditReports", [])
+            for account in report.get("creditReportData", {}).get("creditAccount", {}).get("creditAccountDetails", [])
+        ]
+    elif data_type == "fetch_epf_details.json":
+        rows["epf_establishments"] = [
+            (phone, est.get("est_name"), est.get("member_id"), est.get("office"),
+             _iso_date(est.get("doj_epf")), _iso_date(est.get("doe_epf")),
+             _paise(est.get("pf_balance", {}).get("net_balance")),
+             _paise(est.get("pf_balance", {}).get("employee_share", {}).get("credit")),
+             _paise(est.get("pf_balance", {}).get("employer_share", {}).get("credit")))
+            for uan in document.get("uanAccounts", [])
+            for est in uan.get("rawDetails", {}).get("est_details", [])
+        ]
+    elif data_type == "fetch_net_worth.json":
+        net_worth = document.get("netWorthResponse", {})
+        rows["net_worth_assets"] = [
+            (phone, kind, item.get("netWorthAttribute"), _money_paise(item.get("value", {})))
+            for kind, key in (("asset", "assetValues"), ("liability", "liabilityValues"))
+            for item in net_worth.get(key, [])
+        ]
+    return rows
+
+
+_INSERTS = {
+    "bank_txns": "INSERT INTO bank_txns VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "mf_txns": "INSERT INTO mf_txns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "stock_txns": "INSERT INTO stock_txns VALUES (?, ?, ?, ?, ?, ?)",
+    "credit_accounts": "INSERT INTO credit_accounts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "epf_establishments": "INSERT INTO epf_establishments VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "net_worth_assets": "INSERT INTO net_worth_assets VALUES (?, ?, ?, ?)"
+}
+
+
+def ingest_sqlite(data_dir: Optional[str], db_path: str) -> Dict[str, int]:
+    """
+    🗄️ Load a test_data_dir-style tree into a new SQLite database.
+    
+    Args:
+        data_dir: Directory with one sub-directory per phone number (flat or
+            sharded layout). If None, uses the bundled dummy data.
+        db_path: Database file to create (replaced if it exists)
+    
+    Returns:
+        Dict with the number of users, documents, summaries and rows per normalized table
+    """
+    reader = FIMCPDataAccess(data_dir, cache_size=0)
+    tmp_path = f"{db_path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    
+    stats = {"users": 0, "documents": 0, "summaries": 0}
+    stats.update({table: 0 for table in _INSERTS})
+    connection = sqlite3.connect(tmp_path)
+    try:
+        connection.executescript(SCHEMA)
+        for phone in reader.iter_available_users():
+            user_dir = reader._user_dir(phone)
+            connection.execute("INSERT INTO users VALUES (?)", (phone,))
+            stats["users"] += 1
+            for data_type in DATA_TYPES:
+                file_path = user_dir / data_type
+                if not file_path.is_file():
+                    continue
+                payload = file_path.read_bytes()
+                connection.execute("INSERT INTO documents VALUES (?, ?, ?)", (phone, data_type, payload))
+                stats["documents"] += 1
+                try:
+                    document = json.loads(payload)
+                except ValueError:
+                    document = None
+                if not isinstance(document, dict):
+                    continue
+                for table, rows in _normalized_rows(phone, data_type, document).items():
+                    connection.executemany(_INSERTS[table], rows)
+                    stats[table] += len(rows)
+            # Summarized by the file backend itself, so both backends agree
+            summary = json.dumps(reader.get_user_summary(phone)).encode("utf-8")
+            connection.execute("INSERT INTO documents VALUES (?, ?, ?)", (phone, SUMMARY_DATA_TYPE, summary))
+            stats["summaries"] += 1
+        connection.commit()
+    finally:
+        connection.close()
+    os.replace(tmp_path, db_path)
+    return stats
+
+
+def _date_bound(value: Optional[DateLike]) -> Optional[str]:
+    """Convert a date bound (ISO string, date or ordinal) to an ISO string."""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return date.fromordinal(value).isoformat()
+    return value if isinstance(value, str) else value.isoformat()
+
+
+class SQLiteDataAccess(FIMCPDataAccess):
+    """
+    FI-MCP data access served from a database built by ingest_sqlite.
+    
+    The usual getters return the stored documents, while the query_* methods
+    run indexed SQL range queries over the normalized tables. Each thread
+    gets its own read-only connection.
+    """
+    
+    def __init__(
+        self,
+        db_path: str,
+        cache_size: int = 128,
+        decoder: Union[str, JSONDecoder, None] = "stdlib"
+    ):
+        """
+        Open a database produced by ingest_sqlite.
+        
+        Args:
+            db_path: Path to the SQLite database
+            cache_size: Maximum number of decoded documents kept in memory (0 disables caching)
+            decoder: JSON decoder name or callable, as for FIMCPDataAccess
+        """
+        super().__init__(cache_size=cache_size, decoder=decoder)
+        self.db_path = Path(db_path)
+        self.data_dir = self.db_path
+        if not self.db_path.is_file():
+            raise FileNotFoundError(f"SQLite database not found: {db_path}")
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+    
+    def _worker_spec(self):
+        return SQLiteDataAccess, (str(self.db_path),), {
+            "cache_size": self._cache.maxsize,
+            "decoder": self._decoder
+        }
+    
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Read-only connection for the calling thread."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            # Used by this thread only, but close() may run on another one
+            connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+    
+    def close(self) -> None:
+        """Close the connections opened by every thread."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+    
+    def __enter__(self) -> "SQLiteDataAccess":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """
+        Run a read-only SQL query against the normalized tables.
+        
+        Returns:
+            List of rows as dicts
+        """
+        return [dict(row) for row in self.connection.execute(sql, params)]
+    
+    def _has_data(self, phone_number: str, data_type: str) -> bool:
+        """Check whether a user has a stored document."""
+        row = self.connection.execute(
+            "SELECT 1 FROM documents WHERE phone = ? AND data_type = ?", (phone_number, data_type)
+        ).fetchone()
+        return row is not None
+    
+    def _read_data(self, phone_number: str, data_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Load data for a specific user and data type from the database.
+        
+        Args:
+            phone_number: User identifier (phone number)
+            data_type: Type of data to fetch (e.g., 'fetch_net_worth.json')
+        
+        Returns:
+            Dictionary containing the data or None if not found
+        """
+        row = self.connection.execute(
+            "SELECT rowid, length(payload) FROM documents WHERE phone = ? AND data_type = ?",
+            (phone_number, data_type)
+        ).fetchone()
+        if row is None:
+            return None
+        key = (phone_number, data_type)
+        signature = (row[0], row[1])
+        found, data = self._cache.get(key, signature)
+        if found:
+            return data
+        payload = self.connection.execute(
+            "SELECT payload FROM documents WHERE rowid = ?", (row[0],)
+        ).fetchone()[0]
+        try:
+            data = self._decode(payload)
+        except ValueError:
+            return None
+        self._cache.put(key, signature, data)
+        return data
+    
+    def _stored_summary(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Summary stored by ingest_sqlite."""
+        return self._load_data(phone_number, SUMMARY_DATA_TYPE)
+    
+    def _user_signature(self, phone_number: str) -> Optional[Tuple[Any, ...]]:
+        """Stored document types of a user (the database is opened read-only)."""
+        rows = self.connection.execute(
+            "SELECT data_type FROM documents WHERE phone = ? ORDER BY data_type", (phone_number,)
+        ).fetchall()
+        return tuple(row[0] for row in rows) or None
+    
+    def _read_raw(self, phone_number: str, data_type: str) -> Optional[bytes]:
+        """Read a stored document's bytes without decoding them."""
+        row = self.connection.execute(
+            "SELECT payload FROM documents WHERE phone = ? AND data_type = ?", (phone_number, data_type)
+        ).fetchone()
+        return row[0] if row is not None else None
+    
+    def _open_stream(self, phone_number: str, data_type: str) -> Optional[BinaryIO]:
+        """Open a stored document as a binary stream."""
+        row = self.connection.execute(
+            "SELECT payload FROM documents WHERE phone = ? AND data_type = ?", (phone_number, data_type)
+        ).fetchone()
+        return io.BytesIO(row[0]) if row is not None else None
+    
+    def iter_available_users(self) -> Iterator[str]:
+        """
+        Stream the phone numbers of all user personas in the database.
+        
+        Yields:
+            Phone numbers in sorted order
+        """
+        for row in self.connection.execute("SELECT phone FROM users ORDER BY phone"):
+            yield row[0]
+    
+    def _range_query(
+        self,
+        table: str,
+        columns: str,
+        phone_number: str,
+        start: Optional[DateLike],
+        end: Optional[DateLike],
+        type_column: str,
+        types: Optional[Iterable[int]],
+        extra: Sequence[Tuple[str, Any]] = ()
+    ) -> List[Dict[str, Any]]:
+        """Build and run an indexed (phone, date/type) range query."""
+        clauses, params = ["phone = ?"], [phone_number]
+        if start is not None:
+            clauses.append("txn_date >= ?")
+            params.append(_date_bound(start))
+        if end is not None:
+            clauses.append("txn_date <= ?")
+            params.append(_date_bound(end))
+        if types is not None:
+            type_list = list(types)
+            clauses.append(f"{type_column} IN ({', '.join('?' * len(type_list))})")
+            params.extend(type_list)
+        for clause, value in extra:
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        sql = f"SELECT {columns} FROM {table} WHERE {' AND '.join(clauses)} ORDER BY txn_date, rowid"
+        return self.query(sql, params)
+    
+    def query_bank_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        types: Optional[Iterable[int]] = None,
+        bank: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        🏦 Query a user's bank transactions by date range, type and amount.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive (ISO string, date or ordinal)
+            end: Latest transaction date, inclusive
+            types: Transaction type codes to keep (1: CREDIT, 2: DEBIT, ... 6: INSTALLMENT)
+            bank: Only transactions of this bank
+            min_amount: Minimum amount in rupees, inclusive
+            max_amount: Maximum amount in rupees, inclusive
+        
+        Returns:
+            List of dicts (bank, date, amount, narration, type, mode, balance) in date order
+        """
+        return self._range_query(
+            "bank_txns",
+            "bank, txn_date AS date, amount_paise / 100.0 AS amount, narration, "
+            "txn_type AS type, mode, balance_paise / 100.0 AS balance",
+            phone_number, start, end, "txn_type", types,
+            [("bank = ?", bank),
+             ("amount_paise >= ?", _paise(min_amount)),
+             ("amount_paise <= ?", _paise(max_amount))]
+        )
+    
+    def query_mf_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        order_types: Optional[Iterable[int]] = None,
+        isin: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        📈 Query a user's mutual fund transactions by date range, order type and ISIN.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive
+            end: Latest transaction date, inclusive
+            order_types: Order types to keep (1: BUY, 2: SELL)
+            isin: Only transactions of this scheme
+        
+        Returns:
+            List of dicts (isin, scheme_name, folio_id, date, order_type, price, units, amount)
+        """
+        return self._range_query(
+            "mf_txns",
+            "isin, scheme_name, folio_id, txn_date AS date, order_type, price, units, amount",
+            phone_number, start, end, "order_type", order_types,
+            [("isin = ?", isin)]
+        )
+    
+    def query_stock_transactions(
+        self,
+        phone_number: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        types: Optional[Iterable[int]] = None,
+        isin: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        📊 Query a user's stock transactions by date range, type and ISIN.
+        
+        Args:
+            phone_number: User identifier
+            start: Earliest transaction date, inclusive
+            end: Latest transaction date, inclusive
+            types: Transaction types to keep (1: BUY, 2: SELL, 3: BONUS, 4: SPLIT)
+            isin: Only transactions of this stock
+        
+        Returns:
+            List of dicts (isin, date, type, quantity, nav)
+        """
+        return self._range_query(
+            "stock_txns",
+            "isin, txn_date AS date, txn_type AS type, quantity, nav",
+            phone_number, start, end, "txn_type", types,
+            [("isin = ?", isin)]
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point: ingest a data directory into SQLite."""
+    parser = argparse.ArgumentParser(description="Load an FI-MCP data directory into a SQLite database")
+    parser.add_argument("output", help="Path of the database file to create")
+    parser.add_argument("--data-dir", default=None, help="Source data directory (defaults to bundled dummy data)")
+    args = parser.parse_args(argv)
+    
+    stats = ingest_sqlite(args.data_dir, args.output)
+    print(f"🗄️ Loaded {stats['documents']} documents for {stats['users']} users into {args.output}")
+    for table in _INSERTS:
+        print(f"  {table}: {stats[table]} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Per-User Summaries for FI-MCP Data
+
+A summary condenses one user's profile into the handful of numbers that
+dashboards and agents ask for when listing many users: which data types
+are present, profile completeness, total net worth, credit score, asset and
+liability totals and transaction counts. Summaries are small plain dicts,
+so backends can materialize them once (in memory, in a snapshot or in a
+SQLite database) and answer health lookups without touching the JSON.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from .fi_mcp_schema import SchemaError, validate_payload
+
+
+# Reserved data type under which snapshot and SQLite stores keep summaries
+SUMMARY_DATA_TYPE = "user_summary.json"
+
+# Profile field -> data availability label, in availability bit order
+AVAILABILITY_LABELS: Dict[str, str] = {
+    "net_worth": "net_worth",
+    "bank_transactions": "bank_transactions",
+    "mutual_fund_transactions": "mutual_funds",
+    "stock_transactions": "stocks",
+    "epf_details": "epf",
+    "credit_report": "credit_report"
+}
+
+
+def _view(data_type: str, payload: Any) -> Any:
+    """Validated view of a present payload, or None if it is empty or malformed."""
+    if not payload:
+        return None
+    try:
+        return validate_payload(data_type, payload)
+    except SchemaError:
+        return None
+
+
+def summarize_profile(
+    profile: Dict[str, Any],
+    available: Dict[str, bool],
+    transaction_counts: Optional[Dict[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    📋 Condense a complete profile into a per-user summary.
+    
+    Args:
+        profile: Complete profile as returned by get_complete_profile
+        available: Profile field -> whether the user has that data type
+        transaction_counts: Transaction counts per field, if already known
+            (e.g. streamed). If None, counted from the profile's payloads.
+    
+    Returns:
+        Dict containing:
+            - user_id: User identifier
+            - availability_bits: Bit i set if the i-th data type is present
+            - data_availability: Availability per data type
+            - profile_completeness: Share of data types present, in percent
+            - total_net_worth: Net worth in rupees (only with net worth data)
+            - credit_score: Bureau score (only with a credit report)
+            - total_assets / total_liabilities: Net worth breakdown totals in rupees
+            - transaction_counts: Bank, mutual fund and stock transaction counts
+    """
+    bits = 0
+    for bit, field in enumerate(AVAILABILITY_LABELS):
+        if available.get(field):
+            bits |= 1 << bit
+    
+    summary: Dict[str, Any] = {
+        "user_id": profile.get("user_id"),
+        "availability_bits": bits,
+        "data_availability": {
+            label: bool(available.get(field)) for field, label in AVAILABILITY_LABELS.items()
+        },
+        "profile_completeness": sum(bool(available.get(field)) for field in AVAILABILITY_LABELS) / 6 * 100,
+        "total_assets": 0.0,
+        "total_liabilities": 0.0
+    }
+    
+    # Malformed payloads count as present but contribute no figures
+    if profile.get("net_worth"):
+        net_worth = _view("net_worth", profile["net_worth"])
+        if net_worth is not None:
+            summary["total_net_worth"] = (net_worth.total_paise or 0) / 100
+            summary["total_assets"] = net_worth.total_assets_paise / 100
+            summary["total_liabilities"] = net_worth.total_liabilities_paise / 100
+        else:
+            summary["total_net_worth"] = 0
+    
+    if profile.get("credit_report"):
+        credit_report = _view("credit_report", profile["credit_report"])
+        summary["credit_score"] = credit_report.score if credit_report is not None else None
+    
+    counts = {}
+    for field in ("bank_transactions", "mutual_fund_transactions", "stock_transactions"):
+        if transaction_counts is not None:
+            counts[field] = transaction_counts.get(field, 0)
+            continue
+        view = _view(field, profile.get(field))
+        counts[field] = view.txn_count if view is not None else 0
+    summary["transaction_counts"] = counts
+    return summary
+
+
+def filter_summaries(
+    summaries: Iterable[Dict[str, Any]],
+    require: Optional[Iterable[str]] = None,
+    min_completeness: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    🔎 Select summaries by data availability and completeness.
+    
+    Args:
+        summaries: Summaries to filter
+        require: Profile fields the user must have (e.g. ["credit_report"])
+        min_completeness: Minimum profile completeness in percent
+    
+    Returns:
+        List of matching summaries, in input order
+    """
+    mask = 0
+    fields = list(AVAILABILITY_LABELS)
+    for field in require or ():
+        if field not in AVAILABILITY_LABELS:
+            raise ValueError(f"Unknown data types: {field}")
+        mask |= 1 << fields.index(field)
+    return [
+        summary for summary in summaries
+        if summary["availability_bits"] & mask == mask and summary["profile_completeness"] >= min_completeness
+    ]
@@ -0,0 +1,574 @@
+"""
+Transaction Helpers for FI-MCP Data
+
+fetch_bank_transactions.json stores every transaction as a list of strings
+([amount, narration, date, type, mode, balance]), so each consumer re-parses
+amounts and dates cell by cell. BankTransactionTable converts a payload once
+into typed columns (integer paise, date ordinals, interned modes and a
+narration pool) with fast filter, sum and group-by helpers for cash-flow
+analytics.
+
+iter_transaction_rows streams the nested txns arrays of bank and mutual fund
+payloads row by row from a file object, so memory stays constant however
+long the transaction history grows.
+"""
+
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from .fi_mcp_money import to_paise as _to_paise
+
+
+# Bank transaction type codes used by fetch_bank_transactions.json
+BANK_TRANSACTION_TYPES: Dict[int, str] = {
+    1: "CREDIT",
+    2: "DEBIT",
+    3: "OPENING",
+    4: "INTEREST",
+    5: "TDS",
+    6: "INSTALLMENT",
+    7: "CLOSING",
+    8: "OTHERS"
+}
+
+INFLOW_TYPES = frozenset({1, 4})
+OUTFLOW_TYPES = frozenset({2, 5, 6})
+
+DateLike = Union[date, str, int]
+
+
+def _to_ordinal(value: DateLike) -> int:
+    """Convert an ISO date string, date or ordinal to a date ordinal."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, date):
+        return value.toordinal()
+    return date.fromisoformat(value).toordinal()
+
+
+class BankTransactionTable:
+    """
+    🏦 Columnar view of a user's bank transactions.
+    
+    Columns:
+        amounts: Transaction amounts in paise (array 'q')
+        balances: Balance after each transaction in paise (array 'q')
+        dates: Transaction dates as proleptic Gregorian ordinals (array 'i')
+        types: Transaction type codes 1-8 (array 'B')
+        mode_ids / modes: Indices into the interned transaction mode list
+        narration_ids / narrations: Indices into the narration string pool
+        bank_ids / banks: Indices into the bank name list
+    """
+    
+    __slots__ = (
+        "amounts", "balances", "dates", "types",
+        "mode_ids", "modes", "narration_ids", "narrations",
+        "bank_ids", "banks"
+    )
+    
+    def __init__(self, banks: Optional[List[str]] = None, modes: Optional[List[str]] = None,
+                 narrations: Optional[List[str]] = None):
+        self.amounts = array("q")
+        self.balances = array("q")
+        self.dates = array("i")
+        self.types = array("B")
+        self.mode_ids = array("H")
+        self.narration_ids = array("I")
+        self.bank_ids = array("H")
+        self.banks: List[str] = banks if banks is not None else []
+        self.modes: List[str] = modes if modes is not None else []
+        self.narrations: List[str] = narrations if narrations is not None else []
+    
+    @classmethod
+    def from_payload(cls, payload: Optional[Dict[str, Any]]) -> "BankTransactionTable":
+        """
+        Build a table from a fetch_bank_transactions.json payload.
+        
+        The mode and balance columns are optional, as in the payload schema;
+        rows without them get mode "" and balance 0.
+        
+        Args:
+            payload: Dict as returned by get_bank_transactions (None or {} give an empty table)
+        
+        Returns:
+            BankTransactionTable with one row per transaction
+        """
+        table = cls()
+        mode_index: Dict[str, int] = {}
+        narration_index: Dict[str, int] = {}
+        date_cache: Dict[str, int] = {}
+        
+        for bank_id, account in enumerate((payload or {}).get("bankTransactions", [])):
+            table.banks.append(account.get("bank", ""))
+            for txn in account.get("txns", []):
+                amount, narration, txn_date, txn_type = txn[:4]
+                mode = txn[4] if len(txn) > 4 and txn[4] is not None else ""
+                balance = txn[5] if len(txn) > 5 and txn[5] is not None else 0
+                table.amounts.append(_to_paise(amount))
+                table.balances.append(_to_paise(balance))
+                ordinal = date_cache.get(txn_date)
+                if ordinal is None:
+                    ordinal = date_cache[txn_date] = date.fromisoformat(txn_date).toordinal()
+                table.dates.append(ordinal)
+                table.types.append(int(txn_type))
+                mode_id = mode_index.get(mode)
+                if mode_id is None:
+                    mode_id = mode_index[mode] = len(table.modes)
+                    table.modes.append(mode)
+                table.mode_ids.append(mode_id)
+                narration_id = narration_index.get(narration)
+                if narration_id is None:
+                    narration_id = narration_index[narration] = len(table.narrations)
+                    table.narrations.append(narration)
+                table.narration_ids.append(narration_id)
+                table.bank_ids.append(bank_id)
+        return table
+    
+    def __len__(self) -> int:
+        return len(self.amounts)
+    
+    def row(self, index: int) -> Tuple[float, str, str, int, str, float, str]:
+        """
+        Materialize one row.
+        
+        Returns:
+            (amount, narration, date, type, mode, balance, bank) with amounts in rupees
+        """
+        return (
+            self.amounts[index] / 100,
+            self.narrations[self.narration_ids[index]],
+            date.fromordinal(self.dates[index]).isoformat(),
+            self.types[index],
+            self.modes[self.mode_ids[index]],
+            self.balances[index] / 100,
+            self.banks[self.bank_ids[index]]
+        )
+    
+    def rows(self) -> Iterable[Tuple[float, str, str, int, str, float, str]]:
+        """Iterate over materialized rows."""
+        for index in range(len(self)):
+            yield self.row(index)
+    
+    def take(self, indices: Iterable[int]) -> "BankTransactionTable":
+        """Build a new table from selected row indices, sharing the string pools."""
+        subset = BankTransactionTable(self.banks, self.modes, self.narrations)
+        for index in indices:
+            subset.amounts.append(self.amounts[index])
+            subset.balances.append(self.balances[index])
+            subset.dates.append(self.dates[index])
+            subset.types.append(self.types[index])
+            subset.mode_ids.append(self.mode_ids[index])
+            subset.narration_ids.append(self.narration_ids[index])
+            subset.bank_ids.append(self.bank_ids[index])
+        return subset
+    
+    def select(
+        self,
+        types: Optional[Iterable[int]] = None,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        modes: Optional[Iterable[str]] = None,
+        banks: Optional[Iterable[str]] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None
+    ) -> List[int]:
+        """
+        Find row indices matching all given conditions.
+        
+        Args:
+            types: Transaction type codes to keep (e.g. [2, 6] for debits and EMIs)
+            start: Earliest date, inclusive (ISO string, date or ordinal)
+            end: Latest date, inclusive (ISO string, date or ordinal)
+            modes: Transaction modes to keep (e.g. ["UPI", "NEFT"])
+            banks: Bank names to keep
+            min_amount: Minimum amount in rupees, inclusive
+            max_amount: Maximum amount in rupees, inclusive
+        
+        Returns:
+            List of matching row indices in table order
+        """
+        type_set = set(types) if types is not None else None
+        mode_set = None
+        if modes is not None:
+            wanted_modes = set(modes)
+            mode_set = {i for i, m in enumerate(self.modes) if m in wanted_modes}
+        bank_set = None
+        if banks is not None:
+            wanted_banks = set(banks)
+            bank_set = {i for i, b in enumerate(self.banks) if b in wanted_banks}
+        low_date = _to_ordinal(start) if start is not None else None
+        high_date = _to_ordinal(end) if end is not None else None
+        low_amount = _to_paise(min_amount) if min_amount is not None else None
+        high_amount = _to_paise(max_amount) if max_amount is not None else None
+        
+        matches = []
+        for index in range(len(self.amounts)):
+            if type_set is not None and self.types[index] not in type_set:
+                continue
+            if low_date is not None and self.dates[index] < low_date:
+                continue
+            if high_date is not None and self.dates[index] > high_date:
+                continue
+            if mode_set is not None and self.mode_ids[index] not in mode_set:
+                continue
+            if bank_set is not None and self.bank_ids[index] not in bank_set:
+                continue
+            if low_amount is not None and self.amounts[index] < low_amount:
+                continue
+            if high_amount is not None and self.amounts[index] > high_amount:
+                continue
+            matches.append(index)
+        return matches
+    
+    def filter(self, **conditions: Any) -> "BankTransactionTable":
+        """
+        Build a new table with the rows matching all conditions.
+        
+        Accepts the same keyword arguments as select().
+        """
+        return self.take(self.select(**conditions))
+    
+    def total(self, indices: Optional[Sequence[int]] = None) -> float:
+        """
+        Sum transaction amounts in rupees.
+        
+        Args:
+            indices: Row indices to sum. If None, sums every row.
+        """
+        if indices is None:
+            return sum(self.amounts) / 100
+        amounts = self.amounts
+        return sum(amounts[index] for index in indices) / 100
+    
+    def _group_key(self, key: str):
+        """Return a function mapping a row index to its group key."""
+        if key == "type":
+            return lambda i: BANK_TRANSACTION_TYPES.get(self.types[i], str(self.types[i]))
+        if key == "mode":
+            return lambda i: self.modes[self.mode_ids[i]]
+        if key == "bank":
+            return lambda i: self.banks[self.bank_ids[i]]
+        if key == "date":
+            return lambda i: date.fromordinal(self.dates[i]).isoformat()
+        if key == "month":
+            months: Dict[int, str] = {}
+            
+            def month_of(i: int) -> str:
+                ordinal = self.dates[i]
+                label = months.get(ordinal)
+                if label is None:
+                    label = months[ordinal] = date.fromordinal(ordinal).strftime("%Y-%m")
+                return label
+            return month_of
+        raise ValueError(f"Unknown group key: {key}")
+    
+    def group_by(self, key: str, indices: Optional[Sequence[int]] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate transaction count and total amount per group.
+        
+        Args:
+            key: One of "type", "mode", "bank", "date" or "month"
+            indices: Row indices to aggregate. If None, uses every row.
+        
+        Returns:
+            Dict mapping group key to {"count": n, "total": rupees}
+        """
+        key_of = self._group_key(key)
+        counts: Dict[str, int] = {}
+        totals: Dict[str, int] = {}
+        for index in range(len(self)) if indices is None else indices:
+            group = key_of(index)
+            counts[group] = counts.get(group, 0) + 1
+            totals[group] = totals.get(group, 0) + self.amounts[index]
+        return {group: {"count": counts[group], "total": totals[group] / 100} for group in counts}
+    
+    def cash_flow(self, key: str = "month") -> Dict[str, Dict[str, float]]:
+        """
+        💸 Summarize inflows, outflows and net cash flow per group.
+        
+        Credits and interest count as inflows; debits, TDS and installments
+        as outflows. Opening/closing balances and other rows are ignored.
+        
+        Args:
+            key: Grouping key as accepted by group_by (default: "month")
+        
+        Returns:
+            Dict mapping group key to {"inflow", "outflow", "net"} in rupees
+        """
+        key_of = self._group_key(key)
+        inflows: Dict[str, int] = {}
+        outflows: Dict[str, int] = {}
+        for index in range(len(self)):
+            txn_type = self.types[index]
+            if txn_type in INFLOW_TYPES:
+                bucket = inflows
+            elif txn_type in OUTFLOW_TYPES:
+                bucket = outflows
+            else:
+                continue
+            group = key_of(index)
+            bucket[group] = bucket.get(group, 0) + self.amounts[index]
+        groups = sorted(set(inflows) | set(outflows))
+        return {
+            group: {
+                "inflow": inflows.get(group, 0) / 100,
+                "outflow": outflows.get(group, 0) / 100,
+                "net": (inflows.get(group, 0) - outflows.get(group, 0)) / 100
+            }
+            for group in groups
+        }
+
+
+class DateIndex:
+    """
+    📅 Transaction rows sorted by date for O(log n + k) range lookups.
+    
+    Rows keep their original order within a day.
+    """
+    
+    __slots__ = ("ordinals", "rows")
+    
+    def __init__(self, keyed_rows: Iterable[Tuple[int, Any]]):
+        """
+        Args:
+            keyed_rows: (date ordinal, row) pairs in any order
+        """
+        pairs = sorted(keyed_rows, key=lambda pair: pair[0])
+        self.ordinals = array("i", (ordinal for ordinal, _ in pairs))
+        self.rows: List[Any] = [row for _, row in pairs]
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def between(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> List[Any]:
+        """
+        Return rows dated within [start, end], both inclusive and optional.
+        """
+        low = bisect_left(self.ordinals, _to_ordinal(start)) if start is not None else 0
+        high = bisect_right(self.ordinals, _to_ordinal(end)) if end is not None else len(self.rows)
+        return self.rows[low:high]
+
+
+def _dated(value: Any) -> Optional[int]:
+    """Date ordinal of an ISO date string, or None if it is not one."""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+def mf_date_index(payload: Optional[Dict[str, Any]]) -> DateIndex:
+    """
+    Build a date index over a fetch_mf_transactions.json payload.
+    
+    Rows are dicts with isin, scheme_name, folio_id, date, order_type,
+    price, units and amount.
+    """
+    keyed_rows = []
+    for fund in (payload or {}).get("mfTransactions", []):
+        for txn in fund.get("txns", []):
+            ordinal = _dated(txn[1]) if len(txn) >= 5 else None
+            if ordinal is None:
+                continue
+            keyed_rows.append((ordinal, {
+                "isin": fund.get("isin"),
+                "scheme_name": fund.get("schemeName"),
+                "folio_id": fund.get("folioId"),
+                "date": txn[1],
+                "order_type": int(txn[0]),
+                "price": float(txn[2]),
+                "units": float(txn[3]),
+                "amount": float(txn[4])
+            }))
+    return DateIndex(keyed_rows)
+
+
+def stock_date_index(payload: Optional[Dict[str, Any]]) -> DateIndex:
+    """
+    Build a date index over a fetch_stock_transactions.json payload.
+    
+    Rows are dicts with isin, date, type, quantity and nav (None when absent).
+    """
+    keyed_rows = []
+    for stock in (payload or {}).get("stockTransactions", []):
+        for txn in stock.get("txns", []):
+            ordinal = _dated(txn[1]) if len(txn) >= 3 else None
+            if ordinal is None:
+                continue
+            keyed_rows.append((ordinal, {
+                "isin": stock.get("isin"),
+                "date": txn[1],
+                "type": int(txn[0]),
+                "quantity": float(txn[2]),
+                "nav": float(txn[3]) if len(txn) > 3 else None
+            }))
+    return DateIndex(keyed_rows)
+
+
+def bank_date_index(table: BankTransactionTable) -> DateIndex:
+    """Build a date index of row positions over a BankTransactionTable."""
+    return DateIndex((table.dates[index], index) for index in range(len(table)))
+
+
+class _JSONStream:
+    """
+    Minimal pull parser over a text stream.
+    
+    Containers are walked incrementally with iter_object/iter_array while
+    leaf values (and small containers such as a single transaction row) are
+    decoded with json.JSONDecoder.raw_decode from a bounded buffer.
+    """
+    
+    _WHITESPACE = " \t\r\n"
+    
+    def __init__(self, stream: TextIO, chunk_size: int = 65536):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+    
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping already consumed text."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at end of input)."""
+        while True:
+            buffer, position = self._buffer, self._pos
+            while position < len(buffer) and buffer[position] in self._WHITESPACE:
+                position += 1
+            self._pos = position
+            if position < len(buffer):
+                return buffer[position]
+            if not self._fill():
+                return ""
+    
+    def expect(self, char: str) -> None:
+        """Consume the next non-whitespace character, which must be char."""
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' but found '{found or 'end of input'}'")
+        self._pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+    
+    def iter_object(self) -> Iterator[str]:
+        """Walk an object, yielding each key; the caller must consume its value."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' but found '{separator or 'end of input'}'")
+    
+    def iter_array(self) -> Iterator[None]:
+        """Walk an array, yielding once per element; the caller must consume it."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            separator = self.peek()
+            self._pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' but found '{separator or 'end of input'}'")
+    
+    def skip(self) -> None:
+        """Consume the next value without materializing large containers."""
+        char = self.peek()
+        if char == "{":
+            for _ in self.iter_object():
+                self.skip()
+        elif char == "[":
+            for _ in self.iter_array():
+                self.skip()
+        else:
+            self.value()
+
+
+def iter_transaction_rows(
+    stream: TextIO,
+    collection_key: str,
+    label_key: str,
+    label: Optional[str] = None,
+    chunk_size: int = 65536
+) -> Iterator[Tuple[Any, List[Any]]]:
+    """
+    Stream (label, txn) pairs from a bank or mutual fund transactions document.
+    
+    Only one transaction row is decoded at a time, so memory use does not
+    depend on the length of the history. Accounts whose txns array appears
+    before their label key are buffered per account.
+    
+    Args:
+        stream: Text stream positioned at the start of the JSON document
+        collection_key: "bankTransactions" or "mfTransactions"
+        label_key: Per-account key to report and filter on ("bank" or "isin")
+        label: Only yield rows of accounts with this label. If None, yields all.
+        chunk_size: Number of characters read from the stream at a time
+    
+    Yields:
+        (label, txn) tuples where txn is the raw transaction row
+    
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    parser = _JSONStream(stream, chunk_size)
+    for key in parser.iter_object():
+        if key != collection_key:
+            parser.skip()
+            continue
+        for _ in parser.iter_array():
+            account_label = None
+            buffered: Optional[List[List[Any]]] = None
+            for field in parser.iter_object():
+                if field == label_key:
+                    account_label = parser.value()
+                elif field == "txns" and account_label is None:
+                    buffered = [parser.value() for _ in parser.iter_array()]
+                elif field == "txns" and (label is None or account_label == label):
+                    for _ in parser.iter_array():
+                        yield account_label, parser.value()
+                else:
+                    parser.skip()
+            if buffered and (label is None or account_label == label):
+                for txn in buffered:
+                    yield account_label, txn
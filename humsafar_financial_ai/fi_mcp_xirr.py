@@ -0,0 +1,266 @@
+"""
+Mutual Fund XIRR for FI-MCP Data
+
+Recomputes XIRR from the raw fetch_mf_transactions cashflows, per folio
+(one scheme in one folio) and for the whole portfolio, and cross-checks
+it against the XIRR reported in the net worth's mfSchemeAnalytics.
+
+Purchases are outflows and redemptions inflows; each folio is closed with
+its current value on the valuation date. The current value comes from the
+scheme analytics (split across folios of the same scheme by units held),
+or else is the units held at the NAV of the latest transaction.
+
+Every solve is warm-started: a folio from its reported XIRR or the
+previous folio's result, the portfolio from the value-weighted folio
+results. mutual_fund_xirr_for_users streams every user's profile for
+nightly runs.
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .fi_mcp_data_access import FIMCPDataAccess, get_data_access
+from .fi_mcp_schema import MFTransactionsView, NetWorthView, validate_payload
+from .finance_xirr import xirr
+
+
+# mfTransactions orderType codes
+MF_BUY = 1
+MF_SELL = 2
+
+# Profile fields the XIRR is computed from
+XIRR_DATA_TYPES = ("mutual_fund_transactions", "net_worth")
+
+DEFAULT_XIRR_GUESS = 10.0
+
+
+def _scheme_analytics(net_worth: Optional[NetWorthView]) -> Dict[str, Tuple[int, List[float]]]:
+    """ISIN -> (current value in paise, reported XIRRs) over the scheme analytics."""
+    analytics: Dict[str, Tuple[int, List[float]]] = {}
+    if net_worth is None:
+        return analytics
+    for scheme in net_worth.schemes:
+        if not scheme.isin:
+            continue
+        current, reported = analytics.get(scheme.isin, (0, []))
+        if scheme.xirr is not None:
+            reported.append(scheme.xirr)
+        analytics[scheme.isin] = (current + (scheme.current_paise or 0), reported)
+    return analytics
+
+
+def _solve(amounts: List[float], dates: List[date], guess: float) -> Optional[float]:
+    try:
+        return xirr(amounts, dates, guess)
+    except ValueError:
+        return None
+
+
+def mutual_fund_xirr(
+    mf_transactions: Union[Dict[str, Any], MFTransactionsView],
+    net_worth: Optional[Union[Dict[str, Any], NetWorthView]] = None,
+    valuation_date: Optional[date] = None,
+    tolerance: float = 1.0
+) -> Dict[str, Any]:
+    """
+    📈 Per-folio and portfolio XIRR of mutual fund transactions.
+    
+    Args:
+        mf_transactions: fetch_mf_transactions payload or its validated view
+        net_worth: fetch_net_worth payload or view, for current values and
+            the reported XIRR. If None, folios are valued at their latest NAV.
+        valuation_date: Date of the current values (default: today)
+        tolerance: Largest difference from the reported XIRR, in percentage
+            points, that counts as a match (default: 1.0)
+    
+    Returns:
+        Dict containing:
+            - valuation_date: ISO valuation date
+            - folios: Per folio isin, scheme_name, folio_id, invested,
+              redeemed, current_value, value_source ("analytics" or
+              "latest_nav"), xirr, reported_xirr, xirr_difference and
+              matches_reported (None when there is nothing to compare)
+            - portfolio: invested, redeemed, current_value, xirr and the
+              current-value weighted reported_xirr
+            - mismatches: Number of folios differing from the reported XIRR
+        XIRRs are percentages; None when the cashflows have no solution.
+    
+    Raises:
+        SchemaError: If a payload is malformed
+        ValueError: If a transaction is dated after the valuation date
+    """
+    if not isinstance(mf_transactions, MFTransactionsView):
+        mf_transactions = validate_payload("mutual_fund_transactions", mf_transactions)
+    if net_worth is not None and not isinstance(net_worth, NetWorthView):
+        net_worth = validate_payload("net_worth", net_worth)
+    if valuation_date is None:
+        valuation_date = date.today()
+    analytics = _scheme_analytics(net_worth)
+    
+    # Units held per folio, and per scheme to split the scheme's current value
+    held = []
+    scheme_units: Dict[Optional[str], float] = {}
+    for fund in mf_transactions.funds:
+        units = sum(txn.units if txn.order_type == MF_BUY else -txn.units
+                    for txn in fund.txns if txn.order_type in (MF_BUY, MF_SELL))
+        held.append(units)
+        scheme_units[fund.isin] = scheme_units.get(fund.isin, 0.0) + max(units, 0.0)
+    
+    folios = []
+    portfolio_amounts: List[float] = []
+    portfolio_dates: List[date] = []
+    guess = DEFAULT_XIRR_GUESS
+    mismatches = 0
+    for fund, units in zip(mf_transactions.funds, held):
+        amounts = []
+        dates = []
+        invested = redeemed = 0.0
+        for txn in fund.txns:
+            if txn.date > valuation_date:
+                raise ValueError(f"Transaction of {txn.date.isoformat()} is after the valuation date")
+            if txn.order_type == MF_BUY:
+                invested += txn.amount
+                amounts.append(-txn.amount)
+            elif txn.order_type == MF_SELL:
+                redeemed += txn.amount
+                amounts.append(txn.amount)
+            else:
+                continue
+            dates.append(txn.date)
+        
+        scheme_value, reported = analytics.get(fund.isin, (0, []))
+        if fund.isin in analytics:
+            value_source = "analytics"
+            share = max(units, 0.0) / scheme_units[fund.isin] if scheme_units[fund.isin] > 0 else 0.0
+            current_value = scheme_value / 100 * share
+        else:
+            value_source = "latest_nav"
+            latest = max(fund.txns, key=lambda txn: txn.date, default=None)
+            current_value = max(units, 0.0) * latest.nav if latest is not None else 0.0
+        if current_value > 0:
+            amounts.append(current_value)
+            dates.append(valuation_date)
+        portfolio_amounts += amounts
+        portfolio_dates += dates
+        
+        # A single reported XIRR per scheme is comparable; repeats are per holding
+        reported_xirr = reported[0] if len(reported) == 1 else None
+        folio_xirr = _solve(amounts, dates, reported_xirr if reported_xirr is not None else guess)
+        if folio_xirr is not None:
+            guess = folio_xirr
+        difference = None
+        matches = None
+        if folio_xirr is not None and reported_xirr is not None:
+            difference = folio_xirr - reported_xirr
+            matches = abs(difference) <= tolerance
+            mismatches += not matches
+        
+        folios.append({
+            "isin": fund.isin,
+            "scheme_name": fund.scheme_name,
+            "folio_id": fund.folio_id,
+            "invested": round(invested, 2),
+            "redeemed": round(redeemed, 2),
+            "current_value": round(current_value, 2),
+            "value_source": value_source,
+            "xirr": round(folio_xirr, 2) if folio_xirr is not None else None,
+            "reported_xirr": round(reported_xirr, 2) if reported_xirr is not None else None,
+            "xirr_difference": round(difference, 2) if difference is not None else None,
+            "matches_reported": matches
+        })
+    
+    # Warm-start the portfolio from the value-weighted folio results
+    weighted = [(folio["xirr"], folio["current_value"]) for folio in folios
+                if folio["xirr"] is not None and folio["current_value"] > 0]
+    total_weight = sum(weight for _, weight in weighted)
+    if total_weight > 0:
+        guess = sum(rate * weight for rate, weight in weighted) / total_weight
+    portfolio_xirr = _solve(portfolio_amounts, portfolio_dates, guess)
+    
+    reported_value = 0
+    reported_weighted = 0.0
+    if net_worth is not None:
+        for scheme in net_worth.schemes:
+            if scheme.xirr is not None and scheme.current_paise:
+                reported_weighted += scheme.xirr * scheme.current_paise
+                reported_value += scheme.current_paise
+    
+    return {
+        "icon": "📈",
+        "valuation_date": valuation_date.isoformat(),
+        "folios": folios,
+        "portfolio": {
+            "invested": round(sum(folio["invested"] for folio in folios), 2),
+            "redeemed": round(sum(folio["redeemed"] for folio in folios), 2),
+            "current_value": round(sum(folio["current_value"] for folio in folios), 2),
+            "xirr": round(portfolio_xirr, 2) if portfolio_xirr is not None else None,
+            "reported_xirr": round(reported_weighted / reported_value, 2) if reported_value > 0 else None
+        },
+        "mismatches": mismatches
+    }
+
+
+def user_mutual_fund_xirr(
+    phone_number: str,
+    valuation_date: Optional[date] = None,
+    tolerance: float = 1.0,
+    data_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    📈 Mutual fund XIRR of one user (see mutual_fund_xirr).
+    
+    Returns:
+        mutual_fund_xirr result, or None if the user has no mutual fund transactions
+    """
+    accessor = get_data_access(data_dir)
+    mf_transactions = accessor.get_view(phone_number, "mutual_fund_transactions")
+    if mf_transactions is None:
+        return None
+    net_worth = accessor.get_view(phone_number, "net_worth")
+    return mutual_fund_xirr(mf_transactions, net_worth, valuation_date, tolerance)
+
+
+def mutual_fund_xirr_for_users(
+    data_dir: Optional[str] = None,
+    accessor: Optional[FIMCPDataAccess] = None,
+    phone_numbers: Optional[Iterable[str]] = None,
+    valuation_date: Optional[date] = None,
+    tolerance: float = 1.0,
+    workers: int = 1
+) -> Dict[str, Dict[str, Any]]:
+    """
+    🌙 Mutual fund XIRR of every user, for nightly runs.
+    
+    Only the mutual fund transactions and net worth are loaded, streamed
+    through get_profiles. Users without mutual fund transactions are skipped.
+    A user whose data cannot be priced (a malformed payload or a transaction
+    after the valuation date) gets an error entry and the run continues.
+    
+    Args:
+        data_dir: Data directory to scan. If None, uses the bundled dummy data.
+        accessor: Backend to scan (e.g. a SnapshotDataAccess). Overrides data_dir.
+        phone_numbers: Users to compute. If None, uses every available user.
+        valuation_date: Date of the current values (default: today)
+        tolerance: Largest difference from the reported XIRR counted as a match
+        workers: Number of pool workers loading profiles
+    
+    Returns:
+        Dict mapping phone number to its mutual_fund_xirr result, sorted by
+        phone number. Users that failed map to {"icon": "📈", "error": message}.
+    """
+    if accessor is None:
+        accessor = get_data_access(data_dir)
+    if valuation_date is None:
+        valuation_date = date.today()
+    results = {}
+    for phone_number, profile in accessor.get_profiles(phone_numbers, data_types=XIRR_DATA_TYPES, workers=workers):
+        if not profile.get("mutual_fund_transactions"):
+            continue
+        try:
+            results[phone_number] = mutual_fund_xirr(
+                profile["mutual_fund_transactions"], profile.get("net_worth"), valuation_date, tolerance
+            )
+        except ValueError as e:
+            # SchemaError is a ValueError too
+            results[phone_number] = {"icon": "📈", "error": str(e)}
+    return dict(sorted(results.items()))
@@ -0,0 +1,201 @@
+"""
+Loan Amortization Schedules
+
+One amortization engine shared by the loan calculators. amortization_schedule
+yields the month-by-month schedule lazily, so a 30-year loan can be paged
+with itertools.islice without building 360 rows, and supports:
+
+    moratorium    no payments for the first months; interest accrues on the
+                  principal (simple interest) and is capitalized when
+                  repayment starts
+    prepayments   lump sums paid after a month's instalment
+    rate resets   a new annual rate from a given month on (floating rates)
+
+After a prepayment or rate reset either the tenure adjusts (the EMI is
+kept) or the EMI is recomputed over the remaining scheduled months.
+amortization_table collects a schedule into compact array columns.
+"""
+
+import math
+from array import array
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional
+
+
+# Float drift below half a paisa settles the loan in the final instalment
+_SETTLE_TOLERANCE = 0.005
+
+ADJUST_MODES = ("tenure", "emi")
+
+
+def _emi(principal: float, monthly_rate: float, months: int) -> float:
+    """
+    EMI of a fully amortizing loan: P * r * (1+r)^n / [(1+r)^n - 1].
+    
+    The growth factor is computed once; interest-free loans repay the
+    principal in equal instalments.
+    """
+    if monthly_rate == 0:
+        return principal / months
+    growth = (1 + monthly_rate) ** months
+    return principal * monthly_rate * growth / (growth - 1)
+
+
+def loan_tenure_months(principal: float, annual_interest_rate: float, emi: float) -> int:
+    """
+    Months needed to repay a principal with a fixed EMI (the last instalment may be smaller).
+    
+    Raises:
+        ValueError: If the EMI does not cover the monthly interest
+    """
+    monthly_rate = annual_interest_rate / 100 / 12
+    if emi <= principal * monthly_rate:
+        raise ValueError("EMI does not cover the monthly interest")
+    if principal <= 0:
+        return 0
+    if monthly_rate == 0:
+        months = principal / emi
+    else:
+        months = -math.log1p(-principal * monthly_rate / emi) / math.log1p(monthly_rate)
+    # Ignore float noise just above a whole number of months
+    return math.ceil(months - 1e-9)
+
+
+class ScheduleRow(NamedTuple):
+    """One month of an amortization schedule (amounts in rupees)."""
+    month: int
+    rate: float
+    opening_balance: float
+    payment: float
+    interest: float
+    principal: float
+    prepayment: float
+    closing_balance: float
+
+
+def amortization_schedule(
+    principal: float,
+    annual_interest_rate: float,
+    tenure_months: Optional[int] = None,
+    emi: Optional[float] = None,
+    moratorium_months: int = 0,
+    prepayments: Optional[Mapping[int, float]] = None,
+    rate_resets: Optional[Mapping[int, float]] = None,
+    adjust: str = "tenure"
+) -> Iterator[ScheduleRow]:
+    """
+    📅 Loan Amortization Schedule
+    
+    Yields the schedule month by month until the loan is repaid.
+    
+    Args:
+        principal: Loan principal amount
+        annual_interest_rate: Annual interest rate (as percentage)
+        tenure_months: Loan tenure in months, including the moratorium.
+            If None, it follows from the EMI.
+        emi: Fixed EMI. If None, it is computed from the tenure when
+            repayment starts.
+        moratorium_months: Initial months without payments (default: 0)
+        prepayments: Month (1-based) -> lump sum paid after that month's instalment
+        rate_resets: Month (1-based) -> annual interest rate from that month on
+        adjust: After a prepayment or rate reset, "tenure" keeps the EMI and
+            shortens or extends the loan; "emi" recomputes the EMI over the
+            remaining scheduled months
+    
+    Returns:
+        Iterator of ScheduleRow (month, rate, opening_balance, payment,
+        interest, principal, prepayment, closing_balance). During the
+        moratorium, interest is accrued rather than paid and the balances
+        include the accrued interest.
+    
+    Raises:
+        ValueError: On invalid arguments, immediately; or while iterating,
+            if a rate reset leaves a kept EMI below the monthly interest
+    """
+    if adjust not in ADJUST_MODES:
+        raise ValueError(f"adjust must be one of {', '.join(ADJUST_MODES)}")
+    if moratorium_months < 0:
+        raise ValueError("moratorium_months cannot be negative")
+    if tenure_months is None:
+        if emi is None:
+            raise ValueError("Either tenure_months or emi is required")
+        # Balance after a moratorium of simple interest, before any prepayment
+        capitalized = principal * (1 + annual_interest_rate / 100 / 12 * moratorium_months)
+        tenure_months = moratorium_months + loan_tenure_months(capitalized, annual_interest_rate, emi)
+    elif tenure_months <= moratorium_months:
+        raise ValueError("tenure_months must be longer than the moratorium")
+    return _schedule_rows(principal, annual_interest_rate, tenure_months, emi, moratorium_months,
+                          prepayments or {}, rate_resets or {}, adjust)
+
+
+def _schedule_rows(
+    balance: float,
+    rate: float,
+    end: int,
+    emi: Optional[float],
+    moratorium_months: int,
+    prepayments: Mapping[int, float],
+    rate_resets: Mapping[int, float],
+    adjust: str
+) -> Iterator[ScheduleRow]:
+    """Generate the rows of a validated schedule; end is the last scheduled month."""
+    monthly_rate = rate / 100 / 12
+    accrued = 0.0
+    if emi is None and moratorium_months == 0:
+        emi = _emi(balance, monthly_rate, end)
+    
+    month = 0
+    while balance > 0:
+        month += 1
+        if month in rate_resets:
+            rate = rate_resets[month]
+            monthly_rate = rate / 100 / 12
+            if adjust == "emi" and month > moratorium_months:
+                emi = _emi(balance, monthly_rate, max(end - month + 1, 1))
+        
+        opening = balance + accrued
+        interest = balance * monthly_rate
+        
+        if month <= moratorium_months:
+            accrued += interest
+            if month == moratorium_months:
+                balance += accrued
+                accrued = 0.0
+            prepayment = min(prepayments.get(month, 0.0), balance)
+            balance -= prepayment
+            if month == moratorium_months and emi is None:
+                emi = _emi(balance, monthly_rate, end - month)
+            yield ScheduleRow(month, rate, opening, 0.0, interest, 0.0, prepayment, balance + accrued)
+            continue
+        
+        if balance + interest <= emi + _SETTLE_TOLERANCE:
+            payment = balance + interest
+        elif emi <= interest:
+            raise ValueError(f"EMI no longer covers the monthly interest in month {month}")
+        else:
+            payment = emi
+        repaid = payment - interest
+        balance = max(balance - repaid, 0.0)
+        
+        prepayment = min(prepayments.get(month, 0.0), balance)
+        balance -= prepayment
+        if prepayment and adjust == "emi" and balance > 0:
+            emi = _emi(balance, monthly_rate, max(end - month, 1))
+        yield ScheduleRow(month, rate, opening, payment, interest, repaid, prepayment, balance)
+
+
+def amortization_table(*args: Any, **kwargs: Any) -> Dict[str, array]:
+    """
+    📊 Collect an amortization schedule into columns.
+    
+    Takes the arguments of amortization_schedule.
+    
+    Returns:
+        Dict mapping each ScheduleRow field to an array column
+        (month as array('i'), amounts and rates as array('d'))
+    """
+    columns = {name: array("i" if name == "month" else "d") for name in ScheduleRow._fields}
+    appends = [columns[name].append for name in ScheduleRow._fields]
+    for row in amortization_schedule(*args, **kwargs):
+        for append, value in zip(appends, row):
+            append(value)
+    return columns
@@ -0,0 +1,180 @@
+"""
+Batch Loan Pricing
+
+The EMI calculators in finance_calculators price one loan per call and
+return one dict per result. Offer pages price thousands of (amount, rate,
+tenure) combinations at once, so batch_emi_calculator takes sequences (or
+arrays) of inputs and returns struct-of-arrays results: one column per
+output field instead of one dict per loan.
+
+NumPy is used when installed; otherwise columns are stdlib array('d')
+objects and the EMI factor is computed once per distinct (rate, tenure)
+pair, which is what an offer grid repeats most.
+"""
+
+from array import array
+from itertools import product
+from typing import Any, Dict, List, Sequence, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+from .finance_amortization import _emi
+
+
+Numbers = Union[float, Sequence[float], Any]
+
+# Installed batch backends, fastest first
+BATCH_BACKENDS: List[str] = (["numpy"] if numpy is not None else []) + ["array"]
+
+# Fee terms of the single-loan calculators, as keyword arguments for batch_emi_calculator
+EMI_CALCULATOR_TERMS: Dict[str, Dict[str, float]] = {
+    "personal_loan_emi_calculator": {"processing_fee_percent": 1.0},
+    "marriage_loan_emi_calculator": {"processing_fee_percent": 1.0},
+    "home_renovation_emi_calculator": {"processing_fee_percent": 0.5},
+    "axis_bank_personal_loan_calculator": {"processing_fee_percent": 2.0, "insurance_premium_percent": 0.5},
+    "icici_bank_personal_loan_emi_calculator": {"processing_fee_percent": 2.5, "fixed_charges": 5000},
+    "hdfc_bank_personal_loan_calculator": {"processing_fee_percent": 2.5}
+}
+
+_OUTPUT_COLUMNS = ("emi", "total_payment", "total_interest", "processing_fee", "total_cost")
+
+
+def _resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return BATCH_BACKENDS[0]
+    if backend not in BATCH_BACKENDS:
+        available = ", ".join(BATCH_BACKENDS)
+        raise ValueError(f"Batch backend '{backend}' is not installed (available: {available})")
+    return backend
+
+
+def _as_list(values: Numbers) -> List[float]:
+    """A scalar as a one-element list, any other iterable as a list."""
+    if isinstance(values, (int, float)):
+        return [values]
+    return list(values)
+
+
+def _broadcast(columns: List[List[float]], grid: bool) -> List[List[float]]:
+    """Pair up input columns element-wise (scalars repeat) or as a cartesian product."""
+    if grid:
+        return [list(column) for column in zip(*product(*columns))] or [[] for _ in columns]
+    length = max(len(column) for column in columns)
+    for column in columns:
+        if len(column) not in (1, length):
+            raise ValueError("All input sequences must have the same length")
+    return [column * length if len(column) == 1 else column for column in columns]
+
+
+def batch_emi_calculator(
+    loan_amounts: Numbers,
+    annual_interest_rates: Numbers,
+    tenure_months: Numbers,
+    processing_fee_percent: float = 1.0,
+    insurance_premium_percent: float = 0.0,
+    fixed_charges: float = 0.0,
+    grid: bool = False,
+    backend: str = "auto"
+) -> Dict[str, Any]:
+    """
+    🧮 Batch EMI Calculator
+    
+    Prices many loans in one call. Inputs are scalars, sequences or arrays:
+    sequences are paired element-wise (scalars repeat), or combined into
+    every (amount, rate, tenure) combination with grid=True. Results match
+    the single-loan calculators before their rounding to 2 decimals; the
+    fee terms of each calculator are in EMI_CALCULATOR_TERMS.
+    
+    Args:
+        loan_amounts: Loan principal amounts
+        annual_interest_rates: Annual interest rates (as percentage)
+        tenure_months: Loan tenures in months
+        processing_fee_percent: Processing fee as percentage of loan amount (default: 1.0%)
+        insurance_premium_percent: Insurance premium as percentage of loan amount (default: 0%)
+        fixed_charges: Flat charges per loan, e.g. documentation (default: 0)
+        grid: Price the cartesian product of the inputs (amount-major order)
+        backend: "numpy", "array" (stdlib) or "auto" for the fastest installed
+    
+    Returns:
+        Dict containing:
+            - count: Number of loans priced
+            - backend: Backend used
+            - loan_amount, annual_interest_rate, tenure_months: Input columns
+            - emi: Monthly EMI amounts
+            - total_payment: Total amounts to be paid
+            - total_interest: Total interest paid
+            - processing_fee: Processing fee amounts
+            - total_cost: Total cost including all fees and charges
+        Columns are numpy arrays or array('d') objects of equal length.
+    
+    Raises:
+        ValueError: If sequence lengths differ, a tenure is not positive or
+            the backend is not installed
+    """
+    backend = _resolve_backend(backend)
+    fee_rate = processing_fee_percent / 100
+    insurance_rate = insurance_premium_percent / 100
+    
+    if backend == "numpy":
+        inputs = [numpy.atleast_1d(numpy.asarray(values, dtype=numpy.float64)).ravel()
+                  for values in (loan_amounts, annual_interest_rates, tenure_months)]
+        if grid:
+            inputs = [column.ravel() for column in numpy.meshgrid(*inputs, indexing="ij")]
+        amounts, rates, months = (column.copy() for column in numpy.broadcast_arrays(*inputs))
+        if (months <= 0).any():
+            raise ValueError("tenure_months must be positive")
+        monthly_rate = rates / 100 / 12
+        growth = numpy.power(1 + monthly_rate, months)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            factor = numpy.where(monthly_rate == 0, 1 / months, monthly_rate * growth / (growth - 1))
+        emi = amounts * factor
+        total_payment = emi * months
+        processing_fee = amounts * fee_rate
+        columns = {
+            "emi": emi,
+            "total_payment": total_payment,
+            "total_interest": total_payment - amounts,
+            "processing_fee": processing_fee,
+            "total_cost": total_payment + processing_fee + amounts * insurance_rate + fixed_charges
+        }
+        count = len(amounts)
+    else:
+        amounts, rates, months = _broadcast(
+            [_as_list(loan_amounts), _as_list(annual_interest_rates), _as_list(tenure_months)], grid
+        )
+        columns = {name: array("d") for name in _OUTPUT_COLUMNS}
+        append_emi = columns["emi"].append
+        append_payment = columns["total_payment"].append
+        append_interest = columns["total_interest"].append
+        append_fee = columns["processing_fee"].append
+        append_cost = columns["total_cost"].append
+        factors: Dict[Any, float] = {}
+        for amount, rate, tenure in zip(amounts, rates, months):
+            factor = factors.get((rate, tenure))
+            if factor is None:
+                if tenure <= 0:
+                    raise ValueError("tenure_months must be positive")
+                factor = factors[(rate, tenure)] = _emi(1.0, rate / 100 / 12, tenure)
+            emi = amount * factor
+            total_payment = emi * tenure
+            processing_fee = amount * fee_rate
+            append_emi(emi)
+            append_payment(total_payment)
+            append_interest(total_payment - amount)
+            append_fee(processing_fee)
+            append_cost(total_payment + processing_fee + amount * insurance_rate + fixed_charges)
+        amounts, rates, months = (array("d", column) for column in (amounts, rates, months))
+        count = len(amounts)
+    
+    return {
+        "icon": "🧮",
+        "count": count,
+        "backend": backend,
+        "loan_amount": amounts,
+        "annual_interest_rate": rates,
+        "tenure_months": months,
+        **columns
+    }
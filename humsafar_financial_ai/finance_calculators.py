@@ -10,6 +10,17 @@ integration with LLM workflows.
 import math
 from typing import Dict, List, Optional, Union
 
+from .finance_amortization import _emi, amortization_schedule, amortization_table
+
+
+def _schedule_output(*args, **kwargs) -> Dict[str, List[float]]:
+    """Amortization schedule as JSON-friendly columns rounded to 2 decimals."""
+    table = amortization_table(*args, **kwargs)
+    return {
+        name: list(column) if name == "month" else [round(value, 2) for value in column]
+        for name, column in table.items()
+    }
+
 
 def emergency_funds_calculator(
     monthly_expenses: float,
@@ -200,7 +211,7 @@ def rent_vs_buy_calculator(
     # EMI calculation
     monthly_rate = home_loan_rate / 100 / 12
     months = loan_tenure_years * 12
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** months / ((1 + monthly_rate) ** months - 1)
+    emi = _emi(loan_amount, monthly_rate, months)
     
     # Total buying costs
     total_emi_paid = emi * months
@@ -238,6 +249,59 @@ def rent_vs_buy_calculator(
     }
 
 
+def _geometric_series(ratio_minus_one: float, terms: int) -> float:
+    """Sum of (1 + x)^k for k = 0 .. terms - 1, accurate for x near 0."""
+    if ratio_minus_one == 0:
+        return float(terms)
+    if ratio_minus_one <= -1:
+        return ((1 + ratio_minus_one) ** terms - 1) / ratio_minus_one
+    return math.expm1(terms * math.log1p(ratio_minus_one)) / ratio_minus_one
+
+
+def step_up_contributions(
+    monthly_contribution: float,
+    annual_return: float,
+    years: int,
+    step_up_percent: float = 0.0
+) -> Dict[str, float]:
+    """
+    📶 Step-Up Contribution Projection
+    
+    Projects monthly contributions made at the start of each month, growing
+    by a fixed percentage every year and compounding monthly. Computed in
+    closed form as geometric series (constant time, whatever the horizon).
+    
+    Args:
+        monthly_contribution: Monthly contribution in the first year
+        annual_return: Expected annual return (as percentage, compounded monthly)
+        years: Contribution period in years
+        step_up_percent: Annual increase of the contribution (as percentage)
+        
+    Returns:
+        Dict containing:
+            - total_contributed: Sum of all contributions
+            - future_value: Corpus at the end of the period
+    """
+    monthly_rate = annual_return / 100 / 12
+    step_up = step_up_percent / 100
+    # Year-end value of one unit contributed at the start of each month of a year
+    year_factor = (1 + monthly_rate) * _geometric_series(monthly_rate, 12)
+    annual_growth = math.expm1(12 * math.log1p(monthly_rate))
+    
+    # Contribution of year y grows for the remaining (years - 1 - y) years:
+    # sum over y of step^y * growth^(years - 1 - y) = growth^(years - 1) * sum (step / growth)^y
+    future_value = 0.0
+    if years > 0:
+        future_value = (monthly_contribution * year_factor * (1 + annual_growth) ** (years - 1)
+                        * _geometric_series((step_up - annual_growth) / (1 + annual_growth), years))
+    total_contributed = monthly_contribution * 12 * _geometric_series(step_up, years)
+    
+    return {
+        "total_contributed": total_contributed,
+        "future_value": future_value
+    }
+
+
 def mutual_fund_sip_calculator(
     monthly_investment: float,
     annual_return: float,
@@ -263,20 +327,9 @@ def mutual_fund_sip_calculator(
             - monthly_return: Average monthly return
             - annual_return_rate: Effective annual return rate
     """
-    monthly_rate = annual_return / 100 / 12
-    total_invested = 0
-    maturity_amount = 0
-    current_sip = monthly_investment
-    
-    for year in range(investment_period_years):
-        for month in range(12):
-            total_invested += current_sip
-            # Calculate future value of this SIP payment
-            remaining_months = (investment_period_years - year) * 12 - month
-            maturity_amount += current_sip * (1 + monthly_rate) ** remaining_months
-        
-        # Step up SIP amount for next year
-        current_sip *= (1 + step_up_percent / 100)
+    projection = step_up_contributions(monthly_investment, annual_return, investment_period_years, step_up_percent)
+    total_invested = projection["total_contributed"]
+    maturity_amount = projection["future_value"]
     
     capital_gains = maturity_amount - total_invested
     monthly_return = capital_gains / (investment_period_years * 12)
@@ -534,29 +587,11 @@ def epf_calculator(
             - maturity_amount: EPF maturity amount with interest
             - monthly_pension: Estimated monthly pension (EPS)
     """
-    monthly_rate = epf_interest_rate / 100 / 12
-    total_employee_contribution = 0
-    total_employer_contribution = 0
-    maturity_amount = 0
-    current_basic = monthly_basic
-    
-    for year in range(years_of_service):
-        # Monthly contributions for this year
-        monthly_employee_contribution = current_basic * employee_contribution_percent / 100
-        monthly_employer_contribution = current_basic * employer_contribution_percent / 100
-        
-        # Add contributions for 12 months
-        for month in range(12):
-            total_employee_contribution += monthly_employee_contribution
-            total_employer_contribution += monthly_employer_contribution
-            
-            # Calculate future value of this month's contribution
-            remaining_months = (years_of_service - year) * 12 - month
-            contribution_fv = (monthly_employee_contribution + monthly_employer_contribution) * (1 + monthly_rate) ** remaining_months
-            maturity_amount += contribution_fv
-        
-        # Annual salary increment
-        current_basic *= (1 + annual_increment / 100)
+    # Contributions are fixed percentages of a basic salary stepped up every year
+    projection = step_up_contributions(monthly_basic, epf_interest_rate, years_of_service, annual_increment)
+    total_employee_contribution = projection["total_contributed"] * employee_contribution_percent / 100
+    total_employer_contribution = projection["total_contributed"] * employer_contribution_percent / 100
+    maturity_amount = projection["future_value"] * (employee_contribution_percent + employer_contribution_percent) / 100
     
     total_contribution = total_employee_contribution + total_employer_contribution
     
@@ -737,7 +772,8 @@ def personal_loan_emi_calculator(
     loan_amount: float,
     annual_interest_rate: float,
     tenure_months: int,
-    processing_fee_percent: float = 1.0
+    processing_fee_percent: float = 1.0,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     💸 Personal Loan EMI Calculator
@@ -749,6 +785,7 @@ def personal_loan_emi_calculator(
         annual_interest_rate: Annual interest rate (as percentage)
         tenure_months: Loan tenure in months
         processing_fee_percent: Processing fee as percentage of loan amount (default: 1.0%)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -757,18 +794,19 @@ def personal_loan_emi_calculator(
             - total_interest: Total interest paid
             - processing_fee: Processing fee amount
             - total_cost: Total cost including processing fee
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
     
     # EMI calculation using formula: P * r * (1+r)^n / [(1+r)^n - 1]
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     total_cost = total_payment + processing_fee
     
-    return {
+    result = {
         "icon": "💸",
         "loan_amount": round(loan_amount, 2),
         "emi": round(emi, 2),
@@ -778,6 +816,10 @@ def personal_loan_emi_calculator(
         "total_cost": round(total_cost, 2),
         "tenure_months": tenure_months
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def medical_loan_emi_calculator(
@@ -785,7 +827,8 @@ def medical_loan_emi_calculator(
     annual_interest_rate: float,
     tenure_months: int,
     moratorium_months: int = 6,
-    processing_fee_percent: float = 0.5
+    processing_fee_percent: float = 0.5,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     🩺 Medical Loan EMI Calculator
@@ -798,6 +841,7 @@ def medical_loan_emi_calculator(
         tenure_months: Loan tenure in months
         moratorium_months: Moratorium period in months (default: 6)
         processing_fee_percent: Processing fee as percentage (default: 0.5%)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -806,6 +850,7 @@ def medical_loan_emi_calculator(
             - total_interest: Total interest paid
             - moratorium_interest: Interest during moratorium
             - processing_fee: Processing fee amount
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
@@ -816,12 +861,12 @@ def medical_loan_emi_calculator(
     
     # EMI calculation for remaining tenure
     remaining_months = tenure_months - moratorium_months
-    emi = effective_loan_amount * monthly_rate * (1 + monthly_rate) ** remaining_months / ((1 + monthly_rate) ** remaining_months - 1)
+    emi = _emi(effective_loan_amount, monthly_rate, remaining_months)
     
     total_payment = emi * remaining_months
     total_interest = total_payment - loan_amount
     
-    return {
+    result = {
         "icon": "🩺",
         "loan_amount": round(loan_amount, 2),
         "emi": round(emi, 2),
@@ -832,6 +877,11 @@ def medical_loan_emi_calculator(
         "moratorium_months": moratorium_months,
         "repayment_months": remaining_months
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months,
+                                              moratorium_months=moratorium_months)
+    return result
 
 
 def marriage_loan_emi_calculator(
@@ -839,7 +889,8 @@ def marriage_loan_emi_calculator(
     annual_interest_rate: float,
     tenure_months: int,
     processing_fee_percent: float = 1.0,
-    prepayment_charges_percent: float = 2.0
+    prepayment_charges_percent: float = 2.0,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     💍 Marriage Loan EMI Calculator
@@ -852,6 +903,7 @@ def marriage_loan_emi_calculator(
         tenure_months: Loan tenure in months
         processing_fee_percent: Processing fee as percentage (default: 1.0%)
         prepayment_charges_percent: Prepayment charges as percentage (default: 2.0%)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -861,19 +913,20 @@ def marriage_loan_emi_calculator(
             - processing_fee: Processing fee amount
             - prepayment_charges: Prepayment charges (if applicable)
             - total_cost: Total cost including fees
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
     prepayment_charges = loan_amount * prepayment_charges_percent / 100
     
     # EMI calculation
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     total_cost = total_payment + processing_fee
     
-    return {
+    result = {
         "icon": "💍",
         "loan_amount": round(loan_amount, 2),
         "emi": round(emi, 2),
@@ -884,6 +937,10 @@ def marriage_loan_emi_calculator(
         "total_cost": round(total_cost, 2),
         "tenure_months": tenure_months
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def home_renovation_emi_calculator(
@@ -891,7 +948,8 @@ def home_renovation_emi_calculator(
     annual_interest_rate: float,
     tenure_months: int,
     property_value: float,
-    processing_fee_percent: float = 0.5
+    processing_fee_percent: float = 0.5,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     🔨 Home Renovation EMI Calculator
@@ -904,6 +962,7 @@ def home_renovation_emi_calculator(
         tenure_months: Loan tenure in months
         property_value: Current property value
         processing_fee_percent: Processing fee as percentage (default: 0.5%)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -913,6 +972,7 @@ def home_renovation_emi_calculator(
             - processing_fee: Processing fee amount
             - loan_to_value_ratio: Loan to value ratio
             - eligibility_status: Eligibility status
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
@@ -924,12 +984,12 @@ def home_renovation_emi_calculator(
     eligibility_status = "Eligible" if ltv_ratio <= 80 else "Not eligible - LTV exceeds 80%"
     
     # EMI calculation
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     
-    return {
+    result = {
         "icon": "🔨",
         "loan_amount": round(loan_amount, 2),
         "emi": round(emi, 2),
@@ -940,6 +1000,10 @@ def home_renovation_emi_calculator(
         "eligibility_status": eligibility_status,
         "property_value": round(property_value, 2)
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def axis_bank_personal_loan_calculator(
@@ -947,7 +1011,8 @@ def axis_bank_personal_loan_calculator(
     annual_interest_rate: float = 10.5,
     tenure_months: int = 60,
     processing_fee_percent: float = 2.0,
-    insurance_premium_percent: float = 0.5
+    insurance_premium_percent: float = 0.5,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     🏦 Axis Bank Personal Loan Calculator
@@ -960,6 +1025,7 @@ def axis_bank_personal_loan_calculator(
         tenure_months: Loan tenure in months (default: 60)
         processing_fee_percent: Processing fee as percentage (default: 2.0%)
         insurance_premium_percent: Insurance premium as percentage (default: 0.5%)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -969,19 +1035,20 @@ def axis_bank_personal_loan_calculator(
             - processing_fee: Processing fee amount
             - insurance_premium: Insurance premium amount
             - total_cost: Total cost including all fees
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
     insurance_premium = loan_amount * insurance_premium_percent / 100
     
     # EMI calculation
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     total_cost = total_payment + processing_fee + insurance_premium
     
-    return {
+    result = {
         "icon": "🏦",
         "bank": "Axis Bank",
         "loan_amount": round(loan_amount, 2),
@@ -993,6 +1060,10 @@ def axis_bank_personal_loan_calculator(
         "total_cost": round(total_cost, 2),
         "tenure_months": tenure_months
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def icici_bank_personal_loan_emi_calculator(
@@ -1000,7 +1071,8 @@ def icici_bank_personal_loan_emi_calculator(
     annual_interest_rate: float = 10.75,
     tenure_months: int = 60,
     processing_fee_percent: float = 2.5,
-    documentation_charges: float = 5000
+    documentation_charges: float = 5000,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     🏦 ICICI Bank Personal Loan EMI Calculator
@@ -1013,6 +1085,7 @@ def icici_bank_personal_loan_emi_calculator(
         tenure_months: Loan tenure in months (default: 60)
         processing_fee_percent: Processing fee as percentage (default: 2.5%)
         documentation_charges: Documentation charges (default: 5000)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -1022,18 +1095,19 @@ def icici_bank_personal_loan_emi_calculator(
             - processing_fee: Processing fee amount
             - documentation_charges: Documentation charges
             - total_cost: Total cost including all fees
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
     
     # EMI calculation
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     total_cost = total_payment + processing_fee + documentation_charges
     
-    return {
+    result = {
         "icon": "🏦",
         "bank": "ICICI Bank",
         "loan_amount": round(loan_amount, 2),
@@ -1045,6 +1119,10 @@ def icici_bank_personal_loan_emi_calculator(
         "total_cost": round(total_cost, 2),
         "tenure_months": tenure_months
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def hdfc_bank_personal_loan_calculator(
@@ -1052,7 +1130,8 @@ def hdfc_bank_personal_loan_calculator(
     annual_interest_rate: float = 10.85,
     tenure_months: int = 60,
     processing_fee_percent: float = 2.5,
-    salary_requirement: float = 25000
+    salary_requirement: float = 25000,
+    include_schedule: bool = False
 ) -> Dict[str, Union[float, str]]:
     """
     🏦 HDFC Bank Personal Loan Calculator
@@ -1065,6 +1144,7 @@ def hdfc_bank_personal_loan_calculator(
         tenure_months: Loan tenure in months (default: 60)
         processing_fee_percent: Processing fee as percentage (default: 2.5%)
         salary_requirement: Minimum salary requirement (default: 25000)
+        include_schedule: Include the month-by-month amortization schedule (default: False)
         
     Returns:
         Dict containing:
@@ -1074,6 +1154,7 @@ def hdfc_bank_personal_loan_calculator(
             - processing_fee: Processing fee amount
             - eligibility_status: Eligibility status
             - max_loan_amount: Maximum loan amount based on salary
+            - schedule: Amortization schedule columns (if include_schedule)
     """
     monthly_rate = annual_interest_rate / 100 / 12
     processing_fee = loan_amount * processing_fee_percent / 100
@@ -1083,12 +1164,12 @@ def hdfc_bank_personal_loan_calculator(
     eligibility_status = "Eligible" if loan_amount <= max_loan_amount else "Not eligible - Exceeds income criteria"
     
     # EMI calculation
-    emi = loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months / ((1 + monthly_rate) ** tenure_months - 1)
+    emi = _emi(loan_amount, monthly_rate, tenure_months)
     
     total_payment = emi * tenure_months
     total_interest = total_payment - loan_amount
     
-    return {
+    result = {
         "icon": "🏦",
         "bank": "HDFC Bank",
         "loan_amount": round(loan_amount, 2),
@@ -1100,6 +1181,10 @@ def hdfc_bank_personal_loan_calculator(
         "max_loan_amount": round(max_loan_amount, 2),
         "salary_requirement": round(salary_requirement, 2)
     }
+    
+    if include_schedule:
+        result["schedule"] = _schedule_output(loan_amount, annual_interest_rate, tenure_months)
+    return result
 
 
 def net_worth_calculator(
@@ -1383,39 +1468,24 @@ def loan_prepayment_calculator(
     if prepayment_amount >= outstanding_principal:
         raise ValueError("Prepayment amount cannot be greater than or equal to outstanding principal")
     
-    monthly_rate = interest_rate / 100 / 12
-    
-    # Calculate original tenure
-    if monthly_rate > 0:
-        original_tenure_months = math.ceil(math.log(1 + (outstanding_principal * monthly_rate) / monthly_emi) / math.log(1 + monthly_rate))
-    else:
-        original_tenure_months = outstanding_principal / monthly_emi
-    
-    # Calculate original total interest
-    original_total_payment = monthly_emi * original_tenure_months
-    original_total_interest = original_total_payment - outstanding_principal
+    # Repay the outstanding principal with the current EMI
+    original_schedule = list(amortization_schedule(outstanding_principal, interest_rate, emi=monthly_emi))
+    original_tenure_months = len(original_schedule)
+    original_total_interest = sum(row.interest for row in original_schedule)
     
     # New principal after prepayment
     new_principal = outstanding_principal - prepayment_amount
     
     if prepayment_type == "reduce_tenure":
         # Keep EMI same, reduce tenure
+        new_schedule = list(amortization_schedule(new_principal, interest_rate, emi=monthly_emi))
         new_emi = monthly_emi
-        if monthly_rate > 0:
-            new_tenure_months = math.ceil(math.log(1 + (new_principal * monthly_rate) / new_emi) / math.log(1 + monthly_rate))
-        else:
-            new_tenure_months = new_principal / new_emi
     else:
         # Keep tenure same, reduce EMI
-        new_tenure_months = original_tenure_months
-        if monthly_rate > 0:
-            new_emi = new_principal * monthly_rate / (1 - (1 + monthly_rate) ** (-new_tenure_months))
-        else:
-            new_emi = new_principal / new_tenure_months
-    
-    # Calculate new total interest
-    new_total_payment = new_emi * new_tenure_months
-    new_total_interest = new_total_payment - new_principal
+        new_schedule = list(amortization_schedule(new_principal, interest_rate, original_tenure_months))
+        new_emi = new_schedule[0].payment
+    new_tenure_months = len(new_schedule)
+    new_total_interest = sum(row.interest for row in new_schedule)
     
     # Calculate interest saved
     interest_saved = original_total_interest - new_total_interest
@@ -1886,6 +1956,7 @@ __all__ = [
     "mutual_fund_goal_calculator",
     "rent_vs_buy_calculator",
     "mutual_fund_sip_calculator",
+    "step_up_contributions",
     "ppf_calculator",
     "nps_calculator",
     "hra_calculator",
@@ -0,0 +1,331 @@
+"""
+Debt Payoff Planning
+
+credit_card_interest_calculator follows one card month by month. The
+payoff engine here plans several debts together under one monthly budget:
+every debt gets its minimum payment and the rest of the budget goes to one
+target debt, chosen by strategy:
+
+    avalanche   highest interest rate first (least interest paid)
+    snowball    smallest balance first (quickest early payoffs)
+    custom      a given order of debt names
+
+When a debt is repaid, its payment rolls over to the next target. Between
+two payoffs every payment is constant, so each phase is stepped in closed
+form (the balance of a level-payment loan) instead of month by month, and
+a plan takes one step per debt however long it runs.
+
+debts_from_credit_report builds the debts from a fetch_credit_report
+payload (creditAccountDetails): cards pay a percentage of their balance,
+loans the EMI of their original amount and repayment tenure.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Union
+
+from .fi_mcp_schema import CreditReportView, validate_payload
+from .finance_amortization import _emi, loan_tenure_months
+
+
+PAYOFF_STRATEGIES = ("avalanche", "snowball", "custom")
+
+CREDIT_CARD_ACCOUNT_TYPE = "10"
+
+# Balances below half a paisa count as repaid
+_SETTLE_TOLERANCE = 0.005
+
+
+class Debt(NamedTuple):
+    """One debt to repay (amounts in rupees, rate as annual percentage)."""
+    name: str
+    balance: float
+    annual_interest_rate: float
+    minimum_payment: float
+    account_type: Optional[str] = None
+
+
+def debts_from_credit_report(
+    credit_report: Union[Dict[str, Any], CreditReportView],
+    minimum_payment_percent: float = 5.0
+) -> List[Debt]:
+    """
+    📋 Debts of a credit report.
+    
+    Takes the accounts of the first report with an outstanding balance.
+    Credit cards (and loans without a known tenure) pay
+    minimum_payment_percent of their current balance; loans pay the EMI of
+    their original amount over their repayment tenure. Accounts without a
+    rate are taken as interest-free; repeated lender names are numbered.
+    
+    Args:
+        credit_report: fetch_credit_report payload or its validated view
+        minimum_payment_percent: Minimum payment as percentage of balance (default: 5%)
+    
+    Returns:
+        List of Debt in report order
+    
+    Raises:
+        SchemaError: If the payload is malformed
+    """
+    if not isinstance(credit_report, CreditReportView):
+        credit_report = validate_payload("credit_report", credit_report)
+    debts = []
+    seen: Dict[str, int] = {}
+    for account in credit_report.accounts:
+        if not account.current_balance_paise or account.current_balance_paise <= 0:
+            continue
+        balance = account.current_balance_paise / 100
+        rate = account.rate_of_interest or 0.0
+        if (account.account_type != CREDIT_CARD_ACCOUNT_TYPE and account.repayment_tenure
+                and account.original_amount_paise):
+            minimum = _emi(account.original_amount_paise / 100, rate / 100 / 12, account.repayment_tenure)
+        else:
+            minimum = balance * minimum_payment_percent / 100
+        name = account.subscriber or "Unknown lender"
+        seen[name] = seen.get(name, 0) + 1
+        if seen[name] > 1:
+            name = f"{name} ({seen[name]})"
+        debts.append(Debt(name, balance, rate, minimum, account.account_type))
+    return debts
+
+
+def _as_debt(debt: Union[Debt, Mapping[str, Any], Sequence[Any]]) -> Debt:
+    if isinstance(debt, Debt):
+        return debt
+    if isinstance(debt, Mapping):
+        return Debt(**debt)
+    return Debt(*debt)
+
+
+def _payoff_priority(debts: List[Debt], strategy: str, order: Optional[Sequence[str]]) -> List[int]:
+    """Debt indices in the order extra payments target them."""
+    if strategy == "avalanche":
+        return sorted(range(len(debts)), key=lambda i: (-debts[i].annual_interest_rate, debts[i].balance))
+    if strategy == "snowball":
+        return sorted(range(len(debts)), key=lambda i: (debts[i].balance, -debts[i].annual_interest_rate))
+    if order is None:
+        raise ValueError("The custom strategy needs an order of debt names")
+    index = {debt.name: i for i, debt in enumerate(debts)}
+    if sorted(order) != sorted(index):
+        raise ValueError("order must name every debt exactly once")
+    return [index[name] for name in order]
+
+
+def debt_payoff_plan(
+    debts: Iterable[Union[Debt, Mapping[str, Any], Sequence[Any]]],
+    monthly_budget: Optional[float] = None,
+    strategy: str = "avalanche",
+    order: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    🏔️ Debt Payoff Planner
+    
+    Plans the repayment of several debts from one monthly budget.
+    
+    Args:
+        debts: Debt tuples, or mappings/sequences of the Debt fields
+        monthly_budget: Total monthly payment. If None, the sum of the minimum payments.
+        strategy: "avalanche", "snowball" or "custom" (default: "avalanche")
+        order: Debt names in payoff order, for the custom strategy
+    
+    Returns:
+        Dict containing:
+            - strategy: Strategy used
+            - monthly_budget: Total monthly payment
+            - minimum_payments: Sum of the minimum payments
+            - extra_payment: Budget above the minimum payments
+            - payoff_months: Months until every debt is repaid
+            - total_interest_paid: Total interest paid
+            - total_amount_paid: Total amount paid
+            - payoff_order: Debt names in the order they are repaid
+            - debts: Per debt (input order) balance, rate, minimum payment,
+              payoff month, interest paid and amount paid
+            - phases: Stretches between payoffs with their target debt and
+              the debts repaid at their end
+    
+    Raises:
+        ValueError: If the strategy or order is invalid, debt names repeat,
+            the budget is below the minimum payments or never repays the debts
+    """
+    if strategy not in PAYOFF_STRATEGIES:
+        raise ValueError(f"strategy must be one of {', '.join(PAYOFF_STRATEGIES)}")
+    debts = [_as_debt(debt) for debt in debts]
+    if len({debt.name for debt in debts}) != len(debts):
+        raise ValueError("Debt names must be unique")
+    priority = _payoff_priority(debts, strategy, order)
+    
+    minimum_payments = sum(debt.minimum_payment for debt in debts if debt.balance > 0)
+    if monthly_budget is None:
+        monthly_budget = minimum_payments
+    elif monthly_budget < minimum_payments - _SETTLE_TOLERANCE:
+        raise ValueError(f"Monthly budget is below the minimum payments of {minimum_payments:.2f}")
+    
+    rates = [debt.annual_interest_rate / 100 / 12 for debt in debts]
+    balances = [float(debt.balance) for debt in debts]
+    interest = [0.0] * len(debts)
+    paid = [0.0] * len(debts)
+    payoff_month: List[Optional[int]] = [0 if balance <= 0 else None for balance in balances]
+    active = [i for i in priority if balances[i] > 0]
+    phases = []
+    month = 0
+    
+    while active:
+        # Payments stay constant until the next payoff
+        target = active[0]
+        payments = {i: debts[i].minimum_payment for i in active}
+        payments[target] = monthly_budget - sum(payments[i] for i in active[1:])
+        months_left = []
+        for i in active:
+            try:
+                months_left.append(loan_tenure_months(balances[i], debts[i].annual_interest_rate, payments[i]))
+            except ValueError:
+                pass
+        if not months_left:
+            raise ValueError("Monthly budget does not cover the interest on the remaining debts")
+        steps = min(months_left) - 1
+        
+        # Closed-form balances after the months before the payoff
+        if steps > 0:
+            for i in active:
+                rate, payment = rates[i], payments[i]
+                if rate == 0:
+                    new_balance = balances[i] - payment * steps
+                else:
+                    growth_minus_one = math.expm1(steps * math.log1p(rate))
+                    new_balance = balances[i] * (1 + growth_minus_one) - payment * growth_minus_one / rate
+                new_balance = max(new_balance, 0.0)
+                interest[i] += payment * steps - (balances[i] - new_balance)
+                paid[i] += payment * steps
+                balances[i] = new_balance
+        
+        # The payoff month: minimums first, then the rest of the budget by priority
+        month += steps + 1
+        available = monthly_budget
+        due = {}
+        for i in active:
+            accrued = balances[i] * rates[i]
+            interest[i] += accrued
+            balances[i] += accrued
+            due[i] = min(debts[i].minimum_payment, balances[i])
+            available -= due[i]
+        for i in active:
+            extra = min(available, balances[i] - due[i])
+            due[i] += extra
+            available -= extra
+        repaid = []
+        for i in active:
+            paid[i] += due[i]
+            balances[i] -= due[i]
+            if balances[i] <= _SETTLE_TOLERANCE:
+                balances[i] = 0.0
+                payoff_month[i] = month
+                repaid.append(i)
+        active = [i for i in active if balances[i] > 0]
+        phases.append({
+            "start_month": month - steps,
+            "end_month": month,
+            "target": debts[target].name,
+            "paid_off": [debts[i].name for i in repaid]
+        })
+    
+    payoff_order = sorted((i for i in range(len(debts)) if debts[i].balance > 0),
+                          key=lambda i: (payoff_month[i], priority.index(i)))
+    total_interest = sum(interest)
+    
+    return {
+        "icon": "🏔️",
+        "strategy": strategy,
+        "monthly_budget": round(monthly_budget, 2),
+        "minimum_payments": round(minimum_payments, 2),
+        "extra_payment": round(monthly_budget - minimum_payments, 2),
+        "payoff_months": month,
+        "total_interest_paid": round(total_interest, 2),
+        "total_amount_paid": round(sum(paid), 2),
+        "payoff_order": [debts[i].name for i in payoff_order],
+        "debts": [
+            {
+                "name": debt.name,
+                "account_type": debt.account_type,
+                "balance": round(debt.balance, 2),
+                "annual_interest_rate": debt.annual_interest_rate,
+                "minimum_payment": round(debt.minimum_payment, 2),
+                "payoff_month": payoff_month[i],
+                "interest_paid": round(interest[i], 2),
+                "total_paid": round(paid[i], 2)
+            }
+            for i, debt in enumerate(debts)
+        ],
+        "phases": phases
+    }
+
+
+def compare_payoff_strategies(
+    debts: Iterable[Union[Debt, Mapping[str, Any], Sequence[Any]]],
+    monthly_budget: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    ⚖️ Compare avalanche and snowball payoff plans.
+    
+    Args:
+        debts: Debt tuples, or mappings/sequences of the Debt fields
+        monthly_budget: Total monthly payment. If None, the sum of the minimum payments.
+    
+    Returns:
+        Dict containing:
+            - avalanche: Avalanche plan (see debt_payoff_plan)
+            - snowball: Snowball plan
+            - interest_saved_with_avalanche: Snowball interest minus avalanche interest
+            - months_saved_with_avalanche: Snowball months minus avalanche months
+            - recommendation: Strategy recommendation
+    """
+    debts = [_as_debt(debt) for debt in debts]
+    avalanche = debt_payoff_plan(debts, monthly_budget, "avalanche")
+    snowball = debt_payoff_plan(debts, monthly_budget, "snowball")
+    interest_saved = snowball["total_interest_paid"] - avalanche["total_interest_paid"]
+    
+    if interest_saved > avalanche["monthly_budget"]:
+        recommendation = "✅ Avalanche - saves more than a month's budget in interest"
+    elif interest_saved > 0:
+        recommendation = "👍 Either works - snowball's early payoffs cost little extra interest"
+    else:
+        recommendation = "👍 Snowball - early payoffs at no extra interest"
+    
+    return {
+        "icon": "⚖️",
+        "avalanche": avalanche,
+        "snowball": snowball,
+        "interest_saved_with_avalanche": round(interest_saved, 2),
+        "months_saved_with_avalanche": snowball["payoff_months"] - avalanche["payoff_months"],
+        "recommendation": recommendation
+    }
+
+
+def credit_report_payoff_plan(
+    phone_number: str,
+    monthly_budget: Optional[float] = None,
+    strategy: str = "avalanche",
+    order: Optional[Sequence[str]] = None,
+    minimum_payment_percent: float = 5.0,
+    data_dir: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    🏔️ Payoff plan for the debts in a user's credit report.
+    
+    Args:
+        phone_number: User's phone number
+        monthly_budget: Total monthly payment. If None, the sum of the minimum payments.
+        strategy: "avalanche", "snowball" or "custom" (default: "avalanche")
+        order: Debt names in payoff order, for the custom strategy
+        minimum_payment_percent: Card minimum payment as percentage of balance (default: 5%)
+        data_dir: Data directory. If None, uses the bundled dummy data.
+    
+    Returns:
+        debt_payoff_plan result, or None if the user has no credit report
+    """
+    from .fi_mcp_data_access import get_data_access
+    
+    credit_report = get_data_access(data_dir).get_view(phone_number, "credit_report")
+    if credit_report is None:
+        return None
+    debts = debts_from_credit_report(credit_report, minimum_payment_percent)
+    return debt_payoff_plan(debts, monthly_budget, strategy, order)
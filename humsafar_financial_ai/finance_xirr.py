@@ -0,0 +1,160 @@
+"""
+XIRR Solver
+
+xirr finds the annual rate r at which the net present value of dated
+cashflows is zero:
+
+    NPV(r) = sum(amount_i * (1 + r) ** -years_i) = 0
+
+with years_i counted from the first cashflow in 365-day years (the
+spreadsheet XIRR convention). Newton's method converges in a handful of
+iterations from a good guess, so callers pricing many similar cashflow
+sets pass the previous answer as the next guess (a warm start). When
+Newton leaves the domain or stalls, the root is bracketed on a grid of
+rates and found by Newton steps safeguarded with bisection.
+
+NPV and its derivative are evaluated together over the whole cashflow
+vector, with NumPy when installed.
+"""
+
+import math
+from datetime import date
+from typing import Callable, Optional, Sequence, Tuple
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+
+# Below this many cashflows the stdlib loop beats NumPy's call overhead
+_NUMPY_MIN_CASHFLOWS = 64
+
+# Largest |NPV|, relative to the total absolute cashflow, accepted as a root
+_NPV_TOLERANCE = 1e-9
+
+# Rates (as fractions) scanned for a sign change when Newton fails
+_BRACKET_GRID = (-0.999999, -0.99, -0.9, -0.5, -0.2, 0.0, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 100.0, 1000.0)
+
+NPVFunction = Callable[[float], Tuple[float, float]]
+
+
+def _npv_function(amounts: Sequence[float], years: Sequence[float]) -> NPVFunction:
+    """rate -> (NPV, dNPV/drate) over fixed cashflows."""
+    if numpy is not None and len(amounts) >= _NUMPY_MIN_CASHFLOWS:
+        amount_array = numpy.asarray(amounts, dtype=numpy.float64)
+        year_array = numpy.asarray(years, dtype=numpy.float64)
+        weighted_years = amount_array * year_array
+        
+        def npv(rate: float) -> Tuple[float, float]:
+            discount = numpy.exp(-year_array * math.log1p(rate))
+            return float(amount_array @ discount), float(-(weighted_years @ discount) / (1 + rate))
+        return npv
+    
+    pairs = list(zip(amounts, years))
+    
+    def npv(rate: float) -> Tuple[float, float]:
+        log_growth = math.log1p(rate)
+        value = 0.0
+        slope = 0.0
+        for amount, year in pairs:
+            discounted = amount * math.exp(-year * log_growth)
+            value += discounted
+            slope -= year * discounted
+        return value, slope / (1 + rate)
+    return npv
+
+
+def _newton(npv: NPVFunction, rate: float, tolerance: float, max_iterations: int,
+            max_npv: float) -> Optional[float]:
+    """
+    Plain Newton iteration; None if it leaves the domain or does not converge.
+    
+    Where the NPV curve flattens out (e.g. a losing SIP) the steps can
+    shrink while the rate runs off to infinity, so a converged rate is only
+    accepted if it is finite and its |NPV| is at most max_npv.
+    """
+    for _ in range(max_iterations):
+        value, slope = npv(rate)
+        if slope == 0 or not math.isfinite(value) or not math.isfinite(slope):
+            return None
+        step = value / slope
+        rate -= step
+        if rate <= -1 or not math.isfinite(rate):
+            return None
+        if abs(step) <= tolerance * (1 + abs(rate)):
+            value = npv(rate)[0]
+            return rate if math.isfinite(value) and abs(value) <= max_npv else None
+    return None
+
+
+def _bracketed(npv: NPVFunction, low: float, high: float, tolerance: float, max_iterations: int) -> float:
+    """Newton steps kept inside a sign-changing bracket, bisecting when they leave it."""
+    low_value = npv(low)[0]
+    rate = (low + high) / 2
+    for _ in range(max_iterations):
+        value, slope = npv(rate)
+        if value == 0:
+            return rate
+        if (value < 0) == (low_value < 0):
+            low, low_value = rate, value
+        else:
+            high = rate
+        candidate = rate - value / slope if slope else low - 1
+        if not low < candidate < high:
+            candidate = (low + high) / 2
+        if abs(candidate - rate) <= tolerance * (1 + abs(rate)):
+            return candidate
+        rate = candidate
+    return rate
+
+
+def xirr(
+    amounts: Sequence[float],
+    dates: Sequence[date],
+    guess: float = 10.0,
+    tolerance: float = 1e-10,
+    max_iterations: int = 100
+) -> float:
+    """
+    📈 XIRR of dated cashflows.
+    
+    Args:
+        amounts: Cashflows, negative for money invested and positive for
+            money received (redemptions and the current value)
+        dates: Date of each cashflow, in any order
+        guess: Starting rate as percentage, e.g. the previous result (default: 10%)
+        tolerance: Relative change of the rate at which iteration stops
+        max_iterations: Iteration limit of each solver stage
+    
+    Returns:
+        Annualized return as percentage
+    
+    Raises:
+        ValueError: If the lengths differ, the cashflows do not change sign
+            or no rate above -100% solves them
+    """
+    if len(amounts) != len(dates):
+        raise ValueError("amounts and dates must have the same length")
+    if not any(amount > 0 for amount in amounts) or not any(amount < 0 for amount in amounts):
+        raise ValueError("Cashflows need at least one positive and one negative amount")
+    
+    start = min(dates)
+    years = [(day - start).days / 365 for day in dates]
+    npv = _npv_function(amounts, years)
+    
+    max_npv = _NPV_TOLERANCE * sum(abs(amount) for amount in amounts)
+    rate = _newton(npv, max(guess / 100, -0.99), tolerance, max_iterations, max_npv)
+    if rate is not None:
+        return rate * 100
+    
+    previous_rate = None
+    previous_value = 0.0
+    for candidate in _BRACKET_GRID:
+        value = npv(candidate)[0]
+        if value == 0:
+            return candidate * 100
+        if previous_rate is not None and (value < 0) != (previous_value < 0):
+            return _bracketed(npv, previous_rate, candidate, tolerance, max_iterations) * 100
+        previous_rate, previous_value = candidate, value
+    raise ValueError("No XIRR above -100% solves these cashflows")
@@ -67,6 +67,26 @@ def test_mutual_fund_sip_calculator():
     print()
 
 
+def test_step_up_contributions():
+    """Test the closed-form step-up projection against a month-by-month simulation"""
+    print("📶 Testing Step-Up Contribution Projection...")
+    for monthly, annual_return, years, step_up in [(10000, 12, 15, 0), (5000, 10, 30, 10), (2000, 0, 5, 5),
+                                                   (7500, 8.5, 30, 8), (1000, 12, 0, 10)]:
+        monthly_rate = annual_return / 100 / 12
+        corpus = contributed = 0.0
+        contribution = monthly
+        for year in range(years):
+            for month in range(12):
+                corpus = (corpus + contribution) * (1 + monthly_rate)
+                contributed += contribution
+            contribution *= 1 + step_up / 100
+        result = step_up_contributions(monthly, annual_return, years, step_up)
+        assert abs(result["future_value"] - corpus) <= 1e-9 * max(corpus, 1)
+        assert abs(result["total_contributed"] - contributed) <= 1e-9 * max(contributed, 1)
+    print(f"  30-year 10% step-up corpus: ₹{step_up_contributions(5000, 10, 30, 10)['future_value']:.2f}")
+    print()
+
+
 def test_ppf_calculator():
     """Test PPF Calculator"""
     print("💸 Testing PPF Calculator...")
@@ -368,6 +388,7 @@ def main():
     test_mutual_fund_goal_calculator()
     test_rent_vs_buy_calculator()
     test_mutual_fund_sip_calculator()
+    test_step_up_contributions()
     test_ppf_calculator()
     test_nps_calculator()
     test_hra_calculator()
@@ -17,8 +17,11 @@ from humsafar_financial_ai import (
     get_epf_details,
     get_credit_report,
     get_complete_profile,
+    get_profiles,
     analyze_user_financial_health,
-    get_available_users
+    get_available_users,
+    get_data_access,
+    reset_data_access
 )
 
 
@@ -180,6 +183,259 @@ def test_integration_example():
         print(f"  ❌ Test user {test_user} not available")
 
 
+def test_load_cache():
+    """Test the validated LRU cache behind _load_data"""
+    print("=== Data Cache Tests ===\n")
+    
+    fi_data = FIMCPDataAccess(cache_size=4)
+    user_id = "2222222222"
+    
+    first = fi_data.get_net_worth(user_id)
+    second = fi_data.get_net_worth(user_id)
+    info = fi_data.cache_info()
+    print(f"  📦 Cache after two reads: {info}")
+    assert first is second
+    assert info["hits"] == 1 and info["misses"] == 1
+    
+    fi_data.get_complete_profile(user_id)
+    info = fi_data.cache_info()
+    print(f"  📦 Cache after complete profile: {info}")
+    assert info["size"] == 4
+    assert info["evictions"] == 2
+    
+    fi_data.clear_cache()
+    assert fi_data.cache_info()["size"] == 0
+    
+    uncached = FIMCPDataAccess(cache_size=0)
+    assert uncached.get_net_worth(user_id) == first
+    assert uncached.cache_info()["size"] == 0
+
+    # A rewritten file must be detected through its mtime/size signature
+    import shutil
+    import tempfile
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shutil.copytree(fi_data.data_dir / user_id, os.path.join(tmp_dir, user_id))
+        tmp_data = FIMCPDataAccess(tmp_dir)
+        assert tmp_data.get_epf_details(user_id)["uanAccounts"]
+        with open(os.path.join(tmp_dir, user_id, "fetch_epf_details.json"), "w") as f:
+            f.write('{"uanAccounts": [], "rewritten": true}')
+        assert tmp_data.get_epf_details(user_id) == {"uanAccounts": [], "rewritten": True}
+    print("  ✅ Cache hit/miss/eviction counters behave as expected")
+
+
+def test_shared_accessor_registry():
+    """Test the process-wide accessor registry used by the helpers"""
+    print("=== Shared Accessor Registry Tests ===\n")
+    
+    reset_data_access()
+    accessor = get_data_access()
+    assert get_data_access(str(accessor.data_dir)) is accessor
+    
+    get_net_worth("2222222222")
+    get_net_worth("2222222222")
+    info = accessor.cache_info()
+    print(f"  📦 Shared cache after two helper calls: {info}")
+    assert info["hits"] >= 1
+    
+    reset_data_access()
+    assert get_data_access() is not accessor
+    print("  ✅ Helpers share one warm accessor per data directory")
+
+
+def test_bulk_profiles():
+    """Test streaming bulk profile loading from a worker pool"""
+    print("=== Bulk Profile Loading Tests ===\n")
+    
+    users = get_available_users()
+    fi_data = FIMCPDataAccess()
+    
+    results = dict(get_profiles(users, workers=4))
+    assert sorted(results) == sorted(users)
+    for user_id in users:
+        assert results[user_id] == fi_data.get_complete_profile(user_id)
+    print(f"  📚 Thread pool loaded {len(results)} complete profiles")
+    
+    partial = dict(fi_data.get_profiles(data_types=["net_worth", "credit_report"],
+                                        workers=2, use_processes=True, max_in_flight=3))
+    assert sorted(partial) == sorted(users)
+    assert set(partial["7777777777"]) == {"user_id", "net_worth", "credit_report"}
+    assert partial["7777777777"]["credit_report"] == fi_data.get_credit_report("7777777777")
+    print(f"  📚 Process pool loaded {len(partial)} partial profiles")
+    
+    try:
+        list(fi_data.get_profiles(users, data_types=["payslips"]))
+    except ValueError as e:
+        print(f"  ✅ Unknown data type rejected: {e}")
+    else:
+        raise AssertionError("Unknown data type was accepted")
+
+
+def test_profile_projection():
+    """Test data type projection and the decode-light, summary-backed health check"""
+    print("=== Profile Projection Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    user_id = "2222222222"
+    
+    partial = fi_data.get_complete_profile(user_id, data_types=["credit_report"])
+    assert set(partial) == {"user_id", "credit_report"}
+    assert partial["credit_report"] == fi_data.get_credit_report(user_id)
+    
+    fi_data.clear_cache()
+    health = fi_data.analyze_user_financial_health(user_id)
+    first = fi_data.cache_info()
+    print(f"  📦 Files decoded by health analysis: {first['misses']}")
+    assert first["misses"] == 2
+    assert fi_data.analyze_user_financial_health(user_id) == health
+    info = fi_data.cache_info()
+    assert (info["misses"], info["hits"]) == (first["misses"], first["hits"])
+    assert health["profile_completeness"] == 100
+    assert all(health["data_availability"].values())
+    assert health["total_net_worth"] == 658305
+    print("  ✅ Health analysis decodes only net worth and credit report, then serves from the summary")
+
+
+def test_user_manifest():
+    """Test the cached user manifest and its refresh rules"""
+    print("=== User Manifest Tests ===\n")
+    
+    import shutil
+    import tempfile
+    source = FIMCPDataAccess().data_dir
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        shutil.copytree(source / "2222222222", os.path.join(tmp_dir, "2222222222"))
+        fi_data = FIMCPDataAccess(tmp_dir, manifest_ttl=0)
+        assert fi_data.get_available_users() == ["2222222222"]
+        assert fi_data.get_net_worth("3333333333") is None
+        
+        # New user directories change the root mtime and are picked up
+        os.makedirs(os.path.join(tmp_dir, "3333333333"))
+        assert sorted(fi_data.get_available_users()) == ["2222222222", "3333333333"]
+        
+        # Files added to an existing user after a first read are seen at once
+        assert fi_data.get_user_summary("3333333333")["data_availability"]["net_worth"] is False
+        shutil.copy(source / "3333333333" / "fetch_net_worth.json", os.path.join(tmp_dir, "3333333333"))
+        assert fi_data.get_net_worth("3333333333") is not None
+        assert fi_data.analyze_user_financial_health("3333333333")["data_availability"]["net_worth"] is True
+        assert fi_data.get_user_summary("3333333333")["total_net_worth"] > 0
+        
+        # Removed files are noticed on the next read
+        os.remove(os.path.join(tmp_dir, "2222222222", "fetch_credit_report.json"))
+        assert fi_data.get_credit_report("2222222222") is None
+        health = fi_data.analyze_user_financial_health("2222222222")
+        assert health["data_availability"]["credit_report"] is False
+        print(f"  📋 Manifest users: {sorted(fi_data.get_available_users())}")
+    print("  ✅ Manifest tracks users and data files in memory")
+
+
+def test_json_decoders():
+    """Test pluggable JSON decoder strategies and the decode benchmark"""
+    print("=== JSON Decoder Tests ===\n")
+    
+    from humsafar_financial_ai import JSON_DECODERS, benchmark_decoders
+    import json
+    
+    calls = []
+    
+    def counting_decoder(raw):
+        calls.append(len(raw))
+        return json.loads(raw)
+    
+    reference = FIMCPDataAccess().get_complete_profile("2222222222")
+    for decoder in list(JSON_DECODERS) + ["auto", counting_decoder]:
+        fi_data = FIMCPDataAccess(decoder=decoder)
+        assert fi_data.get_complete_profile("2222222222") == reference
+    assert len(calls) == 6 and all(isinstance(size, int) for size in calls)
+    
+    try:
+        FIMCPDataAccess(decoder="no-such-decoder")
+    except ValueError as e:
+        print(f"  ✅ Unknown decoder rejected: {e}")
+    else:
+        raise AssertionError("Unknown decoder was accepted")
+    
+    results = benchmark_decoders(repeat=1)
+    assert set(results["fetch_net_worth.json"]) == set(JSON_DECODERS)
+    for data_type, by_decoder in results.items():
+        stats = by_decoder["stdlib"]
+        print(f"  ⏱️ {data_type}: {stats['avg_us']:.1f} µs/file ({stats['files']} files)")
+
+
+def test_single_flight_loads():
+    """Test that concurrent loads of one user collapse to a single read"""
+    print("=== Single-Flight Load Tests ===\n")
+    
+    import json
+    import threading
+    import time
+    
+    reads = []
+    
+    def slow_decoder(raw):
+        reads.append(len(raw))
+        time.sleep(0.05)
+        return json.loads(raw)
+    
+    fi_data = FIMCPDataAccess(decoder=slow_decoder)
+    user_id = "2222222222"
+    barrier = threading.Barrier(8)
+    profiles = []
+    
+    def agent_turn():
+        barrier.wait()
+        profiles.append(fi_data.get_complete_profile(user_id))
+    
+    threads = [threading.Thread(target=agent_turn) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    info = fi_data.cache_info()
+    print(f"  🧵 8 concurrent profiles: {len(reads)} file reads, {info['coalesced']} coalesced loads")
+    assert len(reads) == 6
+    assert info["coalesced"] > 0
+    assert all(profile == profiles[0] for profile in profiles)
+    assert all(profile["net_worth"] is profiles[0]["net_worth"] for profile in profiles)
+    
+    # Failed loads are shared too and not cached
+    def broken_decoder(raw):
+        time.sleep(0.05)
+        raise ValueError("corrupt")
+    
+    broken = FIMCPDataAccess(decoder=broken_decoder)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(broken.get_net_worth(user_id))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [None] * 4
+    print("  ✅ Concurrent loads share one in-flight read")
+
+
+def test_raw_payloads():
+    """Test that raw payloads are the file bytes and cached until the file changes"""
+    print("=== Raw Payload Tests ===\n")
+    
+    import json
+    
+    fi_data = FIMCPDataAccess()
+    user_id = "2222222222"
+    raw = fi_data.get_raw(user_id, "net_worth")
+    with open(fi_data.data_dir / user_id / "fetch_net_worth.json", "rb") as f:
+        assert raw == f.read()
+    assert json.loads(raw) == fi_data.get_net_worth(user_id)
+    assert fi_data.get_raw(user_id, "net_worth") is raw
+    assert fi_data.get_raw("0000000000", "net_worth") is None
+    try:
+        fi_data.get_raw(user_id, "fetch_net_worth")
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print(f"  📄 Served {len(raw)} raw bytes without decoding")
+
+
 def main():
     """Run all tests"""
     print("🧪 Starting FI-MCP Data Access Tests...\n")
@@ -188,6 +444,14 @@ def main():
         test_fi_mcp_data_access()
         test_class_based_access()
         test_integration_example()
+        test_load_cache()
+        test_shared_accessor_registry()
+        test_bulk_profiles()
+        test_profile_projection()
+        test_user_manifest()
+        test_json_decoders()
+        test_single_flight_loads()
+        test_raw_payloads()
         
         print("✅ All FI-MCP tests completed successfully!")
         
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the asyncio FI-MCP data access layer.
+Checks the coroutine API against the synchronous accessor.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import AsyncFIMCPDataAccess, FIMCPDataAccess, RemoteDataAccess, start_stand_in_server
+
+
+def test_async_getters_match_sync():
+    """Test that async getters return the same data as the sync class"""
+    print("=== Async FI-MCP Access Tests ===\n")
+    
+    sync_data = FIMCPDataAccess()
+    async_data = AsyncFIMCPDataAccess()
+    
+    async def run_checks():
+        users = await async_data.get_available_users()
+        assert sorted(users) == sorted(sync_data.get_available_users())
+        
+        profiles = await asyncio.gather(*(async_data.get_complete_profile(u) for u in users))
+        for user_id, profile in zip(users, profiles):
+            assert profile == sync_data.get_complete_profile(user_id)
+        
+        assert await async_data.get_credit_report("7777777777") == sync_data.get_credit_report("7777777777")
+        health = await async_data.analyze_user_financial_health("2222222222")
+        assert health == sync_data.analyze_user_financial_health("2222222222")
+        print(f"  📊 Async profiles loaded: {len(profiles)}")
+        print(f"  🏥 Async health completeness: {health['profile_completeness']:.1f}%")
+    
+    asyncio.run(run_checks())
+    print("  ✅ Async API matches the synchronous accessor")
+
+
+def test_async_profile_reads_concurrently():
+    """Test that the six data files of a profile are read at the same time"""
+    barrier = threading.Barrier(6, timeout=5)
+    
+    class BarrierDataAccess(FIMCPDataAccess):
+        def _read_data(self, phone_number, data_type):
+            # Every read waits here until all six are in flight at once
+            barrier.wait()
+            return super()._read_data(phone_number, data_type)
+    
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        async_data = AsyncFIMCPDataAccess(accessor=BarrierDataAccess(cache_size=0), executor=executor)
+        profile = asyncio.run(async_data.get_complete_profile("2222222222"))
+    assert profile == FIMCPDataAccess().get_complete_profile("2222222222")
+    print("  ✅ Async profile reads its data files concurrently")
+
+
+def test_async_remote_profile_is_batched():
+    """Test that an async complete profile costs one remote request"""
+    server = start_stand_in_server()
+    try:
+        with RemoteDataAccess(f"http://127.0.0.1:{server.server_address[1]}") as remote:
+            async_data = AsyncFIMCPDataAccess(accessor=remote)
+            profile = asyncio.run(async_data.get_complete_profile("2222222222"))
+            assert profile == FIMCPDataAccess().get_complete_profile("2222222222")
+            assert remote.connection_info()["requests"] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("  ✅ Async remote profile loaded in one batched request")
+
+
+def main():
+    """Run all async access tests"""
+    test_async_getters_match_sync()
+    test_async_profile_reads_concurrently()
+    test_async_remote_profile_is_batched()
+    print("✅ All async FI-MCP tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the cohort analytics engine.
+Builds the cohort table over the dummy personas and checks its lookups.
+"""
+
+import sys
+import os
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    CohortTable,
+    FIMCPDataAccess,
+    SnapshotDataAccess,
+    analyze_user_financial_health,
+    build_cohort_table,
+    cohort_metrics,
+    compile_snapshot
+)
+
+
+def test_cohort_table():
+    """Test metrics, distributions and per-user comparisons"""
+    print("=== Cohort Analytics Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    table = build_cohort_table(accessor=fi_data)
+    users = fi_data.get_available_users()
+    assert len(table) == len(users)
+    
+    for user_id in users:
+        health = analyze_user_financial_health(user_id)
+        row = table.rows[user_id]
+        assert row["net_worth"] == health.get("total_net_worth")
+        assert row["credit_score"] == health.get("credit_score")
+    
+    # Users with an empty bank transactions file have no savings rate
+    assert table.rows["1111111111"]["savings_rate"] is None
+    net_worth = sorted(row["net_worth"] for row in table.rows.values() if row["net_worth"] is not None)
+    assert table.percentile("net_worth", 0) == net_worth[0]
+    assert table.percentile("net_worth", 100) == net_worth[-1]
+    assert net_worth[0] <= table.percentile("net_worth", 50) <= net_worth[-1]
+    
+    # A zero net worth is a value, not missing data
+    assert table.rows["2525252525"]["net_worth"] == 0
+    assert table.compare("2525252525")["net_worth"]["value"] == 0
+    
+    distributions = table.distributions()
+    assert distributions["net_worth"]["count"] == len(users)
+    for metric, stats in distributions.items():
+        print(f"  📊 {metric}: n={stats['count']}, p50={stats['p50']}")
+        assert stats["p10"] <= stats["p25"] <= stats["p50"] <= stats["p75"] <= stats["p90"]
+    
+    comparison = table.compare("2222222222")
+    print(f"  🔍 2222222222 net worth percentile: {comparison['net_worth']['percentile_rank']:.1f}")
+    assert 0 < comparison["net_worth"]["percentile_rank"] < 100
+    assert table.percentile_rank("net_worth", net_worth[-1] + 1) == 100
+    assert table.percentile_rank("net_worth", net_worth[0] - 1) == 0
+    assert table.compare("0000000000") is None
+    
+    try:
+        table.percentile("no_such_metric", 50)
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    
+    # Parallel scans and saved tables give the same result
+    parallel = build_cohort_table(accessor=fi_data, workers=4)
+    assert parallel.rows == table.rows
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "fi_mcp.snapshot")
+        compile_snapshot(None, snapshot_path)
+        with SnapshotDataAccess(snapshot_path) as snapshot:
+            assert build_cohort_table(accessor=snapshot, workers=2, use_processes=True).rows == table.rows
+    restored = CohortTable.from_dict(json.loads(json.dumps(table.to_dict())))
+    assert restored.distributions() == distributions
+    print("  ✅ Cohort table matches per-user analysis")
+
+
+def test_cohort_metrics_edge_cases():
+    """Test metric extraction on empty and malformed profiles"""
+    print("\n=== Cohort Metric Edge Cases ===\n")
+    
+    empty = cohort_metrics({"user_id": "0"})
+    assert all(value is None for value in empty.values())
+    malformed = cohort_metrics({
+        "net_worth": {"netWorthResponse": {"totalNetWorthValue": {"units": "abc"}}},
+        "credit_report": {"creditReports": []},
+        "epf_details": {"uanAccounts": [{"rawDetails": {"est_details": [{"pf_balance": {"net_balance": "1000"}}]}}]}
+    })
+    assert malformed["net_worth"] is None and malformed["credit_score"] is None
+    assert malformed["epf_balance"] == 1000
+    zero = cohort_metrics({"net_worth": {
+        "netWorthResponse": {"totalNetWorthValue": {"currencyCode": "INR", "units": "0"}},
+        "mfSchemeAnalytics": {"schemeAnalytics": [
+            {"schemeDetail": {"isinNumber": "INF000000001"}, "enrichedAnalytics": {"analytics": {"schemeDetails": {
+                "currentValue": {"currencyCode": "INR", "units": "0"}, "XIRR": 12.0}}}}
+        ]}
+    }})
+    assert zero["net_worth"] == 0 and zero["mf_xirr"] is None
+    print("  ✅ Missing and malformed data yield None")
+
+
+def main():
+    """Run all cohort tests"""
+    test_cohort_table()
+    test_cohort_metrics_edge_cases()
+    print("✅ All cohort tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script for sharded FI-MCP data directory layouts.
+Migrates a copy of the dummy data and checks every reader against it.
+"""
+
+import sys
+import os
+import shutil
+import tempfile
+import types
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    DataLayout,
+    FIMCPDataAccess,
+    SnapshotDataAccess,
+    compile_snapshot,
+    migrate_layout
+)
+
+
+def test_sharded_layout():
+    """Test migration to a sharded layout and access through it"""
+    print("=== Sharded Layout Tests ===\n")
+    
+    flat = FIMCPDataAccess()
+    users = sorted(flat.get_available_users())
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_dir = os.path.join(tmp_dir, "data")
+        shutil.copytree(flat.data_dir, data_dir)
+        
+        stats = migrate_layout(data_dir, shard_depth=2, shard_width=2)
+        assert stats["users"] == len(users)
+        layout = DataLayout.load(data_dir)
+        assert layout == DataLayout(2, 2) and layout.sharded
+        ab, cd = layout.shard_parts("2222222222")
+        assert os.path.isdir(os.path.join(data_dir, ab, cd, "2222222222"))
+        assert not any(name.isdigit() and len(name) > 2 for name in os.listdir(data_dir))
+        print(f"  🗂️ 2222222222 lives in {ab}/{cd}/2222222222")
+        
+        sharded = FIMCPDataAccess(data_dir)
+        assert isinstance(sharded.iter_available_users(), types.GeneratorType)
+        assert sorted(sharded.iter_available_users()) == users
+        for user_id in users:
+            assert sharded.get_complete_profile(user_id) == flat.get_complete_profile(user_id)
+            assert sharded.analyze_user_financial_health(user_id) == flat.analyze_user_financial_health(user_id)
+        assert sharded.get_net_worth("0000000000") is None
+        assert sharded.get_net_worth("../2222222222") is None
+        assert list(sharded.iter_bank_transactions("2222222222")) == list(flat.iter_bank_transactions("2222222222"))
+        
+        # Files added to a user directory are seen without a manifest refresh
+        user_dir = sharded._user_dir("1111111111")
+        os.remove(user_dir / "fetch_net_worth.json")
+        assert sharded.get_net_worth("1111111111") is None
+        shutil.copy(flat.data_dir / "1111111111" / "fetch_net_worth.json", user_dir)
+        assert sharded.get_net_worth("1111111111") == flat.get_net_worth("1111111111")
+        
+        snapshot_path = os.path.join(tmp_dir, "fi_mcp.snapshot")
+        compile_snapshot(data_dir, snapshot_path)
+        with SnapshotDataAccess(snapshot_path) as snapshot:
+            assert snapshot.get_available_users() == users
+            assert snapshot.get_complete_profile("2222222222") == flat.get_complete_profile("2222222222")
+        
+        # Back to the flat layout
+        stats = migrate_layout(data_dir, shard_depth=0)
+        assert stats["users"] == len(users)
+        assert sorted(os.listdir(data_dir)) == users
+        assert not DataLayout.load(data_dir).sharded
+        assert sorted(FIMCPDataAccess(data_dir).get_available_users()) == users
+    print("  ✅ Sharded layout serves the same data as the flat layout")
+
+
+def test_interrupted_migration():
+    """Test that re-running an interrupted migration completes it"""
+    print("\n=== Interrupted Migration Tests ===\n")
+    
+    source = FIMCPDataAccess().data_dir
+    with tempfile.TemporaryDirectory() as data_dir:
+        for user_id in ("1111111111", "2222222222", "3333333333"):
+            shutil.copytree(source / user_id, os.path.join(data_dir, user_id))
+        
+        # Simulate a crash after the first user moved
+        target = DataLayout(1, 2)
+        moved = target.user_dir(data_dir, "1111111111")
+        moved.parent.mkdir(parents=True)
+        os.rename(os.path.join(data_dir, "1111111111"), moved)
+        
+        stats = migrate_layout(data_dir, shard_depth=1, shard_width=2)
+        assert stats["users"] == 2
+        fi_data = FIMCPDataAccess(data_dir)
+        assert sorted(fi_data.get_available_users()) == ["1111111111", "2222222222", "3333333333"]
+        assert migrate_layout(data_dir, shard_depth=1, shard_width=2)["users"] == 0
+    
+    try:
+        DataLayout(shard_depth=21, shard_width=2)
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Interrupted migration resumed")
+
+
+def main():
+    """Run all layout tests"""
+    test_sharded_layout()
+    test_interrupted_migration()
+    print("✅ All layout tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
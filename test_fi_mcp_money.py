@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the integer-paise Money type.
+Checks nanos rounding, arithmetic and exact bulk sums over real holdings.
+"""
+
+import sys
+import os
+from fractions import Fraction
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import FIMCPDataAccess, Money, paise_array, total_paise
+
+
+def test_money_conversion():
+    """Test units/nanos conversion, rounding and round-trips"""
+    print("=== Money Conversion Tests ===\n")
+    
+    assert Money.from_dict({"currencyCode": "INR", "units": "1500", "nanos": 750000000}).paise == 150075
+    assert Money.from_dict({"units": "-3103", "nanos": -460000000}).paise == -310346
+    # Nanos round half away from zero
+    assert Money.from_dict({"units": "0", "nanos": 5000000}).paise == 1
+    assert Money.from_dict({"units": "0", "nanos": -5000000}).paise == -1
+    assert Money.from_dict({"units": "0", "nanos": 4999999}).paise == 0
+    assert Money.from_dict(None) == Money()
+    assert Money.from_rupees("10.005").paise == 1001
+    assert Money.from_rupees(25000).paise == 2500000
+    
+    for paise in (0, 1, 99, 150075, -310346, -5, 2 ** 53 + 1, -(2 ** 63) + 7):
+        money = Money(paise)
+        assert Money.from_dict(money.to_dict()) == money
+    assert Money(2 ** 53 + 1).to_dict() == {"currencyCode": "INR", "units": str((2 ** 53 + 1) // 100), "nanos": 930000000}
+    assert Money(-5).to_dict() == {"currencyCode": "INR", "units": "0", "nanos": -50000000}
+    
+    try:
+        Money.from_dict({"units": "abc"})
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Conversion and rounding are exact")
+
+
+def test_money_arithmetic():
+    """Test arithmetic, ordering and currency checks"""
+    print("\n=== Money Arithmetic Tests ===\n")
+    
+    a, b = Money(1050), Money(250)
+    assert a + b == Money(1300)
+    assert a - b == Money(800)
+    assert -a == Money(-1050)
+    assert a * 3 == 3 * a == Money(3150)
+    assert sum([a, b, b]) == Money(1550)
+    assert b < a and max(a, b) is a
+    assert not Money() and Money(1)
+    assert (a + b).rupees == 13.0
+    
+    try:
+        Money(100, "INR") + Money(100, "USD")
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    try:
+        Money.sum([{"currencyCode": "USD", "units": "1"}])
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Arithmetic and currency checks work")
+
+
+def test_bulk_totals():
+    """Test exact bulk conversion over mutual fund scheme analytics"""
+    print("\n=== Money Bulk Total Tests ===\n")
+    
+    data_access = FIMCPDataAccess()
+    values = []
+    for user_id in data_access.get_available_users():
+        net_worth = data_access.get_net_worth(user_id) or {}
+        for scheme in net_worth.get("mfSchemeAnalytics", {}).get("schemeAnalytics", []):
+            details = scheme.get("enrichedAnalytics", {}).get("analytics", {}).get("schemeDetails", {})
+            values.append(details.get("currentValue"))
+            values.append(details.get("investedValue"))
+    assert values
+    
+    # Reference sum using exact fractions of a rupee
+    expected = sum(
+        Fraction(int(value.get("units", 0))) + Fraction(value.get("nanos", 0), 10 ** 9)
+        for value in values if value
+    )
+    paise = paise_array(values)
+    assert len(paise) == len(values)
+    assert sum(paise) == total_paise(values) == Money.sum(values).paise
+    assert abs(Fraction(total_paise(values), 100) - expected) <= Fraction(len(values), 200)
+    print(f"  💰 {len(values)} scheme values total ₹{Money.sum(values).rupees:,.2f}")
+    print("  ✅ Bulk totals are exact")
+
+
+def main():
+    """Run all Money tests"""
+    test_money_conversion()
+    test_money_arithmetic()
+    test_bulk_totals()
+    print("✅ All Money tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
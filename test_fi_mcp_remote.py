@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script for the remote FI-MCP backend.
+Serves the dummy data from the local stand-in server and checks the
+remote backend against the file backend.
+"""
+
+import sys
+import os
+import socket
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import FIMCPDataAccess, RemoteDataAccess, benchmark_remote, start_stand_in_server
+
+
+def test_remote_matches_file_backend():
+    """Test getters, batching and ETag revalidation against the stand-in server"""
+    print("=== FI-MCP Remote Backend Tests ===\n")
+    
+    file_data = FIMCPDataAccess()
+    server = start_stand_in_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with RemoteDataAccess(url, pool_size=2) as remote:
+            users = remote.get_available_users()
+            assert sorted(users) == sorted(file_data.get_available_users())
+            
+            for user_id in users:
+                before = remote.connection_info()["requests"]
+                assert remote.get_complete_profile(user_id) == file_data.get_complete_profile(user_id)
+                # One batched request per profile
+                assert remote.connection_info()["requests"] == before + 1
+                assert remote.analyze_user_financial_health(user_id) == file_data.analyze_user_financial_health(user_id)
+            
+            info = remote.connection_info()
+            print(f"  🛰️ {info['requests']} requests over {info['connections']} keep-alive connections")
+            assert info["connections"] <= 2
+            
+            # Cached payloads are revalidated, not downloaded again
+            remote.clear_cache()
+            net_worth = remote.get_net_worth("2222222222")
+            assert remote.get_net_worth("2222222222") is net_worth
+            assert remote.cache_info()["hits"] == 1
+            profile = remote.get_complete_profile("2222222222")
+            assert profile["net_worth"] is net_worth
+            raw = remote.get_raw("2222222222", "net_worth")
+            assert raw == file_data.get_raw("2222222222", "net_worth")
+            assert remote.get_raw("2222222222", "net_worth") is raw
+            assert remote.get_raw("0000000000", "net_worth") is None
+            
+            assert list(remote.iter_bank_transactions("2222222222")) == \
+                list(file_data.iter_bank_transactions("2222222222"))
+            assert remote.get_net_worth("0000000000") is None
+            assert remote.get_net_worth("../etc") is None
+            assert remote.get_complete_profile("0000000000", ["net_worth"]) == {"user_id": "0000000000", "net_worth": None}
+    finally:
+        server.shutdown()
+        server.server_close()
+    print("  ✅ Remote backend matches the directory backend")
+
+
+def test_remote_timeouts():
+    """Test that per-endpoint timeouts surface as errors, not missing data"""
+    print("\n=== Remote Timeout Tests ===\n")
+    
+    # A listening socket that never answers
+    silent = socket.socket()
+    silent.bind(("127.0.0.1", 0))
+    silent.listen(8)
+    try:
+        remote = RemoteDataAccess(f"http://127.0.0.1:{silent.getsockname()[1]}", timeouts={"index": 0.2})
+        try:
+            remote.get_user_summary("2222222222")
+            raise AssertionError("Expected a timeout")
+        except OSError as e:
+            print(f"  ⏱️ Index request timed out: {type(e).__name__}")
+        remote.close()
+    finally:
+        silent.close()
+    
+    try:
+        RemoteDataAccess("http://127.0.0.1:1", timeouts={"no_such_endpoint": 1})
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Timeouts are enforced per endpoint")
+
+
+def test_remote_service_errors():
+    """Test that error responses other than 404 are raised and keep the cache"""
+    print("\n=== Remote Service Error Tests ===\n")
+    
+    server = start_stand_in_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    handler = server.RequestHandlerClass
+    serve = handler.do_GET
+    try:
+        with RemoteDataAccess(url, manifest_ttl=60) as remote:
+            net_worth = remote.get_net_worth("2222222222")
+            handler.do_GET = lambda self: self._send(503)
+            for load in (lambda: remote.get_net_worth("2222222222"),
+                         lambda: remote.get_complete_profile("2222222222"),
+                         lambda: remote.get_user_summary("3333333333"),
+                         lambda: remote.get_available_users()):
+                try:
+                    load()
+                    raise AssertionError("Expected OSError")
+                except OSError as e:
+                    print(f"  ❌ {e}")
+            
+            # The outage neither evicts cached payloads nor marks users unknown
+            handler.do_GET = serve
+            assert remote.get_net_worth("2222222222") is net_worth
+            assert remote.get_user_summary("3333333333")["profile_completeness"] > 0
+    finally:
+        handler.do_GET = serve
+        server.shutdown()
+        server.server_close()
+    print("  ✅ Service errors are raised, not reported as missing data")
+
+
+def test_remote_benchmark():
+    """Test the file vs remote benchmark"""
+    print("\n=== Remote Benchmark Tests ===\n")
+    
+    results = benchmark_remote(repeat=1)
+    assert set(results) == {"file", "remote_batched", "remote_per_type"}
+    assert results["remote_batched"]["requests"] * 6 == results["remote_per_type"]["requests"]
+    for name, stats in results.items():
+        print(f"  ⏱️ {name}: {stats['avg_ms']:.3f} ms/profile")
+
+
+def main():
+    """Run all remote backend tests"""
+    test_remote_matches_file_backend()
+    test_remote_timeouts()
+    test_remote_service_errors()
+    test_remote_benchmark()
+    print("✅ All remote backend tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
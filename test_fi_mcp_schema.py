@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test script for the compiled payload schemas.
+Checks the typed views of the dummy data, error paths of malformed
+payloads and the cached views of the data access layer.
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+from datetime import date
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    FIMCPDataAccess,
+    SchemaError,
+    get_view,
+    validate_payload
+)
+from humsafar_financial_ai.fi_mcp_data_access import PROFILE_DATA_TYPES
+
+
+def test_views_of_dummy_data():
+    """Test that every bundled payload validates into a consistent view"""
+    print("=== Payload Schema Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    checked = 0
+    for user_id in fi_data.get_available_users():
+        for field in PROFILE_DATA_TYPES:
+            view = fi_data.get_view(user_id, field)
+            if view is not None:
+                checked += 1
+    print(f"  ✅ {checked} payloads validated")
+    
+    net_worth = fi_data.get_view("2222222222", "net_worth")
+    assert net_worth.total_paise == 65830500
+    assert net_worth.total_assets_paise - net_worth.total_liabilities_paise == net_worth.total_paise
+    assert net_worth.schemes[0].isin == "INF760K01FC4"
+    
+    bank = fi_data.get_view("2222222222", "bank_transactions")
+    raw_bank = fi_data.get_bank_transactions("2222222222")
+    assert bank.txn_count == sum(len(account["txns"]) for account in raw_bank["bankTransactions"])
+    first = bank.accounts[0].txns[0]
+    assert first.amount_paise == 8008500 and first.date == date(2025, 7, 9) and first.type == 1
+    
+    stocks = fi_data.get_view("2222222222", "stock_transactions")
+    assert stocks.stocks[0].txns[0].nav is None
+    assert fi_data.get_view("2222222222", "credit_report").score == 746
+    assert get_view("2222222222", "epf_details").balance_paise == 21111100
+    
+    # Empty files give empty views
+    assert fi_data.get_view("1111111111", "credit_report").score is None
+    assert fi_data.get_view("1111111111", "bank_transactions").txn_count == 0
+    assert fi_data.get_view("0000000000", "net_worth") is None
+    
+    try:
+        fi_data.get_view("2222222222", "no_such_type")
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+
+
+def test_malformed_payloads():
+    """Test that malformed payloads fail with the offending path"""
+    print("\n=== Malformed Payload Tests ===\n")
+    
+    cases = [
+        ("credit_report", {"creditReports": [{"creditReportData": {"score": {"bureauScore": "n/a"}}}]},
+         ["creditReports", 0, "creditReportData", "score", "bureauScore"]),
+        ("bank_transactions", {"bankTransactions": [{"bank": "X", "txns": [["100", "n", "2025-13-01", 1]]}]},
+         ["bankTransactions", 0, "txns", 0, 2]),
+        ("net_worth", {"netWorthResponse": {"assetValues": [{"value": {"units": "1"}}]}},
+         ["netWorthResponse", "assetValues", 0, "netWorthAttribute"]),
+        ("mutual_fund_transactions", {"mfTransactions": [{"txns": [[1, "2024-01-01", 10]]}]},
+         ["mfTransactions", 0, "txns", 0]),
+        ("epf_details", {"uanAccounts": {"rawDetails": {}}}, ["uanAccounts"]),
+        ("stock_transactions", [], [])
+    ]
+    for data_type, payload, path in cases:
+        try:
+            validate_payload(data_type, payload)
+            raise AssertionError(f"Expected SchemaError for {data_type}")
+        except SchemaError as e:
+            assert e.path == path, (data_type, e.path)
+            assert e.data_type == data_type
+            print(f"  ❌ {e}")
+    
+    assert isinstance(SchemaError("x"), ValueError)
+    print("  ✅ Malformed payloads rejected with their paths")
+
+
+def test_cached_views():
+    """Test that views and schema errors are cached until the file changes"""
+    print("\n=== Cached View Tests ===\n")
+    
+    source = FIMCPDataAccess().data_dir
+    temp_dir = tempfile.mkdtemp()
+    try:
+        shutil.copytree(source / "2222222222", os.path.join(temp_dir, "2222222222"))
+        fi_data = FIMCPDataAccess(temp_dir)
+        view = fi_data.get_view("2222222222", "credit_report")
+        assert fi_data.get_view("2222222222", "credit_report") is view
+        
+        path = os.path.join(temp_dir, "2222222222", "fetch_credit_report.json")
+        with open(path, "w") as f:
+            json.dump({"creditReports": [{"creditReportData": {"score": {"bureauScore": "bad"}}}]}, f)
+        os.utime(path, ns=(1, 1))
+        
+        errors = []
+        for _ in range(2):
+            try:
+                fi_data.get_view("2222222222", "credit_report")
+            except SchemaError as e:
+                errors.append(e)
+        assert len(errors) == 2 and errors[0] is errors[1]
+        
+        # Summaries treat the malformed report as present without a score
+        summary = fi_data.get_user_summary("2222222222")
+        assert summary["data_availability"]["credit_report"] and summary["credit_score"] is None
+        print("  ✅ Views and schema errors cached per payload")
+    finally:
+        shutil.rmtree(temp_dir)
+
+
+def main():
+    """Run all schema tests"""
+    test_views_of_dummy_data()
+    test_malformed_payloads()
+    test_cached_views()
+    print("✅ All schema tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for the packed FI-MCP snapshot format.
+Builds a snapshot from the dummy data and checks it against the file backend.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import FIMCPDataAccess, SnapshotDataAccess, compile_snapshot
+
+
+def test_snapshot_matches_file_backend():
+    """Test that every getter returns the same data from a snapshot"""
+    print("=== FI-MCP Snapshot Tests ===\n")
+    
+    file_data = FIMCPDataAccess()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "fi_mcp.snapshot")
+        stats = compile_snapshot(None, snapshot_path)
+        print(f"  📦 Packed {stats['entries']} files for {stats['users']} users")
+        
+        with SnapshotDataAccess(snapshot_path) as snapshot:
+            users = snapshot.get_available_users()
+            assert users == sorted(file_data.get_available_users())
+            
+            for user_id in users:
+                assert snapshot.get_complete_profile(user_id) == file_data.get_complete_profile(user_id)
+            
+            health = snapshot.analyze_user_financial_health("7777777777")
+            print(f"  💳 Credit score from snapshot: {health.get('credit_score')}")
+            assert health == file_data.analyze_user_financial_health("7777777777")
+            
+            assert list(snapshot.iter_bank_transactions("2222222222")) == \
+                list(file_data.iter_bank_transactions("2222222222"))
+            
+            assert snapshot.get_net_worth("0000000000") is None
+            assert snapshot.get_net_worth("12345678901234567890") is None
+            
+            raw = snapshot.get_raw("2222222222", "credit_report")
+            assert isinstance(raw, memoryview)
+            assert bytes(raw) == file_data.get_raw("2222222222", "credit_report")
+            try:
+                snapshot.close()
+                raise AssertionError("Closed a snapshot with a live raw view")
+            except BufferError:
+                pass
+            raw.release()
+    print("  ✅ Snapshot backend matches the directory backend")
+
+
+def test_snapshot_process_workers():
+    """Test that process-pool workers read the snapshot, not the data directory"""
+    file_data = FIMCPDataAccess()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "fi_mcp.snapshot")
+        compile_snapshot(None, snapshot_path)
+        with SnapshotDataAccess(snapshot_path) as snapshot:
+            users = snapshot.get_available_users()[:4]
+            profiles = dict(snapshot.get_profiles(users, data_types=["net_worth", "credit_report"],
+                                                  workers=2, use_processes=True))
+            assert sorted(profiles) == users
+            for user_id in users:
+                assert profiles[user_id]["net_worth"] == file_data.get_net_worth(user_id)
+                assert profiles[user_id]["credit_report"] == file_data.get_credit_report(user_id)
+    print("  ✅ Process workers reopen the snapshot")
+
+
+def test_snapshot_rejects_foreign_file():
+    """Test that a non-snapshot file is refused"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bogus_path = os.path.join(tmp_dir, "bogus.snapshot")
+        with open(bogus_path, "wb") as f:
+            f.write(b"not a snapshot at all")
+        try:
+            SnapshotDataAccess(bogus_path)
+        except ValueError as e:
+            print(f"  ✅ Rejected foreign file: {e}")
+        else:
+            raise AssertionError("Foreign file was accepted as a snapshot")
+
+
+def main():
+    """Run all snapshot tests"""
+    test_snapshot_matches_file_backend()
+    test_snapshot_process_workers()
+    test_snapshot_rejects_foreign_file()
+    print("✅ All snapshot tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
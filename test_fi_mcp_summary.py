@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-user summary index.
+Checks summary contents, per-user invalidation and the stored summaries
+of the snapshot and SQLite backends.
+"""
+
+import sys
+import os
+import copy
+import shutil
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    FIMCPDataAccess,
+    SnapshotDataAccess,
+    SQLiteDataAccess,
+    compile_snapshot,
+    filter_summaries,
+    get_credit_report,
+    get_net_worth,
+    ingest_sqlite,
+    summarize_profile
+)
+
+
+def test_summary_contents():
+    """Test that summaries agree with the raw data"""
+    print("=== User Summary Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    summary = fi_data.get_user_summary("2222222222")
+    assert summary["availability_bits"] == 0b111111
+    assert summary["profile_completeness"] == 100
+    assert summary["total_net_worth"] == 658305
+    assert summary["total_assets"] - summary["total_liabilities"] == summary["total_net_worth"]
+    bank = fi_data.get_bank_transactions("2222222222")
+    assert summary["transaction_counts"]["bank_transactions"] == \
+        sum(len(account["txns"]) for account in bank["bankTransactions"])
+    print(f"  📋 2222222222: {summary['transaction_counts']}")
+    
+    # Empty credit report: available, but no score
+    summary = fi_data.get_user_summary("1111111111")
+    assert summary["data_availability"]["credit_report"] is True
+    assert "credit_score" not in summary
+    
+    unknown = fi_data.get_user_summary("0000000000")
+    assert unknown["availability_bits"] == 0 and unknown["profile_completeness"] == 0
+    
+    summaries = fi_data.get_user_summaries()
+    assert fi_data.build_summary_index() == len(summaries) == len(fi_data.get_available_users())
+    scored = filter_summaries(summaries.values(), require=["credit_report", "epf_details"], min_completeness=80)
+    assert scored and all(s["data_availability"]["epf"] for s in scored)
+    print(f"  🔎 {len(scored)} users with credit report and EPF, ≥80% complete")
+    try:
+        filter_summaries(summaries.values(), require=["no_such_type"])
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Summaries match the raw data")
+
+
+def test_summary_tolerates_bad_descriptive_fields():
+    """Test that one bad descriptive cell keeps the score and net worth"""
+    print("\n=== Bad Descriptive Field Tests ===\n")
+    
+    credit_report = copy.deepcopy(get_credit_report("7777777777"))
+    details = credit_report["creditReports"][0]["creditReportData"]["creditAccount"]["creditAccountDetails"]
+    details[0]["rateOfInterest"] = ""
+    net_worth = copy.deepcopy(get_net_worth("8888888888"))
+    scheme = net_worth["mfSchemeAnalytics"]["schemeAnalytics"][0]
+    scheme["enrichedAnalytics"]["analytics"]["schemeDetails"]["XIRR"] = "NA"
+    
+    available = {"net_worth": True, "credit_report": True}
+    summary = summarize_profile({"credit_report": credit_report, "net_worth": net_worth}, available)
+    expected = FIMCPDataAccess().get_user_summary("7777777777")["credit_score"]
+    assert summary["credit_score"] == expected is not None
+    assert summary["total_net_worth"] == FIMCPDataAccess().get_user_summary("8888888888")["total_net_worth"] != 0
+    print(f"  ✅ Score {summary['credit_score']} and net worth ₹{summary['total_net_worth']:,.0f} kept")
+
+
+def test_summary_invalidation():
+    """Test that a user's summary is rebuilt only when their files change"""
+    print("\n=== Summary Invalidation Tests ===\n")
+    
+    source = FIMCPDataAccess().data_dir
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for user_id in ("2222222222", "3333333333"):
+            shutil.copytree(source / user_id, os.path.join(tmp_dir, user_id))
+        fi_data = FIMCPDataAccess(tmp_dir, manifest_ttl=0)
+        before = fi_data.get_user_summary("2222222222")
+        other = fi_data.get_user_summary("3333333333")
+        assert fi_data.get_user_summary("2222222222") is before
+        
+        net_worth_path = os.path.join(tmp_dir, "2222222222", "fetch_net_worth.json")
+        with open(net_worth_path) as f:
+            text = f.read()
+        with open(net_worth_path, "w") as f:
+            f.write(text.replace('"658305"', '"7000000"'))
+        after = fi_data.get_user_summary("2222222222")
+        assert after["total_net_worth"] == 7000000
+        assert fi_data.get_user_summary("3333333333") is other
+        
+        os.remove(os.path.join(tmp_dir, "2222222222", "fetch_credit_report.json"))
+        fi_data.refresh_manifest()
+        health = fi_data.analyze_user_financial_health("2222222222")
+        assert "credit_score" not in health and health["profile_completeness"] < 100
+    print("  ✅ Only the changed user's summary is rebuilt")
+
+
+def test_stored_summaries():
+    """Test summaries materialized by the snapshot and SQLite builders"""
+    print("\n=== Stored Summary Tests ===\n")
+    
+    file_data = FIMCPDataAccess()
+    expected = file_data.get_user_summaries()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        snapshot_path = os.path.join(tmp_dir, "fi_mcp.snapshot")
+        stats = compile_snapshot(None, snapshot_path)
+        assert stats["summaries"] == len(expected)
+        with SnapshotDataAccess(snapshot_path) as snapshot:
+            snapshot.clear_cache()
+            assert snapshot.get_user_summaries() == expected
+            assert snapshot.cache_info()["misses"] == len(expected)
+        
+        db_path = os.path.join(tmp_dir, "fi_mcp.sqlite")
+        stats = ingest_sqlite(None, db_path)
+        assert stats["summaries"] == len(expected)
+        with SQLiteDataAccess(db_path) as db:
+            assert db.get_user_summaries() == expected
+            assert db.cache_info()["misses"] == len(expected)
+    print(f"  📦 {len(expected)} summaries served from snapshot and SQLite without decoding payloads")
+
+
+def main():
+    """Run all summary tests"""
+    test_summary_contents()
+    test_summary_tolerates_bad_descriptive_fields()
+    test_summary_invalidation()
+    test_stored_summaries()
+    print("✅ All summary tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
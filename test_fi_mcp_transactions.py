@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test script for the FI-MCP transaction analytics helpers.
+Checks the columnar bank table against the raw JSON payloads.
+"""
+
+import sys
+import os
+import io
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import BankTransactionTable, FIMCPDataAccess
+from humsafar_financial_ai.fi_mcp_transactions import iter_transaction_rows
+
+
+def test_bank_transaction_table():
+    """Test columnar bank transaction table construction and queries"""
+    print("=== Bank Transaction Table Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    user_id = "2222222222"
+    payload = fi_data.get_bank_transactions(user_id)
+    raw_rows = [(bank["bank"], txn) for bank in payload["bankTransactions"] for txn in bank["txns"]]
+    
+    table = fi_data.get_bank_transaction_table(user_id)
+    assert table is fi_data.get_bank_transaction_table(user_id)
+    assert len(table) == len(raw_rows)
+    
+    bank, first = raw_rows[0]
+    assert table.row(0) == (float(first[0]), first[1], first[2], first[3], first[4], float(first[5]), bank)
+    assert table.total() == sum(float(txn[0]) for _, txn in raw_rows)
+    
+    debits = table.filter(types=[2], start="2025-06-01", min_amount=1000)
+    expected = [txn for _, txn in raw_rows if txn[3] == 2 and txn[2] >= "2025-06-01" and float(txn[0]) >= 1000]
+    assert len(debits) == len(expected)
+    assert debits.total() == sum(float(txn[0]) for txn in expected)
+    print(f"  🏦 Debits >= ₹1,000 since June: {len(debits)} totalling ₹{debits.total():,.2f}")
+    
+    by_type = table.group_by("type")
+    assert sum(group["count"] for group in by_type.values()) == len(table)
+    print(f"  📊 Groups by type: {sorted(by_type)}")
+    
+    for month, flow in table.cash_flow().items():
+        print(f"  💸 {month}: in ₹{flow['inflow']:,.0f} / out ₹{flow['outflow']:,.0f}")
+        assert flow["net"] == flow["inflow"] - flow["outflow"]
+    
+    assert len(BankTransactionTable.from_payload({})) == 0
+    assert fi_data.get_bank_transaction_table("0000000000") is None
+    print("  ✅ Columnar table matches the raw payload")
+
+
+def test_short_bank_rows():
+    """Test that rows without the optional mode and balance columns are accepted"""
+    payload = {"bankTransactions": [{"bank": "SBI", "txns": [
+        ["500", "UPI/tea", "2025-01-02", 2],
+        ["2000", "SALARY", "2025-01-01", 1, "NEFT"],
+        ["100", "ATM", "2025-01-03", 2, None, "1400"]
+    ]}]}
+    table = BankTransactionTable.from_payload(payload)
+    assert table.row(0) == (500.0, "UPI/tea", "2025-01-02", 2, "", 0.0, "SBI")
+    assert table.row(1)[4:6] == ("NEFT", 0.0) and table.row(2)[4:6] == ("", 1400.0)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.makedirs(os.path.join(tmp_dir, "2222222222"))
+        with open(os.path.join(tmp_dir, "2222222222", "fetch_bank_transactions.json"), "w") as f:
+            json.dump(payload, f)
+        fi_data = FIMCPDataAccess(tmp_dir)
+        assert fi_data.get_view("2222222222", "bank_transactions").txn_count == 3
+        rows = fi_data.query_bank_transactions("2222222222", types=[2])
+        assert [row["date"] for row in rows] == ["2025-01-02", "2025-01-03"]
+    print("  ✅ Short bank rows get default mode and balance")
+
+
+def test_streaming_transaction_iterators():
+    """Test incremental bank and MF transaction iterators"""
+    print("=== Streaming Transaction Iterator Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    for user_id in fi_data.get_available_users():
+        bank_payload = fi_data.get_bank_transactions(user_id) or {}
+        expected = [(b["bank"], t) for b in bank_payload.get("bankTransactions", []) for t in b["txns"]]
+        assert list(fi_data.iter_bank_transactions(user_id)) == expected
+        
+        mf_payload = fi_data.get_mutual_fund_transactions(user_id) or {}
+        expected = [(f["isin"], t) for f in mf_payload.get("mfTransactions", []) for t in f["txns"]]
+        assert list(fi_data.iter_mf_transactions(user_id)) == expected
+    
+    hdfc = list(fi_data.iter_bank_transactions("2222222222", bank="HDFC Bank"))
+    assert hdfc and all(bank == "HDFC Bank" for bank, _ in hdfc)
+    nifty = list(fi_data.iter_mf_transactions("2222222222", isin="INF109K012M7"))
+    assert nifty == [("INF109K012M7", [1, "2022-03-09", 165.7187, 60.5063, 10027])]
+    assert list(fi_data.iter_bank_transactions("0000000000")) == []
+    print(f"  🏦 HDFC Bank rows streamed: {len(hdfc)}")
+    
+    # Tiny chunks exercise values split across buffer refills
+    with open(fi_data.data_dir / "2222222222" / "fetch_bank_transactions.json", encoding="utf-8") as f:
+        text = f.read()
+    streamed = list(iter_transaction_rows(io.StringIO(text), "bankTransactions", "bank", chunk_size=7))
+    assert streamed == list(fi_data.iter_bank_transactions("2222222222"))
+    
+    # Label keys that follow the txns array are still honoured
+    document = json.dumps({"mfTransactions": [
+        {"txns": [[1, "2024-01-01", 10.5, 2, 21]], "isin": "A"},
+        {"txns": [[2, "2024-02-01", 11.0, 1, 11]], "isin": "B"}
+    ]})
+    rows = list(iter_transaction_rows(io.StringIO(document), "mfTransactions", "isin", "B", chunk_size=5))
+    assert rows == [("B", [2, "2024-02-01", 11.0, 1, 11])]
+    print("  ✅ Streaming iterators match the decoded payloads")
+
+
+def test_date_range_queries():
+    """Test bisect-backed date range and type queries"""
+    print("=== Date Range Query Tests ===\n")
+    
+    fi_data = FIMCPDataAccess()
+    user_id = "2222222222"
+    payload = fi_data.get_bank_transactions(user_id)
+    expected = sorted(
+        (txn[2], float(txn[0])) for bank in payload["bankTransactions"] for txn in bank["txns"]
+        if txn[3] == 2 and "2025-06-10" <= txn[2] <= "2025-06-20"
+    )
+    rows = fi_data.query_bank_transactions(user_id, start="2025-06-10", end="2025-06-20", types=[2])
+    assert sorted((row["date"], row["amount"]) for row in rows) == expected
+    assert [row["date"] for row in rows] == sorted(row["date"] for row in rows)
+    print(f"  🏦 Debits 10-20 June: {len(rows)}")
+    
+    installments = fi_data.query_bank_transactions("1414141414", types=[6])
+    assert installments and all(row["type"] == 6 for row in installments)
+    print(f"  💳 Installment rows for 1414141414: {len(installments)}")
+    
+    sells = fi_data.query_mf_transactions("1313131313", start="2023-01-01", order_types=[2])
+    assert sells and all(row["order_type"] == 2 and row["date"] >= "2023-01-01" for row in sells)
+    buys = fi_data.query_mf_transactions("2222222222", isin="INF109K012M7")
+    assert buys == [{"isin": "INF109K012M7", "scheme_name": "ICICI Prudential Nifty 50 Index Fund - Direct Plan Growth ",
+                     "folio_id": "1234567", "date": "2022-03-09", "order_type": 1,
+                     "price": 165.7187, "units": 60.5063, "amount": 10027.0}]
+    
+    stocks = fi_data.query_stock_transactions("2222222222", start="2024-01-01")
+    assert stocks and all(row["date"] >= "2024-01-01" for row in stocks)
+    assert fi_data.query_bank_transactions("0000000000") == []
+    print("  ✅ Range queries match brute-force filtering")
+
+
+def main():
+    """Run all transaction analytics tests"""
+    test_bank_transaction_table()
+    test_short_bank_rows()
+    test_streaming_transaction_iterators()
+    test_date_range_queries()
+    print("✅ All transaction analytics tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test script for the XIRR solver and the mutual fund XIRR of FI-MCP data.
+Checks the solver against known results and its fallback, and the
+per-folio and portfolio XIRR of the dummy users.
+"""
+
+import sys
+import os
+import json
+import shutil
+import tempfile
+import time
+from datetime import date
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    FIMCPDataAccess,
+    get_mutual_fund_transactions,
+    get_net_worth,
+    mutual_fund_xirr,
+    mutual_fund_xirr_for_users,
+    user_mutual_fund_xirr,
+    xirr
+)
+
+VALUATION_DATE = date(2024, 7, 1)
+
+
+def test_xirr_solver():
+    """Test the solver on known cashflows, bad guesses and invalid input"""
+    print("=== XIRR Solver Tests ===\n")
+    
+    # Spreadsheet XIRR reference example
+    amounts = [-10000, 2750, 4250, 3250, 2750]
+    dates = [date(2008, 1, 1), date(2008, 3, 1), date(2008, 10, 30), date(2009, 2, 15), date(2009, 4, 1)]
+    expected = 37.3362535
+    for guess in (10.0, -99.99, 500, 1e5):
+        assert abs(xirr(amounts, dates, guess) - expected) < 1e-6, guess
+    assert abs(xirr(amounts[::-1], dates[::-1]) - expected) < 1e-6
+    print(f"  ✅ Reference cashflows: {xirr(amounts, dates):.7f}% from every guess")
+    
+    # One year at 12% and a near-total loss
+    assert abs(xirr([-1000, 1120], [date(2021, 1, 1), date(2022, 1, 1)]) - 12) < 1e-8
+    assert abs(xirr([-1000, 10], [date(2021, 1, 1), date(2022, 1, 1)]) + 99) < 1e-8
+    
+    # A long monthly SIP takes the vectorized path when NumPy is installed
+    sip_dates = [date(2010 + month // 12, month % 12 + 1, 5) for month in range(120)]
+    sip_amounts = [-5000.0] * 120 + [1100000.0]
+    rate = xirr(sip_amounts, sip_dates + [date(2020, 1, 5)])
+    years = [(day - sip_dates[0]).days / 365 for day in sip_dates + [date(2020, 1, 5)]]
+    npv = sum(amount * (1 + rate / 100) ** -year for amount, year in zip(sip_amounts, years))
+    assert abs(npv) < 1e-4
+    print(f"  ✅ 10-year SIP: {rate:.4f}%")
+    
+    # A losing SIP: Newton from 10% runs off to +inf where the NPV curve flattens
+    losing_dates = [date(2016 + month // 12, month % 12 + 1, 1) for month in range(84)] + [date(2023, 1, 1)]
+    losing_amounts = [-1000.0] * 84 + [42000.0]
+    for guess in (10.0, 100.0, -50.0):
+        rate = xirr(losing_amounts, losing_dates, guess)
+        assert abs(rate + 20.0529239) < 1e-6, (guess, rate)
+    print(f"  ✅ Losing SIP: {rate:.4f}% from every guess")
+    
+    for bad_amounts, bad_dates in (([-1000, -10], [date(2021, 1, 1), date(2022, 1, 1)]),
+                                   ([-1000, 1100], [date(2021, 1, 1)])):
+        try:
+            xirr(bad_amounts, bad_dates)
+            raise AssertionError("Expected ValueError")
+        except ValueError as e:
+            print(f"  ❌ {e}")
+
+
+def test_mutual_fund_xirr():
+    """Test per-folio and portfolio XIRR of the dummy users"""
+    print("\n=== Mutual Fund XIRR Tests ===\n")
+    
+    result = mutual_fund_xirr(get_mutual_fund_transactions("8888888888"), get_net_worth("8888888888"),
+                              VALUATION_DATE)
+    assert len(result["folios"]) == 4 and result["valuation_date"] == "2024-07-01"
+    kotak = result["folios"][0]
+    assert kotak["folio_id"] == "22112213333" and kotak["invested"] == 300000
+    assert kotak["value_source"] == "analytics" and kotak["current_value"] == 356569
+    assert kotak["reported_xirr"] == 11.5
+    assert kotak["xirr_difference"] == round(kotak["xirr"] - 11.504, 2)
+    portfolio = result["portfolio"]
+    assert portfolio["invested"] == 661000 and portfolio["current_value"] == 760627
+    rates = [folio["xirr"] for folio in result["folios"]]
+    assert min(rates) <= portfolio["xirr"] <= max(rates)
+    for folio in result["folios"]:
+        print(f"  📈 {folio['scheme_name']}: {folio['xirr']}% (reported {folio['reported_xirr']}%)")
+    
+    # Without analytics, folios are valued at their latest NAV
+    valued_at_nav = user_mutual_fund_xirr("1010101010", VALUATION_DATE)
+    assert all(folio["value_source"] == "latest_nav" for folio in valued_at_nav["folios"])
+    assert all(folio["matches_reported"] is None for folio in valued_at_nav["folios"])
+    assert user_mutual_fund_xirr("0000000000") is None
+    
+    # Folios sharing a scheme split its current value by units held
+    shared = user_mutual_fund_xirr("2222222222", VALUATION_DATE)
+    assert shared["folios"][2]["reported_xirr"] is None
+    
+    try:
+        mutual_fund_xirr(get_mutual_fund_transactions("8888888888"), valuation_date=date(2024, 1, 1))
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+    print("  ✅ Folio and portfolio XIRR computed")
+
+
+def test_nightly_run():
+    """Test the XIRR of every user in one scan"""
+    print("\n=== Nightly XIRR Run ===\n")
+    
+    start = time.perf_counter()
+    results = mutual_fund_xirr_for_users(valuation_date=VALUATION_DATE)
+    elapsed = time.perf_counter() - start
+    assert "8888888888" in results and list(results) == sorted(results)
+    folios = sum(len(result["folios"]) for result in results.values())
+    mismatches = sum(result["mismatches"] for result in results.values())
+    assert results["8888888888"] == mutual_fund_xirr(
+        get_mutual_fund_transactions("8888888888"), get_net_worth("8888888888"), VALUATION_DATE
+    )
+    print(f"  ⏱️ {len(results)} users, {folios} folios in {elapsed * 1000:.1f} ms "
+          f"({mismatches} differ from the reported XIRR)")
+    
+    # One user's bad data is reported in their result; the others still run
+    source = FIMCPDataAccess().data_dir
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for user_id in ("8888888888", "2222222222"):
+            shutil.copytree(source / user_id, os.path.join(tmp_dir, user_id))
+        with open(os.path.join(tmp_dir, "2222222222", "fetch_mf_transactions.json"), "w") as f:
+            json.dump({"mfTransactions": [{"isin": "X", "txns": [[1, "not a date", 10, 1, 10]]}]}, f)
+        partial = mutual_fund_xirr_for_users(tmp_dir, valuation_date=VALUATION_DATE)
+        assert "fetch_mf_transactions.json" in partial["2222222222"]["error"]
+        assert partial["8888888888"] == results["8888888888"]
+    early = mutual_fund_xirr_for_users(valuation_date=date(2000, 1, 1))
+    assert set(early) == set(results) and "after the valuation date" in early["8888888888"]["error"]
+    print(f"  ❌ {partial['2222222222']['error']}")
+
+
+def main():
+    """Run all XIRR tests"""
+    test_xirr_solver()
+    test_mutual_fund_xirr()
+    test_nightly_run()
+    print("✅ All XIRR tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script for the loan amortization engine.
+Checks schedules against the loan calculators and the moratorium,
+prepayment and rate reset handling.
+"""
+
+import sys
+import os
+import time
+from itertools import islice
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    ScheduleRow,
+    amortization_schedule,
+    amortization_table,
+    loan_prepayment_calculator,
+    loan_tenure_months,
+    medical_loan_emi_calculator,
+    personal_loan_emi_calculator
+)
+
+
+def test_schedule_matches_calculators():
+    """Test that schedules reproduce the EMI calculators"""
+    print("=== Amortization Schedule Tests ===\n")
+    
+    rows = list(amortization_schedule(500000, 12, 60))
+    expected = personal_loan_emi_calculator(500000, 12, 60)
+    assert len(rows) == 60 and isinstance(rows[0], ScheduleRow)
+    assert abs(rows[0].payment - expected["emi"]) < 0.01
+    assert abs(sum(row.interest for row in rows) - expected["total_interest"]) < 0.01
+    assert abs(sum(row.principal for row in rows) - 500000) < 1e-6
+    assert rows[-1].closing_balance == 0
+    assert all(abs(row.opening_balance - row.principal - row.closing_balance) < 1e-6 for row in rows)
+    print(f"  ✅ 60 rows, EMI ₹{rows[0].payment:.2f}, interest ₹{sum(row.interest for row in rows):.2f}")
+    
+    rows = list(amortization_schedule(400000, 11, 72, moratorium_months=6))
+    expected = medical_loan_emi_calculator(400000, 11, 72, moratorium_months=6)
+    assert len(rows) == 72 and all(row.payment == 0 for row in rows[:6])
+    assert abs(rows[5].closing_balance - 400000 - expected["moratorium_interest"]) < 0.01
+    assert abs(rows[6].payment - expected["emi"]) < 0.01
+    assert abs(sum(row.payment for row in rows) - expected["total_payment"]) < 0.01
+    print("  ✅ Moratorium schedule matches the medical loan calculator")
+    
+    with_schedule = personal_loan_emi_calculator(500000, 12, 60, include_schedule=True)
+    assert with_schedule["schedule"]["month"] == list(range(1, 61))
+    assert with_schedule["schedule"]["payment"][0] == with_schedule["emi"]
+    assert "schedule" not in expected
+    
+    interest_free = list(amortization_schedule(120000, 0, 12))
+    assert [row.payment for row in interest_free] == [10000] * 12
+
+
+def test_prepayments_and_rate_resets():
+    """Test prepayments and floating rates in both adjust modes"""
+    print("\n=== Prepayment and Rate Reset Tests ===\n")
+    
+    plain = list(amortization_schedule(2000000, 9, 120))
+    emi = plain[0].payment
+    shorter = list(amortization_schedule(2000000, 9, 120, prepayments={12: 300000}))
+    assert shorter[11].prepayment == 300000 and len(shorter) < 120
+    assert all(row.payment == emi for row in shorter[:-1])
+    smaller = list(amortization_schedule(2000000, 9, 120, prepayments={12: 300000}, adjust="emi"))
+    assert len(smaller) == 120 and smaller[12].payment < emi
+    assert abs(smaller[-1].closing_balance) < 1e-6
+    print(f"  ✅ Prepayment: {len(shorter)} months at ₹{emi:.2f} or 120 months at ₹{smaller[12].payment:.2f}")
+    
+    floating = list(amortization_schedule(2000000, 9, 120, rate_resets={25: 10.5}))
+    assert floating[24].rate == 10.5 and len(floating) > 120
+    refixed = list(amortization_schedule(2000000, 9, 120, rate_resets={25: 10.5}, adjust="emi"))
+    assert len(refixed) == 120 and refixed[24].payment > emi
+    print(f"  ✅ Rate reset: {len(floating)} months at the old EMI or 120 at ₹{refixed[24].payment:.2f}")
+    
+    prepaid = loan_prepayment_calculator(2000000, 25000, 8.5, 500000)
+    assert prepaid["original_tenure_months"] == loan_tenure_months(2000000, 8.5, 25000) == 119
+    assert prepaid["new_tenure_months"] == loan_tenure_months(1500000, 8.5, 25000)
+    assert prepaid["interest_saved"] > 0
+    reduced = loan_prepayment_calculator(2000000, 25000, 8.5, 500000, "reduce_emi")
+    assert reduced["new_tenure_months"] == 119 and reduced["new_emi"] < 25000
+    
+    for kwargs in ({"tenure_months": 12, "adjust": "neither"},
+                   {"tenure_months": 6, "moratorium_months": 6},
+                   {},
+                   {"emi": 1000}):
+        try:
+            amortization_schedule(200000, 9, **kwargs)
+            raise AssertionError("Expected ValueError")
+        except ValueError as e:
+            print(f"  ❌ {e}")
+    try:
+        list(amortization_schedule(200000, 9, emi=2000, rate_resets={3: 15}))
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+
+
+def test_lazy_and_columnar_output():
+    """Test paging a long schedule and the columnar table"""
+    print("\n=== Lazy and Columnar Output Tests ===\n")
+    
+    start = time.perf_counter()
+    page = list(islice(amortization_schedule(7500000, 8.75, 360), 12, 24))
+    page_time = time.perf_counter() - start
+    assert [row.month for row in page] == list(range(13, 25))
+    
+    start = time.perf_counter()
+    table = amortization_table(7500000, 8.75, 360)
+    table_time = time.perf_counter() - start
+    assert table["month"].typecode == "i" and table["interest"].typecode == "d"
+    assert len(table["month"]) == 360 and table["month"][12:24].tolist() == list(range(13, 25))
+    assert abs(sum(table["principal"]) - 7500000) < 1e-4
+    print(f"  ⏱️ Page of 12 rows {page_time * 1000:.2f} ms, full 360-row table {table_time * 1000:.2f} ms")
+
+
+def main():
+    """Run all amortization tests"""
+    test_schedule_matches_calculators()
+    test_prepayments_and_rate_resets()
+    test_lazy_and_columnar_output()
+    print("✅ All amortization tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
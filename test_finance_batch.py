@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the batch EMI calculator.
+Checks batch results against the single-loan calculators on every
+installed backend.
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import finance_calculators
+from humsafar_financial_ai.finance_batch import BATCH_BACKENDS, EMI_CALCULATOR_TERMS, batch_emi_calculator
+
+
+def test_batch_matches_calculators():
+    """Test that every backend reproduces the single-loan calculators"""
+    print("=== Batch EMI Calculator Tests ===\n")
+    
+    amounts = [100000, 250000, 500000, 1500000]
+    rates = [9.5, 10.85, 12, 14.25]
+    tenures = [12, 36, 60, 84]
+    for backend in BATCH_BACKENDS:
+        for name, terms in EMI_CALCULATOR_TERMS.items():
+            result = batch_emi_calculator(amounts, rates, tenures, backend=backend, **terms)
+            assert result["count"] == 4 and result["backend"] == backend
+            calculator = getattr(finance_calculators, name)
+            for index, (amount, rate, tenure) in enumerate(zip(amounts, rates, tenures)):
+                if name == "home_renovation_emi_calculator":
+                    expected = calculator(amount, rate, tenure, property_value=amount * 2)
+                else:
+                    expected = calculator(amount, rate, tenure)
+                for column in ("emi", "total_payment", "total_interest", "processing_fee", "total_cost"):
+                    if column in expected:
+                        assert abs(result[column][index] - expected[column]) < 0.01, (backend, name, column)
+        print(f"  ✅ {backend} backend matches the single-loan calculators")
+
+
+def test_batch_broadcasting():
+    """Test scalar broadcasting, grids, interest-free loans and bad inputs"""
+    print("\n=== Batch Broadcasting Tests ===\n")
+    
+    for backend in BATCH_BACKENDS:
+        result = batch_emi_calculator([100000, 200000], 12, 24, backend=backend)
+        assert list(result["annual_interest_rate"]) == [12, 12]
+        assert abs(result["emi"][1] - 2 * result["emi"][0]) < 1e-6
+        
+        grid = batch_emi_calculator([100000, 200000], [10, 12, 14], [12, 24], grid=True, backend=backend)
+        assert grid["count"] == 12
+        assert list(grid["loan_amount"][:6]) == [100000] * 6
+        assert list(grid["tenure_months"][:4]) == [12, 24, 12, 24]
+        
+        interest_free = batch_emi_calculator(120000, 0, 12, processing_fee_percent=0, backend=backend)
+        assert interest_free["emi"][0] == 10000 and interest_free["total_interest"][0] == 0
+        
+        for bad in ({"loan_amounts": [1, 2], "annual_interest_rates": [1, 2, 3], "tenure_months": 12},
+                    {"loan_amounts": 1000, "annual_interest_rates": 10, "tenure_months": 0}):
+            try:
+                batch_emi_calculator(backend=backend, **bad)
+                raise AssertionError("Expected ValueError")
+            except ValueError:
+                pass
+    
+    try:
+        batch_emi_calculator(1000, 10, 12, backend="no_such_backend")
+        raise AssertionError("Expected ValueError")
+    except ValueError as e:
+        print(f"  ✅ Rejected unknown backend: {e}")
+
+
+def test_batch_speed():
+    """Compare a batch offer grid with one calculator call per loan"""
+    print("\n=== Batch Speed ===\n")
+    
+    amounts = [50000 + 5000 * step for step in range(200)]
+    rates = [9.5 + 0.25 * step for step in range(10)]
+    tenures = [12, 24, 36, 48, 60]
+    
+    start = time.perf_counter()
+    result = batch_emi_calculator(amounts, rates, tenures, grid=True)
+    batch_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for amount in amounts:
+        for rate in rates:
+            for tenure in tenures:
+                finance_calculators.personal_loan_emi_calculator(amount, rate, tenure)
+    single_time = time.perf_counter() - start
+    print(f"  ⏱️ {result['count']} loans: batch ({result['backend']}) {batch_time * 1000:.1f} ms, "
+          f"single calls {single_time * 1000:.1f} ms")
+
+
+def main():
+    """Run all batch EMI tests"""
+    test_batch_matches_calculators()
+    test_batch_broadcasting()
+    test_batch_speed()
+    print("✅ All batch EMI tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
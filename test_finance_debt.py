@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for the debt payoff planner.
+Checks the closed-form phases against a month-by-month simulation and
+the plans of the debt-heavy personas' credit reports.
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from humsafar_financial_ai import (
+    Debt,
+    compare_payoff_strategies,
+    credit_card_interest_calculator,
+    credit_report_payoff_plan,
+    debt_payoff_plan,
+    debts_from_credit_report,
+    get_credit_report
+)
+
+
+def simulate_monthly(debts, monthly_budget, order):
+    """Reference plan: minimums first, then the rest of the budget in order"""
+    balances = [debt.balance for debt in debts]
+    payoff_months = [None] * len(debts)
+    total_interest = 0.0
+    month = 0
+    while any(balance > 0 for balance in balances):
+        month += 1
+        active = [i for i in order if balances[i] > 0]
+        available = monthly_budget
+        due = {}
+        for i in active:
+            accrued = balances[i] * debts[i].annual_interest_rate / 1200
+            total_interest += accrued
+            balances[i] += accrued
+            due[i] = min(debts[i].minimum_payment, balances[i])
+            available -= due[i]
+        for i in active:
+            extra = min(available, balances[i] - due[i])
+            due[i] += extra
+            available -= extra
+            balances[i] -= due[i]
+            if balances[i] <= 0.005:
+                balances[i] = 0
+                payoff_months[i] = month
+    return month, total_interest, payoff_months
+
+
+def test_plans_match_monthly_simulation():
+    """Test that stepping whole phases matches a month-by-month simulation"""
+    print("=== Debt Payoff Plan Tests ===\n")
+    
+    for phone_number in ("7777777777", "1414141414"):
+        debts = debts_from_credit_report(get_credit_report(phone_number))
+        minimums = sum(debt.minimum_payment for debt in debts)
+        for budget in (minimums, minimums + 20000):
+            for strategy in ("avalanche", "snowball"):
+                plan = debt_payoff_plan(debts, budget, strategy)
+                if strategy == "avalanche":
+                    order = sorted(range(len(debts)), key=lambda i: -debts[i].annual_interest_rate)
+                else:
+                    order = sorted(range(len(debts)), key=lambda i: debts[i].balance)
+                months, interest, payoff_months = simulate_monthly(debts, budget, order)
+                assert plan["payoff_months"] == months
+                assert abs(plan["total_interest_paid"] - interest) < 0.5
+                assert [debt["payoff_month"] for debt in plan["debts"]] == payoff_months
+                assert len(plan["phases"]) <= len(debts)
+            print(f"  ✅ {phone_number}: {len(debts)} debts, budget ₹{budget:,.0f} -> {months} months")
+    
+    # One card at its minimum is the credit card calculator
+    card = credit_card_interest_calculator(100000, 36)
+    plan = debt_payoff_plan([Debt("Card", 100000, 36, card["minimum_payment"])])
+    assert plan["payoff_months"] == card["payoff_months"]
+    assert abs(plan["total_interest_paid"] - card["total_interest_paid"]) < 0.01
+
+
+def test_credit_report_debts():
+    """Test debts read from the credit reports and the strategy comparison"""
+    print("\n=== Credit Report Debt Tests ===\n")
+    
+    debts = debts_from_credit_report(get_credit_report("1414141414"))
+    assert len(debts) == 6
+    cards = [debt for debt in debts if debt.account_type == "10"]
+    assert [card.minimum_payment for card in cards] == [6750, 4600, 2250]
+    home_loan = debts[0]
+    assert home_loan.name == "State Bank of India" and abs(home_loan.minimum_payment - 35348.43) < 0.01
+    
+    plan = credit_report_payoff_plan("7777777777", monthly_budget=40000)
+    assert plan["payoff_order"][0] == "Axis Bank" and plan["extra_payment"] > 0
+    custom = credit_report_payoff_plan("7777777777", monthly_budget=40000, strategy="custom",
+                                       order=["HDFC Bank", "Bajaj Finserv", "Axis Bank"])
+    assert custom["total_interest_paid"] > plan["total_interest_paid"]
+    assert credit_report_payoff_plan("1111111111")["payoff_months"] == 0
+    assert credit_report_payoff_plan("0000000000") is None
+    
+    comparison = compare_payoff_strategies(debts, monthly_budget=100000)
+    assert comparison["interest_saved_with_avalanche"] >= 0
+    print(f"  ✅ Avalanche saves ₹{comparison['interest_saved_with_avalanche']:,.2f}: "
+          f"{comparison['recommendation']}")
+    
+    start = time.perf_counter()
+    for _ in range(1000):
+        debt_payoff_plan(debts, 100000)
+    print(f"  ⏱️ 1000 six-debt plans in {(time.perf_counter() - start) * 1000:.1f} ms")
+    
+    for kwargs in ({"monthly_budget": 1000},
+                   {"strategy": "fastest"},
+                   {"strategy": "custom"},
+                   {"strategy": "custom", "order": ["ICICI Bank"]}):
+        try:
+            debt_payoff_plan(debts, **kwargs)
+            raise AssertionError("Expected ValueError")
+        except ValueError as e:
+            print(f"  ❌ {e}")
+    try:
+        debt_payoff_plan([Debt("Card", 100000, 36, 2000)])
+        raise AssertionError("Expected ValueError")
+    except ValueError:
+        pass
+
+
+def main():
+    """Run all debt payoff tests"""
+    test_plans_match_monthly_simulation()
+    test_credit_report_debts()
+    print("✅ All debt payoff tests completed successfully!")
+
+
+if __name__ == "__main__":
+    main()